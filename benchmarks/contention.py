@@ -0,0 +1,39 @@
+import threading
+import time
+
+from object_model import SynchronizedObservableList
+
+OPERATIONS = 20_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def measure(thread_count: int) -> float:
+    collection = SynchronizedObservableList()
+    collection.collection_changed += lambda sender, e: None
+    per_thread = OPERATIONS // thread_count
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for i in range(per_thread):
+            collection.append(i)
+            collection[-1] = i
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_thread * thread_count * 2 / (time.perf_counter() - started)
+
+
+def main() -> None:
+    print(f"{'threads':>8}{'ops/s':>14}")
+    for thread_count in THREAD_COUNTS:
+        print(f"{thread_count:>8}{measure(thread_count):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import argparse
+import json
+import platform
+import sys
+from collections import deque
+from importlib.metadata import PackageNotFoundError, version
+from timeit import Timer
+
+from object_model import ObservableDeque, ObservableDict, ObservableList, ObservableSet
+
+HANDLER_COUNTS = (0, 1, 10)
+
+
+def _case(operation: str, statement: str, builtin_statement: str | None = ""):
+    if builtin_statement == "":
+        builtin_statement = statement
+    return operation, statement, builtin_statement
+
+
+# builtin_statement is None where the builtin has no equivalent operation.
+LIST_CASES = [
+    _case("append+pop", "c.append(0); c.pop()"),
+    _case("insert+pop(0)", "c.insert(0, 0); c.pop(0)"),
+    _case("extend+del[-10:]", "c.extend(items); del c[-10:]"),
+    _case("setitem", "c[0] = 0"),
+    _case("setitem[:10]", "c[:10] = items"),
+    _case("delitem+append", "del c[0]; c.append(0)"),
+    _case("remove+append", "c.remove(0); c.append(0)"),
+    _case("move", "c.move(0, -1)", "c.append(c.pop(0))"),
+    _case("move_range", "c.move_range(0, 2, len(c) - 2)", None),
+    _case(
+        "insert_range+remove_range",
+        "c.insert_range(0, items); c.remove_range(0, 10)",
+        "c[0:0] = items; del c[0:10]",
+    ),
+    _case("iadd+del[-10:]", "c += items; del c[-10:]"),
+    _case("clear+extend", "c.clear(); c.extend(items)"),
+]
+DEQUE_CASES = [
+    _case("append+pop", "c.append(0); c.pop()"),
+    _case("appendleft+popleft", "c.appendleft(0); c.popleft()"),
+    _case("extend+pop", "c.extend((0,)); c.pop()"),
+    _case("extendleft+popleft", "c.extendleft((0,)); c.popleft()"),
+    _case("insert+delitem", "c.insert(1, 0); del c[1]"),
+    _case("setitem", "c[0] = 0"),
+    _case("remove+appendleft", "c.remove(0); c.appendleft(0)"),
+    _case("move", "c.move(0, -1)", "c.append(c.popleft())"),
+    _case("clear+extend", "c.clear(); c.extend(items)"),
+]
+DICT_CASES = [
+    _case("setitem(add)+pop", "c[-1] = 0; c.pop(-1)"),
+    _case("setitem(replace)", "c[0] = 0"),
+    _case("setitem+delitem", "c[-1] = 0; del c[-1]"),
+    _case("update", "c.update(mapping)"),
+    _case("popitem+setitem", "k, v = c.popitem(); c[k] = v"),
+    _case("clear+update", "c.clear(); c.update(mapping)"),
+]
+SET_CASES = [
+    _case("add+remove", "c.add(-1); c.remove(-1)"),
+    _case("add(existing)", "c.add(0)"),
+    _case("add+discard", "c.add(-1); c.discard(-1)"),
+    _case("pop+add", "c.add(c.pop())"),
+    _case("update+difference_update", "c.update(items); c.difference_update(items)"),
+    _case("intersection_update", "c.intersection_update(c)"),
+    _case("clear+update", "c.clear(); c.update(items)"),
+]
+SUITES = [
+    ("list", list, ObservableList, LIST_CASES),
+    ("deque", deque, ObservableDeque, DEQUE_CASES),
+    ("dict", dict, ObservableDict, DICT_CASES),
+    ("set", set, ObservableSet, SET_CASES),
+]
+
+
+def _handler(sender, e) -> None:
+    pass
+
+
+def _factory(builtin: type, observable: type | None, size: int, handlers: int):
+    def factory():
+        if builtin is dict:
+            collection = (observable or dict)((i, i) for i in range(size))
+        else:
+            collection = (observable or builtin)(range(size))
+        for _ in range(handlers):
+            collection.collection_changed += _handler
+        return collection
+
+    return factory
+
+
+def measure(factory, statement: str, number: int, repeat: int) -> float:
+    namespace = {
+        "factory": factory,
+        "items": list(range(-10, 0)),
+        "mapping": {i: i for i in range(-10, 0)},
+    }
+    timer = Timer(statement, "c = factory()", globals=namespace)
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(sizes: list[int], number: int, repeat: int) -> list[dict]:
+    results = []
+    for name, builtin, observable, cases in SUITES:
+        for size in sizes:
+            for operation, statement, builtin_statement in cases:
+                builtin_ns = (
+                    measure(
+                        _factory(builtin, None, size, 0),
+                        builtin_statement,
+                        number,
+                        repeat,
+                    )
+                    if builtin_statement is not None
+                    else None
+                )
+                for handlers in HANDLER_COUNTS:
+                    ns = measure(
+                        _factory(builtin, observable, size, handlers),
+                        statement,
+                        number,
+                        repeat,
+                    )
+                    results.append(
+                        {
+                            "collection": name,
+                            "operation": operation,
+                            "size": size,
+                            "handlers": handlers,
+                            "ns_per_op": round(ns, 1),
+                            "builtin_ns_per_op": (
+                                None if builtin_ns is None else round(builtin_ns, 1)
+                            ),
+                        }
+                    )
+                    print(_format(results[-1]), file=sys.stderr)
+    return results
+
+
+def _format(result: dict) -> str:
+    builtin_ns = result["builtin_ns_per_op"]
+    ratio = "" if builtin_ns is None else f"{result['ns_per_op'] / builtin_ns:8.2f}x"
+    return (
+        f"{result['collection']:<6}{result['operation']:<28}"
+        f"{result['size']:>8}{result['handlers']:>4}"
+        f"{result['ns_per_op']:>12.1f} ns{ratio}"
+    )
+
+
+def _package_version() -> str | None:
+    try:
+        return version("object-model")
+    except PackageNotFoundError:
+        return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark observable collections against the builtins.",
+    )
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("--sizes", type=int, nargs="+")
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="small sizes and few repetitions"
+    )
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.number, args.repeat = 200, 2
+    if args.sizes is None:
+        args.sizes = [10, 1_000] if args.quick else [10, 1_000, 100_000]
+    report = {
+        "package_version": _package_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "number": args.number,
+        "repeat": args.repeat,
+        "results": run(args.sizes, args.number, args.repeat),
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
@@ -0,0 +1,40 @@
+from collections import deque
+from timeit import Timer
+
+from object_model import ObservableDeque, ObservableDict, ObservableList, ObservableSet
+
+NUMBER = 200_000
+REPEAT = 5
+
+CASES = [
+    ("append", list, ObservableList, "c.append(1)"),
+    ("setitem", list, ObservableList, "c[0] = 1"),
+    ("append", deque, ObservableDeque, "c.append(1)"),
+    ("setitem", dict, ObservableDict, "c[1] = 1"),
+    ("add", set, ObservableSet, "c.add(1)"),
+]
+
+
+def measure(factory: type, statement: str) -> float:
+    timer = Timer(statement, "c = factory([0])", globals={"factory": factory})
+    return min(timer.repeat(REPEAT, NUMBER)) / NUMBER * 1e9
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'builtin ns':>12}{'observable ns':>16}{'ratio':>8}")
+    for name, builtin, observable, statement in CASES:
+        if builtin is dict:
+            builtin_ns = measure(lambda _: {0: 0}, statement)
+            observable_ns = measure(lambda _: ObservableDict({0: 0}), statement)
+        else:
+            builtin_ns = measure(builtin, statement)
+            observable_ns = measure(observable, statement)
+        print(
+            f"{builtin.__name__ + '.' + name:<24}"
+            f"{builtin_ns:>12.1f}{observable_ns:>16.1f}"
+            f"{observable_ns / builtin_ns:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
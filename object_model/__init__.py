@@ -1,5 +1,48 @@
-from .event import Event, EventArgs
+from .aggregates import Count, GroupBy, Max, Min, Sum, ValueChangedEventArgs
+from .async_event import AsyncEvent, Backpressure
+from .codec import (
+    BytesCodec,
+    ChangeEventCodec,
+    FloatCodec,
+    IntCodec,
+    PickleCodec,
+    StrCodec,
+)
+from .deep import DeepChangedEventArgs, DeepObserver
+from .dispatchers import ExecutorDispatcher, InlineDispatcher, ThreadDispatcher
+from .event import Event, EventArgs, Subscription
+from .indexes import CollectionIndex
+from .journal import ChangeJournal, JournalRecord
+from .notify_collection_changed import NotifyCollectionChangedEventArgs
 from .observable_deque import NotifyDequeChangedEventArgs, ObservableDeque
 from .observable_dict import NotifyDictChangedEventArgs, ObservableDict
 from .observable_list import NotifyListChangedEventArgs, ObservableList
+from .observable_object import ObservableObject, PropertyChangedEventArgs
 from .observable_set import NotifySetChangedEventArgs, ObservableSet
+from .operators import (
+    CoalescedEvent,
+    DebouncedEvent,
+    ThrottledEvent,
+    coalesce,
+    debounce,
+    throttle,
+)
+from .schedulers import (
+    AsyncioScheduler,
+    ThreadingScheduler,
+    TimerHandle,
+    VirtualScheduler,
+)
+from .shared_observable_list import SharedObservableList
+from .synchronized import (
+    SynchronizedObservableDeque,
+    SynchronizedObservableDict,
+    SynchronizedObservableList,
+    SynchronizedObservableSet,
+)
+from .views import FilteredView, MappedView, SortedView
+
+try:
+    from .observable_array import ObservableArray
+except ImportError:  # numpy is an optional dependency
+    pass
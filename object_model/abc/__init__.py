@@ -1,6 +1,6 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from enum import Enum
-from typing import Protocol, Callable
+from typing import Any, Protocol, Callable
 
 
 class NotifyCollectionChangedAction(Enum):
@@ -15,6 +15,11 @@ class EventArgs:
     pass
 
 
+class SubscriptionProtocol(Protocol):
+    def dispose(self) -> None:
+        pass
+
+
 class EventProtocol[_T](Protocol):
     def __iadd__(self, handler: Callable[[_T, EventArgs], None]) -> "EventProtocol[_T]":
         pass
@@ -25,11 +30,59 @@ class EventProtocol[_T](Protocol):
     def __call__(self, sender: _T, e: EventArgs) -> None:
         pass
 
+    def __bool__(self) -> bool:
+        pass
+
     def __iter__(self) -> Generator[Callable[[_T, EventArgs], None]]:
         pass
 
-    def add(self, handler: Callable[[_T, EventArgs], None]) -> None:
+    def add(
+        self,
+        handler: Callable[[_T, EventArgs], None],
+        *,
+        weak: bool = False,
+        actions: Iterable[Any] | None = None,
+    ) -> "SubscriptionProtocol":
         pass
 
     def remove(self, handler: Callable[[_T, EventArgs], None]) -> None:
         pass
+
+    def handles(self, action: Any) -> bool:
+        pass
+
+
+class DispatcherProtocol(Protocol):
+    def dispatch[_T](
+        self,
+        handlers: tuple[Callable[[_T, EventArgs], None], ...],
+        sender: _T,
+        e: EventArgs,
+    ) -> None:
+        pass
+
+    def join(self, timeout: float | None = None) -> bool:
+        pass
+
+
+class TimerHandleProtocol(Protocol):
+    def cancel(self) -> None:
+        pass
+
+
+class SchedulerProtocol(Protocol):
+    def now(self) -> float:
+        pass
+
+    def call_later(
+        self, delay: float, callback: Callable[[], None]
+    ) -> TimerHandleProtocol:
+        pass
+
+
+class ItemCodecProtocol(Protocol):
+    def encode(self, value: object, buffer: bytearray) -> None:
+        pass
+
+    def decode(self, view: memoryview, offset: int) -> tuple[object, int]:
+        pass
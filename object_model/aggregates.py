@@ -0,0 +1,294 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from heapq import heapify, heappop, heappush
+from math import fsum, isfinite
+from types import MappingProxyType
+from typing import Any
+
+from object_model.abc import EventArgs, EventProtocol, NotifyCollectionChangedAction
+from object_model.event import Event
+from object_model.notify_collection_changed import sequence_splice
+from object_model.ordering import Descending
+
+
+class ValueChangedEventArgs(EventArgs):
+    __slots__ = ["__old_value", "__new_value", "__key"]
+
+    def __init__(self, old_value: Any, new_value: Any, *, key: Any = None) -> None:
+        self.__old_value = old_value
+        self.__new_value = new_value
+        self.__key = key
+
+    @property
+    def old_value(self) -> Any:
+        return self.__old_value
+
+    @property
+    def new_value(self) -> Any:
+        return self.__new_value
+
+    @property
+    def key(self) -> Any:
+        return self.__key
+
+
+class _Aggregate(ABC):
+    def __init__(self, source) -> None:
+        self.value_changed: EventProtocol[_Aggregate] = Event()
+        self.__source = source
+        self._reset(_values(source))
+        source.collection_changed += self.__on_source_changed
+
+    @property
+    def source(self):
+        return self.__source
+
+    @property
+    @abstractmethod
+    def value(self) -> Any:
+        pass
+
+    def close(self) -> None:
+        self.__source.collection_changed -= self.__on_source_changed
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value!r})"
+
+    @abstractmethod
+    def _reset(self, __values: Iterable) -> None:
+        pass
+
+    @abstractmethod
+    def _update(self, __removed: list, __added: list) -> None:
+        pass
+
+    def _notify(self, __old_value: Any, __new_value: Any, key: Any = None) -> None:
+        if self.value_changed and __old_value != __new_value:
+            self.value_changed(
+                self, ValueChangedEventArgs(__old_value, __new_value, key=key)
+            )
+
+    def __on_source_changed(self, sender, e: EventArgs) -> None:
+        old_value = self.value
+        changes = _changes(sender, e)
+        if changes is None:
+            self._reset(_values(sender))
+        else:
+            self._update(*changes)
+        self._notify(old_value, self.value)
+
+
+class Count(_Aggregate):
+    def __init__(self, source, predicate: Callable[[Any], Any] | None = None) -> None:
+        self.__predicate = predicate
+        self.__count = 0
+        super().__init__(source)
+
+    @property
+    def value(self) -> int:
+        return self.__count
+
+    def _reset(self, __values: Iterable) -> None:
+        if self.__predicate is None:
+            self.__count = sum(1 for _ in __values)
+        else:
+            self.__count = sum(1 for value in __values if self.__predicate(value))
+
+    def _update(self, __removed: list, __added: list) -> None:
+        if self.__predicate is None:
+            self.__count += len(__added) - len(__removed)
+        else:
+            predicate = self.__predicate
+            self.__count += sum(1 for value in __added if predicate(value))
+            self.__count -= sum(1 for value in __removed if predicate(value))
+
+
+class Sum(_Aggregate):
+    def __init__(self, source, selector: Callable[[Any], Any] | None = None) -> None:
+        self.__selector = selector
+        # Floats are kept as exact partial sums, as in math.fsum, so removing
+        # one never loses the low-order bits of the values that remain; other
+        # numbers are summed as they are.
+        self.__exact = 0
+        self.__partials: list[float] = []
+        self.__nonfinite: list[float] = []
+        self.__floats = 0
+        self.__sum = 0
+        super().__init__(source)
+
+    @property
+    def value(self) -> Any:
+        return self.__sum
+
+    def _reset(self, __values: Iterable) -> None:
+        self.__exact = 0
+        self.__partials = []
+        self.__nonfinite = []
+        self.__floats = 0
+        self._update([], __values)
+
+    def _update(self, __removed: Iterable, __added: Iterable) -> None:
+        if self.__selector is not None:
+            __removed = map(self.__selector, __removed)
+            __added = map(self.__selector, __added)
+        for value in __removed:
+            self.__add(value, -1)
+        for value in __added:
+            self.__add(value, 1)
+        if not self.__floats:
+            self.__sum = self.__exact
+        else:
+            self.__sum = self.__exact + fsum(self.__partials) + sum(self.__nonfinite)
+
+    def __add(self, __value: Any, __sign: int) -> None:
+        if not isinstance(__value, float):
+            self.__exact += __value if __sign > 0 else -__value
+            return
+        self.__floats += __sign
+        if not isfinite(__value):
+            nonfinite = self.__nonfinite
+            if __sign > 0:
+                nonfinite.append(__value)
+            elif __value == __value:
+                nonfinite.remove(__value)
+            else:
+                nonfinite.remove(next(x for x in nonfinite if x != x))
+            return
+        # Shewchuk's algorithm: the partials stay non-overlapping and their
+        # exact sum is the exact sum of the floats added so far.
+        partials = self.__partials
+        x = __value if __sign > 0 else -__value
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            high = x + y
+            low = y - (high - x)
+            if low:
+                partials[i] = low
+                i += 1
+            x = high
+        partials[i:] = [x] if x else []
+
+
+class Min(_Aggregate):
+    def __init__(self, source, selector: Callable[[Any], Any] | None = None) -> None:
+        self.__selector = selector
+        # Counts of the live values, and a heap that may still hold values
+        # whose count has dropped to zero; those are discarded lazily when
+        # they reach the top.
+        self.__live: Counter = Counter()
+        self.__heap: list = []
+        super().__init__(source)
+
+    @property
+    def value(self) -> Any:
+        heap = self.__heap
+        live = self.__live
+        while heap and self._unwrap(heap[0]) not in live:
+            heappop(heap)
+        return self._unwrap(heap[0]) if heap else None
+
+    def _wrap(self, __value: Any) -> Any:
+        return __value
+
+    def _unwrap(self, __value: Any) -> Any:
+        return __value
+
+    def _reset(self, __values: Iterable) -> None:
+        if self.__selector is not None:
+            __values = map(self.__selector, __values)
+        self.__live = Counter(__values)
+        self.__heap = list(map(self._wrap, self.__live))
+        heapify(self.__heap)
+
+    def _update(self, __removed: list, __added: list) -> None:
+        if self.__selector is not None:
+            __removed = map(self.__selector, __removed)
+            __added = map(self.__selector, __added)
+        live = self.__live
+        for value in __removed:
+            count = live[value] - 1
+            if count:
+                live[value] = count
+            else:
+                del live[value]
+        for value in __added:
+            if value not in live:
+                heappush(self.__heap, self._wrap(value))
+            live[value] += 1
+        if len(self.__heap) > 2 * len(live) + 16:
+            self.__heap = list(map(self._wrap, live))
+            heapify(self.__heap)
+
+
+class Max(Min):
+    def _wrap(self, __value: Any) -> Any:
+        return Descending(__value)
+
+    def _unwrap(self, __value: Any) -> Any:
+        return __value.value
+
+
+class GroupBy(_Aggregate):
+    def __init__(self, source, key: Callable[[Any], Any]) -> None:
+        self.__key = key
+        self.__groups: dict[Any, int] = {}
+        self.__value = MappingProxyType(self.__groups)
+        super().__init__(source)
+
+    @property
+    def value(self) -> Mapping[Any, int]:
+        return self.__value
+
+    def _reset(self, __values: Iterable) -> None:
+        old_groups = dict(self.__groups)
+        self.__groups.clear()
+        self.__groups.update(Counter(map(self.__key, __values)))
+        if self.value_changed:
+            for group in old_groups.keys() | self.__groups.keys():
+                self._notify(
+                    old_groups.get(group, 0), self.__groups.get(group, 0), group
+                )
+
+    def _update(self, __removed: list, __added: list) -> None:
+        groups = self.__groups
+        delta = Counter(map(self.__key, __added))
+        delta.subtract(map(self.__key, __removed))
+        for group, change in delta.items():
+            if not change:
+                continue
+            old_count = groups.get(group, 0)
+            new_count = old_count + change
+            if new_count:
+                groups[group] = new_count
+            else:
+                del groups[group]
+            self._notify(old_count, new_count, group)
+
+
+def _values(source) -> Iterable:
+    return source.values() if isinstance(source, dict) else source
+
+
+def _changes(sender, e: EventArgs) -> tuple[list, list] | None:
+    action = e.action
+    if (
+        action == NotifyCollectionChangedAction.RESET
+        or getattr(sender, "maxlen", None) is not None
+    ):
+        return None
+    if isinstance(sender, dict):
+        if e.new_count is not None:
+            return list(e.old_items.values()), list(e.new_items.values())
+    elif isinstance(sender, set):
+        if action == NotifyCollectionChangedAction.ADD:
+            items = e.new_items
+            return [], list(items) if isinstance(items, set) else [items]
+        items = e.old_items
+        return list(items) if isinstance(items, set) else [items], []
+    elif action == NotifyCollectionChangedAction.MOVE:
+        return [], []
+    _, removed, added = sequence_splice(e)
+    return removed, added
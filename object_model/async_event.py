@@ -0,0 +1,186 @@
+import asyncio
+import inspect
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from enum import Enum
+from typing import Any, Self
+
+from object_model.abc import EventArgs, EventProtocol, NotifyCollectionChangedAction
+from object_model.event import Event, Subscription
+
+
+class Backpressure(Enum):
+    BLOCK = 0
+    DROP_OLDEST = 1
+    COALESCE = 2
+
+
+def _reset_coalescer[_T](sender: _T, changes: list[EventArgs]) -> EventArgs:
+    return type(changes[-1])(NotifyCollectionChangedAction.RESET)
+
+
+class AsyncEvent[_T](EventProtocol[_T]):
+    __slots__ = [
+        "__event_handlers",
+        "__queue",
+        "__backpressure",
+        "__coalescer",
+        "__loop",
+        "__dispatcher",
+    ]
+
+    def __init__(  # noqa
+        self,
+        maxsize: int = 0,
+        backpressure: Backpressure = Backpressure.BLOCK,
+        coalescer: Callable[[_T, list[EventArgs]], EventArgs] = _reset_coalescer,
+    ) -> None:
+        # Subscriptions are kept by a plain Event, which is never called; fire
+        # awaits whatever the handlers return.
+        self.__event_handlers: Event[_T] = Event()
+        self.__queue: asyncio.Queue[tuple[_T, EventArgs]] = asyncio.Queue(maxsize)
+        self.__backpressure = backpressure
+        self.__coalescer = coalescer
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__dispatcher: asyncio.Task | None = None
+
+    def __iadd__(
+        self, handler: Callable[[_T, EventArgs], Awaitable[None] | None]
+    ) -> "AsyncEvent[_T]":
+        self.add(handler)
+        return self
+
+    def __isub__(
+        self, handler: Callable[[_T, EventArgs], Awaitable[None] | None]
+    ) -> "AsyncEvent[_T]":
+        self.remove(handler)
+        return self
+
+    def __call__(self, sender: _T, e: EventArgs) -> None:
+        loop = self.__loop
+        if loop is None or loop.is_closed() or self.__is_running_in(loop):
+            self.__enqueue(sender, e)
+        elif self.__backpressure == Backpressure.BLOCK:
+            asyncio.run_coroutine_threadsafe(
+                self.__queue.put((sender, e)), loop
+            ).result()
+        else:
+            loop.call_soon_threadsafe(self.__enqueue, sender, e)
+
+    def __bool__(self) -> bool:
+        return bool(self.__event_handlers)
+
+    def __iter__(
+        self,
+    ) -> Generator[Callable[[_T, EventArgs], Awaitable[None] | None]]:
+        yield from self.__event_handlers
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def add(
+        self,
+        handler: Callable[[_T, EventArgs], Awaitable[None] | None],
+        *,
+        weak: bool = False,
+        actions: Iterable[Any] | None = None,
+    ) -> Subscription:
+        return self.__event_handlers.add(handler, weak=weak, actions=actions)
+
+    def remove(
+        self, handler: Callable[[_T, EventArgs], Awaitable[None] | None]
+    ) -> None:
+        self.__event_handlers.remove(handler)
+
+    def handles(self, action: Any) -> bool:
+        return self.__event_handlers.handles(action)
+
+    async def fire(self, sender: _T, e: EventArgs) -> None:
+        awaitables = []
+        for handler in self.__event_handlers.handlers(getattr(e, "action", None)):
+            result = handler(sender, e)
+            if inspect.isawaitable(result):
+                awaitables.append(result)
+        if awaitables:
+            await asyncio.gather(*awaitables)
+
+    def start(self) -> None:
+        if self.__dispatcher is None or self.__dispatcher.done():
+            self.__loop = asyncio.get_running_loop()
+            self.__dispatcher = self.__loop.create_task(self.__dispatch())
+
+    async def join(self) -> None:
+        await self.__queue.join()
+
+    async def aclose(self) -> None:
+        if self.__dispatcher is None:
+            return
+        await self.join()
+        self.__dispatcher.cancel()
+        try:
+            await self.__dispatcher
+        except asyncio.CancelledError:
+            pass
+        self.__dispatcher = None
+
+    async def __dispatch(self) -> None:
+        while True:
+            sender, e = await self.__queue.get()
+            try:
+                await self.fire(sender, e)
+            except Exception as exc:
+                self.__loop.call_exception_handler(
+                    {
+                        "message": "Unhandled exception in AsyncEvent handler",
+                        "exception": exc,
+                    }
+                )
+            finally:
+                self.__queue.task_done()
+
+    def __enqueue(self, sender: _T, e: EventArgs) -> None:
+        queue = self.__queue
+        if not queue.full():
+            queue.put_nowait((sender, e))
+        elif self.__backpressure == Backpressure.BLOCK:
+            raise asyncio.QueueFull(
+                "AsyncEvent queue is full; use a foreign thread or another policy"
+            )
+        elif self.__backpressure == Backpressure.DROP_OLDEST:
+            self.__take()
+            queue.put_nowait((sender, e))
+        else:
+            self.__coalesce(sender, e)
+
+    def __coalesce(self, sender: _T, e: EventArgs) -> None:
+        changes: dict[int, tuple[_T, list[EventArgs]]] = {}
+        while not self.__queue.empty():
+            pending_sender, pending_e = self.__take()
+            changes.setdefault(id(pending_sender), (pending_sender, []))[1].append(
+                pending_e
+            )
+        changes.setdefault(id(sender), (sender, []))[1].append(e)
+        for pending_sender, pending_changes in changes.values():
+            if self.__queue.full():
+                self.__take()
+            coalesced = (
+                pending_changes[0]
+                if len(pending_changes) == 1
+                else self.__coalescer(pending_sender, pending_changes)
+            )
+            self.__queue.put_nowait((pending_sender, coalesced))
+
+    def __take(self) -> tuple[_T, EventArgs]:
+        item = self.__queue.get_nowait()
+        self.__queue.task_done()
+        return item
+
+    @staticmethod
+    def __is_running_in(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
@@ -0,0 +1,281 @@
+import pickle
+from collections.abc import Iterable, Iterator
+from operator import index
+from struct import Struct, error as struct_error
+
+from object_model.abc import (
+    EventArgs,
+    ItemCodecProtocol,
+    NotifyCollectionChangedAction,
+)
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
+
+# Frame header, two bytes:
+#   0: action (bits 0-2), new items shape (bits 3-5), new index (6), old index (7)
+#   1: old items shape (bits 0-2), new count (3), old count (4), key (5)
+# followed by the present fields in header order. Indices are zigzag varints,
+# counts and collection lengths are varints.
+_NONE, _SCALAR, _SEQUENCE, _MAPPING, _SET = range(5)
+_NEW_INDEX = 0x40
+_OLD_INDEX = 0x80
+_NEW_COUNT = 0x08
+_OLD_COUNT = 0x10
+_KEY = 0x20
+_ACTIONS = tuple(NotifyCollectionChangedAction)
+_DOUBLE = Struct("<d")
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def _write_zigzag(buffer: bytearray, value: int) -> None:
+    _write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _read_zigzag(view: memoryview, offset: int) -> tuple[int, int]:
+    value, offset = _read_varint(view, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+class PickleCodec:
+    __slots__ = ["__protocol"]
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        self.__protocol = protocol
+
+    def encode(self, value: object, buffer: bytearray) -> None:
+        data = pickle.dumps(value, self.__protocol)
+        _write_varint(buffer, len(data))
+        buffer += data
+
+    def decode(self, view: memoryview, offset: int) -> tuple[object, int]:
+        size, offset = _read_varint(view, offset)
+        end = offset + size
+        if end > len(view):
+            raise IndexError("item extends past the end of the buffer")
+        return pickle.loads(view[offset:end]), end
+
+
+class IntCodec:
+    __slots__ = []
+
+    def encode(self, value: int, buffer: bytearray) -> None:
+        _write_zigzag(buffer, index(value))
+
+    def decode(self, view: memoryview, offset: int) -> tuple[int, int]:
+        return _read_zigzag(view, offset)
+
+
+class FloatCodec:
+    __slots__ = []
+
+    def encode(self, value: float, buffer: bytearray) -> None:
+        buffer += _DOUBLE.pack(value)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[float, int]:
+        return _DOUBLE.unpack_from(view, offset)[0], offset + _DOUBLE.size
+
+
+class BytesCodec:
+    __slots__ = []
+
+    def encode(self, value: bytes, buffer: bytearray) -> None:
+        _write_varint(buffer, len(value))
+        buffer += value
+
+    def decode(self, view: memoryview, offset: int) -> tuple[bytes, int]:
+        size, offset = _read_varint(view, offset)
+        end = offset + size
+        if end > len(view):
+            raise IndexError("item extends past the end of the buffer")
+        return view[offset:end].tobytes(), end
+
+
+class StrCodec:
+    __slots__ = []
+
+    def encode(self, value: str, buffer: bytearray) -> None:
+        data = value.encode()
+        _write_varint(buffer, len(data))
+        buffer += data
+
+    def decode(self, view: memoryview, offset: int) -> tuple[str, int]:
+        size, offset = _read_varint(view, offset)
+        end = offset + size
+        if end > len(view):
+            raise IndexError("item extends past the end of the buffer")
+        return str(view[offset:end], "utf-8"), end
+
+
+class ChangeEventCodec:
+    __slots__ = ["__item_codec", "__key_codec"]
+
+    def __init__(
+        self,
+        item_codec: ItemCodecProtocol | None = None,
+        key_codec: ItemCodecProtocol | None = None,
+    ) -> None:
+        self.__item_codec = PickleCodec() if item_codec is None else item_codec
+        self.__key_codec = self.__item_codec if key_codec is None else key_codec
+
+    def encode(self, e: EventArgs, buffer: bytearray | None = None) -> bytearray:
+        if buffer is None:
+            buffer = bytearray()
+        new_items, old_items = e.new_items, e.old_items
+        new_index, old_index = e.new_starting_index, e.old_starting_index
+        new_count, old_count, key = e.new_count, e.old_count, e.key
+        new_shape = _shape(new_items, new_count)
+        old_shape = _shape(old_items, old_count)
+        buffer.append(
+            _ACTIONS.index(e.action)
+            | new_shape << 3
+            | (0 if new_index is None else _NEW_INDEX)
+            | (0 if old_index is None else _OLD_INDEX)
+        )
+        buffer.append(
+            old_shape
+            | (0 if new_count is None else _NEW_COUNT)
+            | (0 if old_count is None else _OLD_COUNT)
+            | (0 if key is None else _KEY)
+        )
+        if new_index is not None:
+            _write_zigzag(buffer, index(new_index))
+        if old_index is not None:
+            _write_zigzag(buffer, index(old_index))
+        if new_count is not None:
+            _write_varint(buffer, new_count)
+        if old_count is not None:
+            _write_varint(buffer, old_count)
+        if key is not None:
+            self.__key_codec.encode(key, buffer)
+        self.__encode_items(new_shape, new_items, buffer)
+        self.__encode_items(old_shape, old_items, buffer)
+        return buffer
+
+    def encode_many(
+        self, events: Iterable[EventArgs], buffer: bytearray | None = None
+    ) -> bytearray:
+        if buffer is None:
+            buffer = bytearray()
+        for e in events:
+            self.encode(e, buffer)
+        return buffer
+
+    def decode(self, data: bytes | bytearray | memoryview) -> EventArgs:
+        view = memoryview(data)
+        e, offset = self.decode_from(view, 0)
+        if offset != len(view):
+            raise ValueError("trailing data after change event")
+        return e
+
+    def decode_many(self, data: bytes | bytearray | memoryview) -> Iterator[EventArgs]:
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            e, offset = self.decode_from(view, offset)
+            yield e
+
+    def decode_from(self, view: memoryview, offset: int) -> tuple[EventArgs, int]:
+        try:
+            return self.__decode(view, offset)
+        except (IndexError, struct_error):
+            raise ValueError("truncated change event") from None
+
+    def __decode(self, view: memoryview, offset: int) -> tuple[EventArgs, int]:
+        first, second = view[offset], view[offset + 1]
+        offset += 2
+        new_index = old_index = new_count = old_count = key = None
+        if first & _NEW_INDEX:
+            new_index, offset = _read_zigzag(view, offset)
+        if first & _OLD_INDEX:
+            old_index, offset = _read_zigzag(view, offset)
+        if second & _NEW_COUNT:
+            new_count, offset = _read_varint(view, offset)
+        if second & _OLD_COUNT:
+            old_count, offset = _read_varint(view, offset)
+        if second & _KEY:
+            key, offset = self.__key_codec.decode(view, offset)
+        new_items, offset = self.__decode_items(first >> 3 & 0x07, view, offset)
+        old_items, offset = self.__decode_items(second & 0x07, view, offset)
+        return (
+            NotifyCollectionChangedEventArgs(
+                _ACTIONS[first & 0x07],
+                new_items=new_items,
+                new_starting_index=new_index,
+                old_starting_index=old_index,
+                old_items=old_items,
+                new_count=new_count,
+                old_count=old_count,
+                key=key,
+            ),
+            offset,
+        )
+
+    def __encode_items(self, shape: int, items, buffer: bytearray) -> None:
+        if shape == _NONE:
+            return
+        encode = self.__item_codec.encode
+        if shape == _SCALAR:
+            encode(items, buffer)
+            return
+        _write_varint(buffer, len(items))
+        if shape == _MAPPING:
+            encode_key = self.__key_codec.encode
+            for key, value in items.items():
+                encode_key(key, buffer)
+                encode(value, buffer)
+        else:
+            for item in items:
+                encode(item, buffer)
+
+    def __decode_items(
+        self, shape: int, view: memoryview, offset: int
+    ) -> tuple[object, int]:
+        if shape == _NONE:
+            return None, offset
+        decode = self.__item_codec.decode
+        if shape == _SCALAR:
+            return decode(view, offset)
+        size, offset = _read_varint(view, offset)
+        if shape == _MAPPING:
+            decode_key = self.__key_codec.decode
+            items = {}
+            for _ in range(size):
+                key, offset = decode_key(view, offset)
+                items[key], offset = decode(view, offset)
+            return items, offset
+        items = []
+        for _ in range(size):
+            item, offset = decode(view, offset)
+            items.append(item)
+        if shape == _SET:
+            return set(items), offset
+        if shape != _SEQUENCE:
+            raise ValueError(f"unknown items shape {shape}")
+        return items, offset
+
+
+def _shape(items: object, count: int | None) -> int:
+    # Counts mark list and dict ranges; set elements can never be sets.
+    if items is None:
+        return _NONE
+    if count is not None:
+        return _MAPPING if isinstance(items, dict) else _SEQUENCE
+    if isinstance(items, set):
+        return _SET
+    return _SCALAR
@@ -0,0 +1,232 @@
+from collections.abc import Iterable
+from functools import partial
+from typing import Any
+
+from object_model.abc import (
+    EventArgs,
+    EventProtocol,
+    NotifyCollectionChangedAction,
+    SubscriptionProtocol,
+)
+from object_model.event import Event
+from object_model.notify_collection_changed import sequence_splice
+
+
+class DeepChangedEventArgs(EventArgs):
+    __slots__ = ["__path", "__args"]
+
+    def __init__(self, path: tuple, args: EventArgs) -> None:
+        self.__path = path
+        self.__args = args
+
+    @property
+    def path(self) -> tuple:
+        return self.__path
+
+    @property
+    def args(self) -> EventArgs:
+        return self.__args
+
+    @property
+    def action(self) -> NotifyCollectionChangedAction | None:
+        return getattr(self.__args, "action", None)
+
+
+class _Node:
+    __slots__ = ["collection", "parent", "key", "count", "children", "subscription"]
+
+    def __init__(self, collection: Any, parent: "_Node | None", key: Any) -> None:
+        self.collection = collection
+        self.parent = parent
+        # Where the node was last seen in its parent. List positions are
+        # shifted along with the changes that move them, but a collection that
+        # occurs more than once keeps only one, so this is checked before use.
+        self.key = key
+        # How many times the collection occurs in its parent.
+        self.count = 1
+        self.children: dict[int, _Node] = {}
+        self.subscription: SubscriptionProtocol | None = None
+
+
+class DeepObserver:
+    def __init__(self, root) -> None:
+        self.collection_changed: EventProtocol[Any] = Event()
+        self.__root = self.__attach(root, None, None)
+
+    @property
+    def root(self):
+        return self.__root.collection
+
+    def path(self, collection: Any) -> tuple | None:
+        # Searches the tree, so this costs O(tree size); changes get their
+        # path from the node they were raised on instead.
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if node.collection is collection:
+                return self.__path(node)
+            stack.extend(node.children.values())
+        return None
+
+    def close(self) -> None:
+        self.__detach(self.__root)
+
+    def __attach(self, collection: Any, parent: _Node | None, key: Any) -> _Node:
+        node = _Node(collection, parent, key)
+        node.subscription = collection.collection_changed.add(
+            partial(self.__on_changed, node)
+        )
+        for key, value in _items(collection):
+            self.__adopt(node, key, value)
+        return node
+
+    def __detach(self, node: _Node) -> None:
+        node.subscription.dispose()
+        for child in node.children.values():
+            self.__detach(child)
+        node.children.clear()
+
+    def __adopt(self, node: _Node, key: Any, value: Any) -> None:
+        if not hasattr(value, "collection_changed"):
+            return
+        child = node.children.get(id(value))
+        if child is None:
+            node.children[id(value)] = self.__attach(value, node, key)
+        else:
+            child.count += 1
+
+    def __release(self, node: _Node, value: Any) -> None:
+        child = node.children.get(id(value))
+        if child is None:
+            return
+        child.count -= 1
+        if not child.count:
+            del node.children[id(value)]
+            self.__detach(child)
+
+    def __rewire(self, node: _Node) -> None:
+        # Children still present keep their nodes, so a sort or a reset that
+        # reinserts the same collections does not rebuild their subtrees.
+        previous = node.children
+        children = node.children = {}
+        for key, value in _items(node.collection):
+            if not hasattr(value, "collection_changed"):
+                continue
+            child = children.get(id(value))
+            if child is not None:
+                child.count += 1
+                continue
+            child = previous.pop(id(value), None)
+            if child is None:
+                child = self.__attach(value, node, key)
+            else:
+                child.key = key
+                child.count = 1
+            children[id(value)] = child
+        for child in previous.values():
+            self.__detach(child)
+
+    def __on_changed(self, node: _Node, sender: Any, e: EventArgs) -> None:
+        if node.subscription.disposed:
+            return
+        delta = _delta(sender, e)
+        if delta is None:
+            self.__rewire(node)
+        else:
+            removed, added = delta
+            if not isinstance(sender, (dict, set, frozenset)):
+                _shift(node, e)
+            # Added first, so a collection that is replaced by itself keeps
+            # its subtree.
+            for key, value in added:
+                self.__adopt(node, key, value)
+            for value in removed:
+                self.__release(node, value)
+        if self.collection_changed.handles(getattr(e, "action", None)):
+            self.collection_changed(sender, DeepChangedEventArgs(self.__path(node), e))
+
+    def __path(self, node: _Node) -> tuple:
+        path = []
+        while node.parent is not None:
+            path.append(_locate(node))
+            node = node.parent
+        path.reverse()
+        return tuple(path)
+
+
+def _items(collection: Any) -> Iterable[tuple[Any, Any]]:
+    if isinstance(collection, dict):
+        return collection.items()
+    if isinstance(collection, (set, frozenset)):
+        return ((value, value) for value in collection)
+    return enumerate(collection)
+
+
+def _locate(node: _Node) -> Any:
+    parent = node.parent.collection
+    collection = node.collection
+    key = node.key
+    if isinstance(parent, (set, frozenset)):
+        return collection
+    if isinstance(parent, dict) or isinstance(key, int):
+        try:
+            if parent[key] is collection:
+                return key
+        except (IndexError, KeyError, TypeError):
+            pass
+    for key, value in _items(parent):
+        if value is collection:
+            node.key = key
+            return key
+    return node.key
+
+
+def _delta(sender: Any, e: EventArgs) -> tuple[list, list] | None:
+    action = e.action
+    if (
+        action == NotifyCollectionChangedAction.RESET
+        or getattr(sender, "maxlen", None) is not None
+    ):
+        return None
+    if action == NotifyCollectionChangedAction.MOVE:
+        return [], []
+    if isinstance(sender, dict):
+        if e.new_count is not None:
+            return list(e.old_items.values()), list(e.new_items.items())
+        removed = [] if action == NotifyCollectionChangedAction.ADD else [e.old_items]
+        if action == NotifyCollectionChangedAction.REMOVE:
+            return removed, []
+        return removed, [(e.key, e.new_items)]
+    if isinstance(sender, (set, frozenset)):
+        if action == NotifyCollectionChangedAction.ADD:
+            items = e.new_items
+            items = items if isinstance(items, (set, frozenset)) else [items]
+            return [], [(value, value) for value in items]
+        items = e.old_items
+        return list(items) if isinstance(items, (set, frozenset)) else [items], []
+    start, removed, added = sequence_splice(e)
+    return removed, list(enumerate(added, start))
+
+
+def _shift(node: _Node, e: EventArgs) -> None:
+    # Moves the position hints of the children a sequence change displaces, so
+    # paths are found without scanning the siblings.
+    if e.action == NotifyCollectionChangedAction.MOVE:
+        count = 1 if e.old_count is None else e.old_count
+        old, new = e.old_starting_index, e.new_starting_index
+        for child in node.children.values():
+            key = child.key
+            if old <= key < old + count:
+                child.key = key - old + new
+            elif old < new and old + count <= key < new + count:
+                child.key = key - count
+            elif new < old and new <= key < old:
+                child.key = key + count
+        return
+    start, removed, added = sequence_splice(e)
+    offset = len(added) - len(removed)
+    if offset:
+        stop = start + len(removed)
+        for child in node.children.values():
+            if child.key >= stop:
+                child.key += offset
@@ -0,0 +1,116 @@
+import logging
+import threading
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor
+from queue import SimpleQueue
+
+from object_model.abc import DispatcherProtocol, EventArgs
+
+logger = logging.getLogger(__name__)
+
+
+def _deliver[_T](
+    handlers: tuple[Callable[[_T, EventArgs], None], ...], sender: _T, e: EventArgs
+) -> None:
+    for handler in handlers:
+        try:
+            handler(sender, e)
+        except Exception:
+            logger.exception("Unhandled exception in event handler %r", handler)
+
+
+class InlineDispatcher(DispatcherProtocol):
+    __slots__ = []
+
+    def dispatch[_T](
+        self,
+        handlers: tuple[Callable[[_T, EventArgs], None], ...],
+        sender: _T,
+        e: EventArgs,
+    ) -> None:
+        for handler in handlers:
+            handler(sender, e)
+
+    def join(self, timeout: float | None = None) -> bool:
+        return True
+
+
+class _QueuedDispatcher(DispatcherProtocol):
+    __slots__ = ["__pending", "__idle", "__running"]
+
+    def __init__(self) -> None:
+        self.__pending: deque[tuple[tuple[Callable, ...], object, EventArgs]] = deque()
+        self.__idle = threading.Condition()
+        self.__running = False
+
+    def dispatch[_T](
+        self,
+        handlers: tuple[Callable[[_T, EventArgs], None], ...],
+        sender: _T,
+        e: EventArgs,
+    ) -> None:
+        with self.__idle:
+            self.__pending.append((handlers, sender, e))
+            if self.__running:
+                return
+            self.__running = True
+        self._schedule(self._drain)
+
+    def join(self, timeout: float | None = None) -> bool:
+        with self.__idle:
+            return self.__idle.wait_for(lambda: not self.__running, timeout)
+
+    @abstractmethod
+    def _schedule(self, drain: Callable[[], None]) -> None:
+        pass
+
+    def _drain(self) -> None:
+        while True:
+            with self.__idle:
+                if not self.__pending:
+                    self.__running = False
+                    self.__idle.notify_all()
+                    return
+                handlers, sender, e = self.__pending.popleft()
+            _deliver(handlers, sender, e)
+
+
+class ExecutorDispatcher(_QueuedDispatcher):
+    __slots__ = ["__executor"]
+
+    def __init__(self, executor: Executor) -> None:
+        super().__init__()
+        self.__executor = executor
+
+    def _schedule(self, drain: Callable[[], None]) -> None:
+        self.__executor.submit(drain)
+
+
+class ThreadDispatcher(_QueuedDispatcher):
+    __slots__ = ["__wakeups", "__thread", "__name"]
+
+    def __init__(self, name: str | None = None) -> None:
+        super().__init__()
+        self.__wakeups: SimpleQueue[Callable[[], None] | None] = SimpleQueue()
+        self.__thread: threading.Thread | None = None
+        self.__name = name
+
+    def close(self) -> None:
+        if self.__thread is not None:
+            self.__wakeups.put(None)
+            self.__thread.join()
+            self.__thread = None
+
+    def _schedule(self, drain: Callable[[], None]) -> None:
+        if self.__thread is None:
+            self.__thread = threading.Thread(
+                target=self.__run, name=self.__name, daemon=True
+            )
+            self.__thread.start()
+        self.__wakeups.put(drain)
+
+    def __run(self) -> None:
+        while (drain := self.__wakeups.get()) is not None:
+            drain()
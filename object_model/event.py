@@ -1,32 +1,194 @@
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
+from functools import partial
+from types import MethodType
+from typing import Any, Self
+from weakref import WeakMethod, ref
 
-from object_model.abc import EventProtocol, EventArgs
+from object_model.abc import DispatcherProtocol, EventProtocol, EventArgs
+
+
+class Subscription:
+    __slots__ = ["__unsubscribe", "__weakref__"]
+
+    def __init__(self, unsubscribe: Callable[["Subscription"], None]) -> None:
+        self.__unsubscribe: Callable[[Subscription], None] | None = unsubscribe
+
+    @property
+    def disposed(self) -> bool:
+        return self.__unsubscribe is None
+
+    def dispose(self) -> None:
+        unsubscribe, self.__unsubscribe = self.__unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe(self)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.dispose()
+
+
+class _WeakHandler:
+    __slots__ = ["__handler"]
+
+    def __init__(self, handler: Callable[..., Any], subscription: Subscription):
+        # Bound methods are created on attribute access, so a plain reference
+        # to one would die immediately; WeakMethod tracks the instance instead.
+        # The callback only holds the subscription weakly, which keeps the
+        # wrapper out of reference cycles.
+        callback = partial(_dispose, ref(subscription))
+        if isinstance(handler, MethodType):
+            self.__handler = WeakMethod(handler, callback)
+        else:
+            self.__handler = ref(handler, callback)
+
+    def __call__(self, sender: Any, e: EventArgs) -> Any:
+        handler = self.__handler()
+        if handler is not None:
+            return handler(sender, e)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _WeakHandler):
+            return self.__handler == other.__handler
+        handler = self.__handler()
+        return handler is not None and handler == other
+
+    __hash__ = None
+
+
+def _dispose(subscription_ref: ref[Subscription], _: ref) -> None:
+    subscription = subscription_ref()
+    if subscription is not None:
+        subscription.dispose()
 
 
 class Event[_T](EventProtocol[_T]):
-    __slots__ = ["__event_handlers"]
+    __slots__ = [
+        "__subscriptions",
+        "__filters",
+        "__event_handlers",
+        "__routes",
+        "__version",
+        "__dispatcher",
+    ]
 
-    def __init__(self) -> None:  # noqa
-        self.__event_handlers: list[Callable[[_T, EventArgs], None]] = []
+    def __init__(self, dispatcher: DispatcherProtocol | None = None) -> None:  # noqa
+        self.__subscriptions: dict[Subscription, Callable[[_T, EventArgs], None]] = {}
+        self.__filters: dict[Subscription, frozenset] = {}
+        # Snapshot dispatched to; rebuilt on first use after a change, so adding
+        # and removing handlers costs O(1) and handlers changed during dispatch
+        # take effect from the next call.
+        self.__event_handlers: tuple[Callable[[_T, EventArgs], None], ...] | None = ()
+        # Per-action snapshots, only consulted once a handler filters actions.
+        self.__routes: dict[Any, tuple[Callable[[_T, EventArgs], None], ...]] = {}
+        self.__version = 0
+        self.__dispatcher = dispatcher
 
     def __iadd__(self, handler: Callable[[_T, EventArgs], None]) -> "Event[_T]":
-        self.__event_handlers.append(handler)
+        self.add(handler)
         return self
 
     def __isub__(self, handler: Callable[[_T, EventArgs], None]) -> "Event[_T]":
-        self.__event_handlers.remove(handler)
+        self.remove(handler)
         return self
 
     def __call__(self, sender: _T, e: EventArgs) -> None:
-        for handler in tuple(self.__event_handlers):
+        if self.__filters:
+            event_handlers = self.__route(getattr(e, "action", None))
+        else:
+            event_handlers = self.__event_handlers
+            if event_handlers is None:
+                event_handlers = self.__snapshot()
+        if self.__dispatcher is not None:
+            self.__dispatcher.dispatch(event_handlers, sender, e)
+            return
+        for handler in event_handlers:
             handler(sender, e)
 
+    def __bool__(self) -> bool:
+        return bool(self.__subscriptions)
+
+    def __len__(self) -> int:
+        return len(self.__subscriptions)
+
     def __iter__(self) -> Generator[Callable[[_T, EventArgs], None]]:
-        for handler in self.__event_handlers:
+        event_handlers = self.__event_handlers
+        if event_handlers is None:
+            event_handlers = self.__snapshot()
+        for handler in event_handlers:
             yield handler
 
-    def add(self, handler: Callable[[_T, EventArgs], None]) -> None:
-        self.__event_handlers.append(handler)
+    def add(
+        self,
+        handler: Callable[[_T, EventArgs], None],
+        *,
+        weak: bool = False,
+        actions: Iterable[Any] | None = None,
+    ) -> Subscription:
+        subscription = Subscription(self.__unsubscribe)
+        if actions is not None:
+            self.__filters[subscription] = frozenset(actions)
+        self.__subscriptions[subscription] = (
+            _WeakHandler(handler, subscription) if weak else handler
+        )
+        self.__changed()
+        return subscription
 
     def remove(self, handler: Callable[[_T, EventArgs], None]) -> None:
-        self.__event_handlers.remove(handler)
+        for subscription, subscribed in self.__subscriptions.items():
+            if subscribed == handler:
+                break
+        else:
+            raise ValueError(f"{handler!r} is not subscribed")
+        subscription.dispose()
+
+    def handles(self, action: Any) -> bool:
+        if not self.__filters:
+            return bool(self.__subscriptions)
+        return bool(self.__route(action))
+
+    def handlers(self, action: Any) -> tuple[Callable[[_T, EventArgs], None], ...]:
+        if not self.__filters:
+            return tuple(self)
+        return self.__route(action)
+
+    def join(self, timeout: float | None = None) -> bool:
+        if self.__dispatcher is None:
+            return True
+        return self.__dispatcher.join(timeout)
+
+    def __unsubscribe(self, subscription: Subscription) -> None:
+        if self.__subscriptions.pop(subscription, None) is not None:
+            self.__filters.pop(subscription, None)
+            self.__changed()
+
+    def __changed(self) -> None:
+        self.__version += 1
+        self.__event_handlers = None
+        self.__routes = {}
+
+    def __snapshot(self) -> tuple[Callable[[_T, EventArgs], None], ...]:
+        # Retried if the handlers change while the snapshot is being stored,
+        # so a stale snapshot never outlives a concurrent add or remove.
+        while True:
+            version = self.__version
+            event_handlers = tuple(self.__subscriptions.values())
+            self.__event_handlers = event_handlers
+            if self.__version == version:
+                return event_handlers
+
+    def __route(self, action: Any) -> tuple[Callable[[_T, EventArgs], None], ...]:
+        routes = self.__routes
+        event_handlers = routes.get(action)
+        if event_handlers is None:
+            filters = self.__filters
+            event_handlers = tuple(
+                handler
+                for subscription, handler in list(self.__subscriptions.items())
+                if (actions := filters.get(subscription)) is None or action in actions
+            )
+            # A change replaces the routes dict, so an entry stored into a
+            # replaced one is simply dropped.
+            routes[action] = event_handlers
+        return event_handlers
@@ -0,0 +1,200 @@
+from bisect import insort
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any
+
+from object_model.abc import EventArgs, NotifyCollectionChangedAction
+from object_model.notify_collection_changed import sequence_splice
+
+# Lookups answered by scanning the sequence before dropped positions are
+# rebuilt; a rebuild calls key() once per item, so it only pays off once the
+# sequence is queried more often than it is reshuffled.
+_REBUILD_AFTER = 16
+
+
+class CollectionIndex[_K: Hashable, _T]:
+    __slots__ = ["__name", "__key", "__unique", "__buckets", "__positions", "__scans"]
+
+    def __init__(
+        self, name: str, key: Callable[[_T], _K], *, unique: bool = False
+    ) -> None:
+        self.__name = name
+        self.__key = key
+        self.__unique = unique
+        self.__buckets: dict[_K, list[_T]] = {}
+        # Sorted positions per key for sequences, built on demand and dropped
+        # whenever a change shifts items other than at the tail.
+        self.__positions: dict[_K, list[int]] | None = None
+        self.__scans = 0
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def key(self) -> Callable[[_T], _K]:
+        return self.__key
+
+    @property
+    def unique(self) -> bool:
+        return self.__unique
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self.__buckets)
+
+    def __contains__(self, __key: object, /) -> bool:
+        return __key in self.__buckets
+
+    def __getitem__(self, __key: _K, /) -> Any:
+        bucket = self.__buckets[__key]
+        return bucket[0] if self.__unique else tuple(bucket)
+
+    def get(self, __key: _K, __default: Any = None, /) -> Any:
+        bucket = self.__buckets.get(__key)
+        if bucket is None:
+            return __default
+        return bucket[0] if self.__unique else tuple(bucket)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.__name!r}, unique={self.__unique!r}, "
+            f"keys={len(self.__buckets)})"
+        )
+
+    def _validate(self, __new_items: Iterable[_T], __old_items: Iterable[_T]) -> None:
+        if not self.__unique:
+            return
+        key = self.__key
+        buckets = self.__buckets
+        released = set(map(key, __old_items))
+        seen = set()
+        for item in __new_items:
+            item_key = key(item)
+            if item_key in seen or (item_key in buckets and item_key not in released):
+                raise ValueError(
+                    f"duplicate key {item_key!r} in unique index {self.__name!r}"
+                )
+            seen.add(item_key)
+
+    def _reset(self, __items: Iterable[_T]) -> None:
+        buckets: dict[_K, list[_T]] = {}
+        for item in __items:
+            buckets.setdefault(self.__key(item), []).append(item)
+        if self.__unique:
+            for item_key, bucket in buckets.items():
+                if len(bucket) > 1:
+                    raise ValueError(
+                        f"duplicate key {item_key!r} in unique index {self.__name!r}"
+                    )
+        self.__buckets = buckets
+        self.__invalidate()
+
+    def _positions(self, __value: Any, __items: Sequence[_T]) -> list[int] | None:
+        # None means the caller has to scan.
+        positions = self.__positions
+        if positions is None:
+            self.__scans += 1
+            if self.__scans < _REBUILD_AFTER:
+                return None
+        try:
+            value_key = self.__key(__value)
+            hash(value_key)
+        except Exception:
+            return None
+        if positions is None:
+            positions = self.__positions = {}
+            for position, item in enumerate(__items):
+                positions.setdefault(self.__key(item), []).append(position)
+        return positions.get(value_key, [])
+
+    def _on_changed(self, __sender: Any, __e: EventArgs) -> None:
+        action = __e.action
+        if action == NotifyCollectionChangedAction.RESET:
+            self._reset(__sender)
+        elif isinstance(__sender, set):
+            if action == NotifyCollectionChangedAction.ADD:
+                items = __e.new_items
+                self.__add(items if isinstance(items, set) else (items,))
+            else:
+                items = __e.old_items
+                self.__remove(items if isinstance(items, set) else (items,))
+        elif action == NotifyCollectionChangedAction.MOVE:
+            self.__invalidate()
+        else:
+            index, old_items, new_items = sequence_splice(__e)
+            self.__remove(old_items)
+            self.__add(new_items)
+            if action == NotifyCollectionChangedAction.ADD:
+                if index + len(new_items) == len(__sender):
+                    self.__append_positions(index, new_items)
+                else:
+                    self.__invalidate()
+            elif action == NotifyCollectionChangedAction.REMOVE:
+                if index == len(__sender):
+                    self.__pop_positions(old_items)
+                else:
+                    self.__invalidate()
+            elif len(old_items) == len(new_items) == 1:
+                self.__replace_position(index, old_items[0], new_items[0])
+            else:
+                self.__invalidate()
+
+    def __invalidate(self) -> None:
+        self.__positions = None
+        self.__scans = 0
+
+    def __add(self, __items: Iterable[_T]) -> None:
+        buckets = self.__buckets
+        for item in __items:
+            item_key = self.__key(item)
+            bucket = buckets.get(item_key)
+            if bucket is None:
+                buckets[item_key] = [item]
+            else:
+                bucket.append(item)
+
+    def __remove(self, __items: Iterable[_T]) -> None:
+        buckets = self.__buckets
+        for item in __items:
+            item_key = self.__key(item)
+            bucket = buckets[item_key]
+            if len(bucket) == 1:
+                del buckets[item_key]
+                continue
+            for position, candidate in enumerate(bucket):
+                if candidate is item:
+                    del bucket[position]
+                    break
+            else:
+                bucket.remove(item)
+
+    def __append_positions(self, __index: int, __items: Iterable[_T]) -> None:
+        positions = self.__positions
+        if positions is None:
+            return
+        for position, item in enumerate(__items, __index):
+            positions.setdefault(self.__key(item), []).append(position)
+
+    def __pop_positions(self, __items: Sequence[_T]) -> None:
+        positions = self.__positions
+        if positions is None:
+            return
+        for item in reversed(__items):
+            item_key = self.__key(item)
+            item_positions = positions[item_key]
+            item_positions.pop()
+            if not item_positions:
+                del positions[item_key]
+
+    def __replace_position(self, __index: int, __old_item: _T, __new_item: _T):
+        positions = self.__positions
+        if positions is None:
+            return
+        old_key = self.__key(__old_item)
+        item_positions = positions[old_key]
+        item_positions.remove(__index)
+        if not item_positions:
+            del positions[old_key]
+        insort(positions.setdefault(self.__key(__new_item), []), __index)
@@ -0,0 +1,297 @@
+from bisect import bisect_right
+from collections.abc import Iterator
+from operator import attrgetter
+from typing import Any, NamedTuple
+
+from object_model.abc import EventArgs, NotifyCollectionChangedAction
+from object_model.notify_collection_changed import sequence_splice
+
+
+class JournalRecord(NamedTuple):
+    sequence: int
+    action: NotifyCollectionChangedAction
+    target: Any = None
+    payload: Any = None
+
+
+class ChangeJournal:
+    __slots__ = [
+        "__collection",
+        "__capacity",
+        "__records",
+        "__sequence",
+        "__truncated_sequence",
+        "__record",
+        "__apply",
+        "__compact",
+    ]
+
+    def __init__(self, collection, capacity: int | None = None) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.__collection = collection
+        self.__capacity = capacity
+        self.__records: list[JournalRecord] = []
+        self.__sequence = 0
+        self.__truncated_sequence = 0
+        if isinstance(collection, dict):
+            self.__record = self.__record_dict
+            self.__apply, self.__compact = _apply_dict, _compact_dict
+        elif isinstance(collection, set):
+            self.__record = self.__record_set
+            self.__apply, self.__compact = _apply_set, _compact_set
+        else:
+            self.__record = self.__record_sequence
+            self.__apply, self.__compact = _apply_sequence, _compact_sequence
+        self.__append(NotifyCollectionChangedAction.RESET, None, _snapshot(collection))
+        collection.collection_changed += self.__on_collection_changed
+
+    @property
+    def first_sequence(self) -> int:
+        return self.__records[0].sequence if self.__records else self.__sequence + 1
+
+    @property
+    def last_sequence(self) -> int:
+        return self.__sequence
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __iter__(self) -> Iterator[JournalRecord]:
+        return iter(self.__records)
+
+    def close(self) -> None:
+        self.__collection.collection_changed -= self.__on_collection_changed
+
+    def since(self, sequence: int) -> list[JournalRecord]:
+        if sequence < self.__truncated_sequence:
+            raise LookupError(
+                f"journal no longer holds records after sequence {sequence}"
+            )
+        position = bisect_right(self.__records, sequence, key=attrgetter("sequence"))
+        return self.__records[position:]
+
+    def replay(self, target, since: int = 0) -> int:
+        for record in self.since(since):
+            self.__apply(target, record)
+        return self.__sequence
+
+    def compact(self) -> None:
+        records = self.__records
+        for position in range(len(records) - 1, -1, -1):
+            if records[position].action == NotifyCollectionChangedAction.RESET:
+                del records[:position]
+                break
+        self.__records = self.__compact(records)
+
+    def __append(
+        self, action: NotifyCollectionChangedAction, target: Any, payload: Any
+    ) -> None:
+        self.__sequence += 1
+        records = self.__records
+        records.append(JournalRecord(self.__sequence, action, target, payload))
+        capacity = self.__capacity
+        if capacity is not None and len(records) >= 2 * capacity:
+            self.__truncated_sequence = records[-capacity - 1].sequence
+            del records[:-capacity]
+
+    def __on_collection_changed(self, sender, e: EventArgs) -> None:
+        if e.action == NotifyCollectionChangedAction.RESET:
+            self.__append(e.action, None, _snapshot(sender))
+        else:
+            self.__record(sender, e)
+
+    def __record_sequence(self, sender, e: EventArgs) -> None:
+        action = e.action
+        if getattr(sender, "maxlen", None) is not None:
+            # Evictions from a bounded deque are not reported, so only a
+            # snapshot is exact.
+            self.__append(NotifyCollectionChangedAction.RESET, None, _snapshot(sender))
+        elif action == NotifyCollectionChangedAction.MOVE:
+            self.__append(
+                action,
+                e.old_starting_index,
+                (1 if e.old_count is None else e.old_count, e.new_starting_index),
+            )
+        else:
+            index, old_items, new_items = sequence_splice(e)
+            if action == NotifyCollectionChangedAction.ADD:
+                self.__append(action, index, tuple(new_items))
+            elif action == NotifyCollectionChangedAction.REMOVE:
+                self.__append(action, index, len(old_items))
+            else:
+                self.__append(action, index, (len(old_items), tuple(new_items)))
+
+    def __record_dict(self, sender, e: EventArgs) -> None:
+        action = e.action
+        if e.new_count is None and e.old_count is None:
+            self.__append(
+                action,
+                e.key,
+                None if action == NotifyCollectionChangedAction.REMOVE else e.new_items,
+            )
+            return
+        old_items = e.old_items
+        for key, value in e.new_items.items():
+            self.__append(
+                (
+                    NotifyCollectionChangedAction.REPLACE
+                    if key in old_items
+                    else NotifyCollectionChangedAction.ADD
+                ),
+                key,
+                value,
+            )
+
+    def __record_set(self, sender, e: EventArgs) -> None:
+        if e.action == NotifyCollectionChangedAction.ADD:
+            items = e.new_items
+        else:
+            items = e.old_items
+        self.__append(
+            e.action, None, tuple(items) if isinstance(items, set) else (items,)
+        )
+
+
+def _snapshot(collection) -> tuple:
+    if isinstance(collection, dict):
+        return tuple(collection.items())
+    return tuple(collection)
+
+
+def _apply_sequence(target, record: JournalRecord) -> None:
+    action, index = record.action, record.target
+    if action == NotifyCollectionChangedAction.RESET:
+        target.clear()
+        target.extend(record.payload)
+    elif action == NotifyCollectionChangedAction.ADD:
+        _insert(target, index, record.payload)
+    elif action == NotifyCollectionChangedAction.REMOVE:
+        _remove(target, index, record.payload)
+    elif action == NotifyCollectionChangedAction.REPLACE:
+        count, items = record.payload
+        if count == len(items) == 1:
+            target[index] = items[0]
+        elif isinstance(target, list):
+            target[index : index + count] = items
+        else:
+            _remove(target, index, count)
+            _insert(target, index, items)
+    elif action == NotifyCollectionChangedAction.MOVE:
+        count, new_index = record.payload
+        if count == 1 and hasattr(target, "move"):
+            target.move(index, new_index)
+        elif hasattr(target, "move_range"):
+            target.move_range(index, count, new_index)
+        else:
+            items = [target[i] for i in range(index, index + count)]
+            _remove(target, index, count)
+            _insert(target, new_index, items)
+
+
+def _insert(target, index: int, items: tuple) -> None:
+    if len(items) == 1:
+        target.insert(index, items[0])
+    elif hasattr(target, "insert_range"):
+        target.insert_range(index, items)
+    elif isinstance(target, list):
+        target[index:index] = items
+    else:
+        for offset, item in enumerate(items):
+            target.insert(index + offset, item)
+
+
+def _remove(target, index: int, count: int) -> None:
+    if count == 1:
+        del target[index]
+    elif hasattr(target, "remove_range"):
+        target.remove_range(index, count)
+    elif isinstance(target, list):
+        del target[index : index + count]
+    else:
+        for _ in range(count):
+            del target[index]
+
+
+def _apply_dict(target, record: JournalRecord) -> None:
+    action, key = record.action, record.target
+    if action == NotifyCollectionChangedAction.RESET:
+        target.clear()
+        target.update(record.payload)
+    elif action == NotifyCollectionChangedAction.REMOVE:
+        if key in target:
+            del target[key]
+    else:
+        target[key] = record.payload
+
+
+def _apply_set(target, record: JournalRecord) -> None:
+    action = record.action
+    if action == NotifyCollectionChangedAction.RESET:
+        target.clear()
+        target.update(record.payload)
+    elif action == NotifyCollectionChangedAction.ADD:
+        target.update(record.payload)
+    else:
+        target.difference_update(record.payload)
+
+
+def _compact_sequence(records: list[JournalRecord]) -> list[JournalRecord]:
+    compacted = []
+    for record in records:
+        if (
+            compacted
+            and record.action == NotifyCollectionChangedAction.REPLACE
+            and compacted[-1].action == NotifyCollectionChangedAction.REPLACE
+            and compacted[-1].target == record.target
+            and compacted[-1].payload[0] == len(compacted[-1].payload[1])
+            and record.payload[0] == len(compacted[-1].payload[1])
+        ):
+            compacted[-1] = record
+        else:
+            compacted.append(record)
+    return compacted
+
+
+def _compact_dict(records: list[JournalRecord]) -> list[JournalRecord]:
+    compacted = []
+    replaced = {}
+    for record in records:
+        key = record.target
+        if record.action == NotifyCollectionChangedAction.REPLACE:
+            position = replaced.get(key)
+            if position is not None:
+                compacted[position] = None
+            replaced[key] = len(compacted)
+        elif record.action == NotifyCollectionChangedAction.RESET:
+            replaced.clear()
+        else:
+            replaced.pop(key, None)
+        compacted.append(record)
+    return [record for record in compacted if record is not None]
+
+
+def _compact_set(records: list[JournalRecord]) -> list[JournalRecord]:
+    if records and records[0].action == NotifyCollectionChangedAction.RESET:
+        compacted, records = records[:1], records[1:]
+    else:
+        compacted = []
+    if not records:
+        return compacted
+    membership = {}
+    for record in records:
+        added = record.action == NotifyCollectionChangedAction.ADD
+        for item in record.payload:
+            membership[item] = added
+    sequence = records[-1].sequence
+    removed = tuple(item for item, added in membership.items() if not added)
+    added = tuple(item for item, added in membership.items() if added)
+    if removed:
+        compacted.append(
+            JournalRecord(sequence, NotifyCollectionChangedAction.REMOVE, None, removed)
+        )
+    if added:
+        compacted.append(
+            JournalRecord(sequence, NotifyCollectionChangedAction.ADD, None, added)
+        )
+    return compacted
@@ -0,0 +1,127 @@
+from collections.abc import Callable
+from typing import Any, SupportsIndex
+
+from object_model.abc import EventArgs, NotifyCollectionChangedAction
+
+
+class _Deferred:
+    __slots__ = ["factory"]
+
+    def __init__(self, factory: Callable[[], object]) -> None:
+        self.factory = factory
+
+
+class NotifyCollectionChangedEventArgs(EventArgs):
+    __slots__ = [
+        "__action",
+        "__new_items",
+        "__new_starting_index",
+        "__old_starting_index",
+        "__old_items",
+        "__new_count",
+        "__old_count",
+        "__key",
+    ]
+
+    def __init__(
+        self,
+        action: NotifyCollectionChangedAction,
+        new_items: object | None = None,
+        new_starting_index: SupportsIndex | None = None,
+        old_starting_index: SupportsIndex | None = None,
+        old_items: object | None = None,
+        new_count: int | None = None,
+        old_count: int | None = None,
+        *,
+        key: object | None = None,
+        new_items_factory: Callable[[], object] | None = None,
+        old_items_factory: Callable[[], object] | None = None,
+    ):
+        self.__action = action
+        self.__new_items = (
+            new_items if new_items_factory is None else _Deferred(new_items_factory)
+        )
+        self.__new_starting_index = new_starting_index
+        self.__old_starting_index = old_starting_index
+        self.__old_items = (
+            old_items if old_items_factory is None else _Deferred(old_items_factory)
+        )
+        self.__new_count = new_count
+        self.__old_count = old_count
+        self.__key = key
+
+    @property
+    def action(self) -> NotifyCollectionChangedAction:
+        return self.__action
+
+    @property
+    def new_items(self) -> object | None:
+        if type(self.__new_items) is _Deferred:
+            self.__new_items = self.__new_items.factory()
+        return self.__new_items
+
+    @property
+    def new_starting_index(self) -> SupportsIndex:
+        return self.__new_starting_index
+
+    @property
+    def old_starting_index(self) -> SupportsIndex:
+        return self.__old_starting_index
+
+    @property
+    def old_items(self) -> object | None:
+        if type(self.__old_items) is _Deferred:
+            self.__old_items = self.__old_items.factory()
+        return self.__old_items
+
+    @property
+    def new_count(self) -> int | None:
+        return self.__new_count
+
+    @property
+    def old_count(self) -> int | None:
+        return self.__old_count
+
+    @property
+    def key(self) -> object | None:
+        return self.__key
+
+
+def sequence_splice(e: NotifyCollectionChangedEventArgs) -> tuple[int, list, list]:
+    # Reads an ADD, REMOVE or REPLACE sequence event, in either the single-item
+    # or the range form, as the index and the items removed and inserted there.
+    action = e.action
+    if action == NotifyCollectionChangedAction.ADD:
+        old_items = []
+    elif e.old_count is None:
+        old_items = [e.old_items]
+    else:
+        old_items = list(e.old_items)
+    if action == NotifyCollectionChangedAction.REMOVE:
+        return e.old_starting_index, old_items, []
+    new_items = [e.new_items] if e.new_count is None else list(e.new_items)
+    return e.new_starting_index, old_items, new_items
+
+
+def trim_unchanged(
+    comparer: Callable[[Any, Any], bool],
+    start: int,
+    old_items: list,
+    new_items: list,
+) -> tuple[int, list, list]:
+    # Drops the leading and trailing entries a splice leaves unchanged, so a
+    # range event covers only the entries that actually differ.
+    stop = min(len(old_items), len(new_items))
+    head = 0
+    while head < stop and comparer(old_items[head], new_items[head]):
+        head += 1
+    tail = 0
+    while tail < stop - head and comparer(old_items[-1 - tail], new_items[-1 - tail]):
+        tail += 1
+    if not head and not tail:
+        return start, old_items, new_items
+    return (
+        start + head,
+        old_items[head : len(old_items) - tail],
+        new_items[head : len(new_items) - tail],
+    )
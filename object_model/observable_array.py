@@ -0,0 +1,187 @@
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from numbers import Integral
+from typing import Any, Self
+
+import numpy as np
+
+from object_model.abc import EventProtocol, NotifyCollectionChangedAction
+from object_model.event import Event
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
+
+
+class ObservableArray:
+    __slots__ = ["collection_changed", "__array", "__suspended_changes"]
+
+    def __init__(self, __data: Any = (), /, dtype: Any = None, *, copy: bool = True):
+        self.__array = (
+            np.array(__data, dtype=dtype) if copy else np.asarray(__data, dtype=dtype)
+        )
+        self.collection_changed: EventProtocol[ObservableArray] = Event()
+        self.__suspended_changes: list[NotifyCollectionChangedEventArgs] | None = (
+            None
+        )
+
+    @property
+    def array(self) -> np.ndarray:
+        return _readonly(self.__array)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__array.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.__array.shape
+
+    @property
+    def size(self) -> int:
+        return self.__array.size
+
+    @property
+    def ndim(self) -> int:
+        return self.__array.ndim
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        if copy or (dtype is not None and np.dtype(dtype) != self.__array.dtype):
+            return np.array(self.__array, dtype=dtype)
+        return _readonly(self.__array)
+
+    def __len__(self) -> int:
+        return len(self.__array)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(_readonly(self.__array))
+
+    def __getitem__(self, __key: Any, /) -> Any:
+        return _readonly(self.__array[__key])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__array!r})"
+
+    def tolist(self) -> list:
+        return self.__array.tolist()
+
+    def fill(self, __value: Any, /) -> None:
+        if not self.collection_changed:
+            self.__array.fill(__value)
+            return
+        old_items = self.__array.copy()
+        self.__array.fill(__value)
+        self.__on_replaced(slice(None), old_items)
+
+    def apply(self, __ufunc: np.ufunc, __value: Any, /, key: Any = slice(None)) -> None:
+        items = self.__array[key]
+        in_place = _is_basic(key) and isinstance(items, np.ndarray)
+        if not self.collection_changed:
+            if in_place:
+                __ufunc(items, __value, out=items)
+            else:
+                self.__array[key] = __ufunc(items, __value)
+            return
+        if in_place:
+            old_items = items.copy()
+            __ufunc(items, __value, out=items)
+        else:
+            old_items = items
+            self.__array[key] = __ufunc(items, __value)
+        self.__on_replaced(key, old_items)
+
+    def __setitem__(self, __key: Any, __value: Any, /) -> None:
+        if not self.collection_changed:
+            self.__array[__key] = __value
+            return
+        old_items = self.__array[__key]
+        if _is_basic(__key) and isinstance(old_items, np.ndarray):
+            old_items = old_items.copy()
+        self.__array[__key] = __value
+        self.__on_replaced(__key, old_items)
+
+    def __iadd__(self, __value: Any, /) -> Self:
+        self.apply(np.add, __value)
+        return self
+
+    def __isub__(self, __value: Any, /) -> Self:
+        self.apply(np.subtract, __value)
+        return self
+
+    def __imul__(self, __value: Any, /) -> Self:
+        self.apply(np.multiply, __value)
+        return self
+
+    def __itruediv__(self, __value: Any, /) -> Self:
+        self.apply(np.true_divide, __value)
+        return self
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if len(changes) == 1:
+                self.collection_changed(self, changes[0])
+            elif changes:
+                self.collection_changed(
+                    self,
+                    NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.RESET
+                    ),
+                )
+
+    batch = suspend_notifications
+
+    def __on_replaced(self, __key: Any, __old_items: Any) -> None:
+        # Basic indexing yields a view, so handlers see the new values in place;
+        # the old values had to be copied before they were overwritten. A single
+        # element is a scalar, which takes the single-item form without counts.
+        start = _start_index(__key, self.__array)
+        count = __old_items.size if isinstance(__old_items, np.ndarray) else None
+        e = NotifyCollectionChangedEventArgs(
+            NotifyCollectionChangedAction.REPLACE,
+            new_items=_readonly(self.__array[__key]),
+            new_starting_index=start,
+            old_starting_index=start,
+            old_items=__old_items,
+            new_count=count,
+            old_count=count,
+            key=__key,
+        )
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append(e)
+        else:
+            self.collection_changed(self, e)
+
+
+def _readonly(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        value = value.view()
+        value.flags.writeable = False
+    return value
+
+
+def _is_basic(key: Any) -> bool:
+    if not isinstance(key, tuple):
+        key = (key,)
+    return all(
+        item is None
+        or item is Ellipsis
+        or (isinstance(item, (slice, Integral)) and not isinstance(item, bool))
+        for item in key
+    )
+
+
+def _start_index(key: Any, array: np.ndarray) -> int | None:
+    if array.ndim != 1:
+        return None
+    if isinstance(key, Integral) and not isinstance(key, bool):
+        return range(len(array))[key]
+    if isinstance(key, slice):
+        start, _, step = key.indices(len(array))
+        if step == 1:
+            return start
+    return None
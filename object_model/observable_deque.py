@@ -1,54 +1,17 @@
 from _operator import index
 from collections import deque
-from collections.abc import Iterable
-from typing import SupportsIndex
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, SupportsIndex
 
 from object_model.abc import NotifyCollectionChangedAction
-from object_model.event import EventArgs, Event
+from object_model.event import Event
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
+from object_model.views import FilteredView, MappedView, SortedView
 
 
-class NotifyDequeChangedEventArgs(EventArgs):
-    __slots__ = [
-        "__action",
-        "__new_items",
-        "__new_starting_index",
-        "__old_starting_index",
-        "__old_items",
-    ]
-
-    def __init__(
-        self,
-        action: NotifyCollectionChangedAction,
-        new_items: object | None = None,
-        new_starting_index: SupportsIndex | None = None,
-        old_starting_index: SupportsIndex | None = None,
-        old_items: object | None = None,
-    ):
-        self.__action = action
-        self.__new_items = new_items
-        self.__new_starting_index = new_starting_index
-        self.__old_starting_index = old_starting_index
-        self.__old_items = old_items
-
-    @property
-    def action(self) -> NotifyCollectionChangedAction:
-        return self.__action
-
-    @property
-    def new_items(self) -> object | None:
-        return self.__new_items
-
-    @property
-    def new_starting_index(self) -> SupportsIndex:
-        return self.__new_starting_index
-
-    @property
-    def old_starting_index(self) -> SupportsIndex:
-        return self.__old_starting_index
-
-    @property
-    def old_items(self) -> object | None:
-        return self.__old_items
+NotifyDequeChangedEventArgs = NotifyCollectionChangedEventArgs
 
 
 class ObservableDeque[_T](deque[_T]):
@@ -57,92 +20,143 @@ class ObservableDeque[_T](deque[_T]):
     ) -> None:
         super().__init__(__iterable, maxlen)
         self.collection_changed: Event[ObservableDeque[_T]] = Event()
+        self.comparer: Callable[[_T, _T], bool] | None = None
+        self.__suspended_changes: list[NotifyCollectionChangedEventArgs] | None = (
+            None
+        )
 
     def append(self, __object: _T, /) -> None:
         deque.append(self, __object)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD,
-            new_items=__object,
-            new_starting_index=len(self) - 1,
-        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=__object,
+                new_starting_index=len(self) - 1,
+            )
 
     def appendleft(self, __object: _T, /) -> None:
         deque.appendleft(self, __object)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD,
-            new_items=__object,
-            new_starting_index=0,
-        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=__object,
+                new_starting_index=0,
+            )
 
     def clear(self) -> None:
         deque.clear(self)
-        self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+        if self.collection_changed:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
 
     def extend(self, __iterable: Iterable[_T], /) -> None:
+        if not self.collection_changed:
+            deque.extend(self, __iterable)
+            return
+        new_items = list(__iterable)
         last_index = len(self)
-        deque.extend(self, __iterable)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD, new_starting_index=last_index
-        )
+        deque.extend(self, new_items)
+        if new_items:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=new_items,
+                new_starting_index=last_index,
+                new_count=len(new_items),
+            )
 
     def extendleft(self, __iterable: Iterable[_T], /) -> None:
-        deque.extendleft(self, __iterable)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD, new_starting_index=0
-        )
+        if not self.collection_changed:
+            deque.extendleft(self, __iterable)
+            return
+        new_items = list(__iterable)
+        deque.extendleft(self, new_items)
+        if new_items:
+            new_items.reverse()
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=new_items,
+                new_starting_index=0,
+                new_count=len(new_items),
+            )
 
     def insert(self, __index: SupportsIndex, __object: _T, /) -> None:
-        __index = index(__index)
+        __index = slice(__index, __index).indices(len(self))[0]
         deque.insert(self, __index, __object)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD,
-            new_items=__object,
-            new_starting_index=__index,
-        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=__object,
+                new_starting_index=__index,
+            )
 
     def move(self, __old_index: SupportsIndex, __new_index: SupportsIndex, /) -> None:
-        removed_item = self[__old_index]
-        deque.remove(self, removed_item)
-        __new_index = index(__new_index)
-        __index = sum((len(self), __new_index, 1)) if __new_index < 0 else __new_index
-        deque.insert(self, __index, removed_item)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.MOVE,
-            new_starting_index=__new_index,
-            old_starting_index=__old_index,
-            old_items=removed_item,
-        )
+        __indices = range(len(self))
+        __old_index = __indices[__old_index]
+        __new_index = __indices[__new_index]
+        moved_item = self[__old_index]
+        deque.__delitem__(self, __old_index)
+        deque.insert(self, __new_index, moved_item)
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.MOVE,
+                new_starting_index=__new_index,
+                old_starting_index=__old_index,
+                old_items=moved_item,
+            )
 
     def pop(self) -> _T:
-        __index = len(self) - 1
         __object = deque.pop(self)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_starting_index=__index,
-            old_items=__object,
-        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_starting_index=len(self),
+                old_items=__object,
+            )
         return __object
 
     def popleft(self) -> _T:
         __object = deque.popleft(self)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_starting_index=0,
-            old_items=__object,
-        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_starting_index=0,
+                old_items=__object,
+            )
         return __object
 
     def remove(self, __object: _T, /) -> None:
+        if not self.collection_changed:
+            deque.remove(self, __object)
+            return
         __index = self.index(__object)
-        deque.remove(self, __object)
+        removed_item = self[__index]
+        deque.__delitem__(self, __index)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
             old_starting_index=__index,
-            old_items=__object,
+            old_items=removed_item,
         )
 
+    def reverse(self) -> None:
+        deque.reverse(self)
+        if self.collection_changed and len(self) > 1:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def rotate(self, __n: int = 1, /) -> None:
+        deque.rotate(self, __n)
+        if self.collection_changed and len(self) > 1 and __n % len(self):
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
     def __setitem__(self, __index: SupportsIndex, __object: _T, /) -> None:
+        comparer = self.comparer
+        if comparer is None and not self.collection_changed:
+            deque.__setitem__(self, __index, __object)
+            return
         original_item = self[__index]
+        if comparer is not None and comparer(original_item, __object):
+            return
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
         deque.__setitem__(self, __index, __object)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REPLACE,
@@ -153,7 +167,13 @@ class ObservableDeque[_T](deque[_T]):
         )
 
     def __delitem__(self, __index: SupportsIndex, /) -> None:
+        if not self.collection_changed:
+            deque.__delitem__(self, __index)
+            return
         removed_items = self[__index]
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
         deque.__delitem__(self, __index)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
@@ -161,7 +181,74 @@ class ObservableDeque[_T](deque[_T]):
             old_items=removed_items,
         )
 
+    def where(self, __predicate: Callable[[_T], Any], /) -> FilteredView[_T]:
+        return FilteredView(self, __predicate)
+
+    def select[_R](self, __selector: Callable[[_T], _R], /) -> MappedView[_R]:
+        return MappedView(self, __selector)
+
+    def order_by(
+        self, key: Callable[[_T], Any] | None = None, *, reverse: bool = False
+    ) -> SortedView[_T]:
+        return SortedView(self, key, reverse=reverse)
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        original_len = len(self)
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if changes:
+                self.collection_changed(
+                    self, self.__coalesce_changes(changes, original_len)
+                )
+
+    batch = suspend_notifications
+
+    def __coalesce_changes(
+        self, changes: list[NotifyCollectionChangedEventArgs], original_len: int
+    ) -> NotifyCollectionChangedEventArgs:
+        if len(changes) == 1:
+            return changes[0]
+        start = changes[0].new_starting_index
+        if (
+            self.maxlen is None
+            and isinstance(start, int)
+            and 0 <= start <= original_len
+        ):
+            count = 0
+            for e in changes:
+                if (
+                    e.action != NotifyCollectionChangedAction.ADD
+                    or not start <= e.new_starting_index <= start + count
+                ):
+                    break
+                count += 1 if e.new_count is None else e.new_count
+            else:
+                if len(self) - original_len == count:
+                    return NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.ADD,
+                        new_items=list(islice(self, start, start + count)),
+                        new_starting_index=start,
+                        new_count=count,
+                    )
+        return NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+
     def __on_collection_changed(
         self, action: NotifyCollectionChangedAction, **kwargs
     ) -> None:
-        self.collection_changed(self, NotifyDequeChangedEventArgs(action, **kwargs))
+        if (
+            self.__suspended_changes is None
+            and not self.collection_changed.handles(action)
+        ):
+            return
+        e = NotifyCollectionChangedEventArgs(action, **kwargs)
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append(e)
+        else:
+            self.collection_changed(self, e)
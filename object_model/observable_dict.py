@@ -1,41 +1,20 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
 from typing import Optional, Union, TYPE_CHECKING
 
-from object_model.abc import NotifyCollectionChangedAction
-from object_model.event import EventArgs, Event
+from object_model.abc import (
+    EventArgs,
+    NotifyCollectionChangedAction,
+    SubscriptionProtocol,
+)
+from object_model.event import Event
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
 
 if TYPE_CHECKING:
     from _typeshed import SupportsKeysAndGetItem
 
 
-class NotifyDictChangedEventArgs(EventArgs):
-    __slots__ = [
-        "__action",
-        "__new_items",
-        "__old_items",
-    ]
-
-    def __init__(
-        self,
-        action: NotifyCollectionChangedAction,
-        new_items: object | None = None,
-        old_items: object | None = None,
-    ):
-        self.__action = action
-        self.__new_items = new_items
-        self.__old_items = old_items
-
-    @property
-    def action(self) -> NotifyCollectionChangedAction:
-        return self.__action
-
-    @property
-    def new_items(self) -> object | None:
-        return self.__new_items
-
-    @property
-    def old_items(self) -> object | None:
-        return self.__old_items
+NotifyDictChangedEventArgs = NotifyCollectionChangedEventArgs
 
 
 class ObservableDict[_KT, _VT](dict[_KT, _VT]):
@@ -50,25 +29,35 @@ class ObservableDict[_KT, _VT](dict[_KT, _VT]):
         kwargs.update(seq)
         super().__init__(kwargs)
         self.collection_changed: Event[ObservableDict[_KT, _VT]] = Event()
+        self.__key_observers: dict[_KT, Event[ObservableDict[_KT, _VT]]] = {}
+        self.comparer: Callable[[_VT, _VT], bool] | None = None
+        self.__suspended_changes: (
+            list[tuple[NotifyCollectionChangedEventArgs, bool]] | None
+        ) = None
 
     def clear(self) -> None:
         dict.clear(self)
-        self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+        if self.collection_changed or self.__key_observers:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
 
     def pop(self, __key: _KT, /) -> _VT:
         __object = dict.pop(self, __key)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_items=__object,
-        )
+        if self.collection_changed or self.__key_observers:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_items=__object,
+                key=__key,
+            )
         return __object
 
     def popitem(self) -> tuple[_KT, _VT]:
         __object = dict.popitem(self)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_items=__object,
-        )
+        if self.collection_changed or self.__key_observers:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_items=__object[1],
+                key=__object[0],
+            )
         return __object
 
     def update(
@@ -78,40 +67,198 @@ class ObservableDict[_KT, _VT](dict[_KT, _VT]):
         **kwargs: _VT,
     ) -> None:
         kwargs.update(m)
-        replaced_values = {}
-        for key, value in kwargs.items():
-            if key in self:
-                replaced_values[key] = value
-        dict.update(self, kwargs)
+        comparer = self.comparer
+        if comparer is None and not (self.collection_changed or self.__key_observers):
+            dict.update(self, kwargs)
+            return
+        if comparer is None:
+            new_items = kwargs
+            replaced_values = {key: self[key] for key in kwargs if key in self}
+        else:
+            new_items = {}
+            replaced_values = {}
+            for key, value in kwargs.items():
+                if key in self:
+                    original_item = self[key]
+                    if comparer(original_item, value):
+                        continue
+                    replaced_values[key] = original_item
+                new_items[key] = value
+        dict.update(self, new_items)
+        if not new_items:
+            return
         self.__on_collection_changed(
             NotifyCollectionChangedAction.ADD,
-            new_items=kwargs,
+            new_items=new_items,
             old_items=replaced_values,
+            new_count=len(new_items),
+            old_count=len(replaced_values),
         )
 
+    def observe_key(
+        self,
+        __key: _KT,
+        __handler: Callable[["ObservableDict[_KT, _VT]", EventArgs], None],
+        /,
+    ) -> SubscriptionProtocol:
+        event = self.__key_observers.get(__key)
+        if event is None:
+            event = self.__key_observers[__key] = Event()
+        return event.add(__handler)
+
+    def unobserve_key(
+        self,
+        __key: _KT,
+        __handler: Callable[["ObservableDict[_KT, _VT]", EventArgs], None],
+        /,
+    ) -> None:
+        event = self.__key_observers[__key]
+        event.remove(__handler)
+        if not event:
+            del self.__key_observers[__key]
+
     def __setitem__(self, __key: _KT, __value: _VT, /) -> None:
-        original_item = self.get(__key)
-        action = (
-            NotifyCollectionChangedAction.ADD
-            if original_item is None
-            else NotifyCollectionChangedAction.REPLACE
-        )
+        comparer = self.comparer
+        if comparer is None and not (self.collection_changed or self.__key_observers):
+            dict.__setitem__(self, __key, __value)
+            return
+        if __key in self:
+            action = NotifyCollectionChangedAction.REPLACE
+            original_item = self[__key]
+            if comparer is not None and comparer(original_item, __value):
+                return
+        else:
+            action = NotifyCollectionChangedAction.ADD
+            original_item = None
         dict.__setitem__(self, __key, __value)
         self.__on_collection_changed(
             action,
             new_items=__value,
             old_items=original_item,
+            key=__key,
         )
 
     def __delitem__(self, __key: _KT, /) -> None:
+        if not (self.collection_changed or self.__key_observers):
+            dict.__delitem__(self, __key)
+            return
         remove_item = self[__key]
         dict.__delitem__(self, __key)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
             old_items=remove_item,
+            key=__key,
+        )
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if changes:
+                self.collection_changed(self, self.__coalesce_changes(changes))
+                for e, keyed in changes:
+                    self.__on_key_changed(e, keyed)
+
+    batch = suspend_notifications
+
+    def __coalesce_changes(
+        self, changes: list[tuple[NotifyCollectionChangedEventArgs, bool]]
+    ) -> NotifyCollectionChangedEventArgs:
+        if len(changes) == 1:
+            return changes[0][0]
+        if any(
+            e.action != NotifyCollectionChangedAction.ADD
+            and e.action != NotifyCollectionChangedAction.REPLACE
+            for e, _ in changes
+        ):
+            return NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+        new_items, old_items = _merge_changes(changes)
+        return NotifyCollectionChangedEventArgs(
+            NotifyCollectionChangedAction.ADD,
+            new_items=new_items,
+            old_items=old_items,
+            new_count=len(new_items),
+            old_count=len(old_items),
         )
 
     def __on_collection_changed(
         self, action: NotifyCollectionChangedAction, **kwargs
     ) -> None:
-        self.collection_changed(action, NotifyDictChangedEventArgs(action, **kwargs))
+        if (
+            self.__suspended_changes is None
+            and not self.__key_observers
+            and not self.collection_changed.handles(action)
+        ):
+            return
+        keyed = "key" in kwargs
+        e = NotifyCollectionChangedEventArgs(action, **kwargs)
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append((e, keyed))
+        else:
+            self.collection_changed(self, e)
+            self.__on_key_changed(e, keyed)
+
+    def __on_key_changed(
+        self, e: NotifyCollectionChangedEventArgs, keyed: bool
+    ) -> None:
+        observers = self.__key_observers
+        if not observers:
+            return
+        if keyed:
+            event = observers.get(e.key)
+            if event is not None:
+                event(self, e)
+        elif e.action == NotifyCollectionChangedAction.RESET:
+            for event in tuple(observers.values()):
+                event(self, e)
+        else:
+            new_items, old_items = e.new_items, e.old_items
+            if len(new_items) <= len(observers):
+                keys = [key for key in new_items if key in observers]
+            else:
+                keys = [key for key in observers if key in new_items]
+            for key in keys:
+                event = observers.get(key)
+                if event is None:
+                    continue
+                event(
+                    self,
+                    NotifyCollectionChangedEventArgs(
+                        (
+                            NotifyCollectionChangedAction.REPLACE
+                            if key in old_items
+                            else NotifyCollectionChangedAction.ADD
+                        ),
+                        new_items=new_items[key],
+                        old_items=old_items.get(key),
+                        key=key,
+                    ),
+                )
+
+
+def _merge_changes(
+    changes: list[tuple[NotifyCollectionChangedEventArgs, bool]],
+) -> tuple[dict, dict]:
+    new_items = {}
+    old_items = {}
+    for e, keyed in changes:
+        if keyed:
+            items = {e.key: e.new_items}
+            replaced = (
+                {e.key: e.old_items}
+                if e.action == NotifyCollectionChangedAction.REPLACE
+                else {}
+            )
+        else:
+            items, replaced = e.new_items, e.old_items
+        for key, value in items.items():
+            if key not in new_items and key in replaced:
+                old_items[key] = replaced[key]
+            new_items[key] = value
+    return new_items, old_items
@@ -1,81 +1,61 @@
+import sys
 from _operator import index
-from typing import Iterable, SupportsIndex
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any, Iterable, SupportsIndex
 
 from object_model.abc import NotifyCollectionChangedAction, EventProtocol
-from object_model.event import Event, EventArgs
+from object_model.event import Event
+from object_model.indexes import CollectionIndex
+from object_model.notify_collection_changed import (
+    NotifyCollectionChangedEventArgs,
+    trim_unchanged,
+)
+from object_model.views import FilteredView, MappedView, SortedView
 
 
-class NotifyListChangedEventArgs(EventArgs):
-    __slots__ = [
-        "__action",
-        "__new_items",
-        "__new_starting_index",
-        "__old_starting_index",
-        "__old_items",
-    ]
-
-    def __init__(
-        self,
-        action: NotifyCollectionChangedAction,
-        new_items: object | None = None,
-        new_starting_index: SupportsIndex | None = None,
-        old_starting_index: SupportsIndex | None = None,
-        old_items: object | None = None,
-    ):
-        self.__action = action
-        self.__new_items = new_items
-        self.__new_starting_index = new_starting_index
-        self.__old_starting_index = old_starting_index
-        self.__old_items = old_items
-
-    @property
-    def action(self) -> NotifyCollectionChangedAction:
-        return self.__action
-
-    @property
-    def new_items(self) -> object | None:
-        return self.__new_items
-
-    @property
-    def new_starting_index(self) -> SupportsIndex:
-        return self.__new_starting_index
-
-    @property
-    def old_starting_index(self) -> SupportsIndex:
-        return self.__old_starting_index
-
-    @property
-    def old_items(self) -> object | None:
-        return self.__old_items
+NotifyListChangedEventArgs = NotifyCollectionChangedEventArgs
 
 
 class ObservableList[_T](list[_T]):
     def __init__(self, __iterable: Iterable[_T] = (), /):
         super().__init__(__iterable)
         self.collection_changed: EventProtocol[ObservableList[_T]] = Event()
+        self.__indexes: dict[str, CollectionIndex] = {}
+        self.comparer: Callable[[_T, _T], bool] | None = None
+        self.__suspended_changes: list[NotifyCollectionChangedEventArgs] | None = (
+            None
+        )
 
     def append(self, __object: _T, /) -> None:
+        if self.__indexes:
+            self.__validate((__object,), ())
         list.append(self, __object)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD,
-            new_items=__object,
-            new_starting_index=len(self) - 1,
-        )
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=__object,
+                new_starting_index=len(self) - 1,
+            )
 
     def clear(self):
         list.clear(self)
-        self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
 
     def extend(self, __iterable: Iterable[_T], /) -> None:
-        last_index = len(self)
-        list.extend(self, __iterable)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.ADD,
-            new_items=__iterable,
-            new_starting_index=last_index,
-        )
+        if not (self.collection_changed or self.__indexes):
+            list.extend(self, __iterable)
+            return
+        self.insert_range(len(self), __iterable)
 
     def insert(self, __index: SupportsIndex, __object: _T, /) -> None:
+        if not (self.collection_changed or self.__indexes):
+            list.insert(self, __index, __object)
+            return
+        __index = slice(__index, __index).indices(len(self))[0]
+        if self.__indexes:
+            self.__validate((__object,), ())
         list.insert(self, __index, __object)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.ADD,
@@ -83,20 +63,66 @@ class ObservableList[_T](list[_T]):
             new_starting_index=__index,
         )
 
+    def insert_range(self, __index: SupportsIndex, __iterable: Iterable[_T], /) -> None:
+        __index = slice(__index, __index).indices(len(self))[0]
+        new_items = list(__iterable)
+        if self.__indexes:
+            self.__validate(new_items, ())
+        list.__setitem__(self, slice(__index, __index), new_items)
+        if (self.collection_changed or self.__indexes) and new_items:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=new_items,
+                new_starting_index=__index,
+                new_count=len(new_items),
+            )
+
     def move(self, __old_index: SupportsIndex, __new_index: SupportsIndex, /) -> None:
-        removed_item = self[__old_index]
-        list.remove(self, removed_item)
+        __indices = range(len(self))
+        __old_index = __indices[__old_index]
+        __new_index = __indices[__new_index]
+        moved_item = self[__old_index]
+        self.__rotate(__old_index, 1, __new_index)
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.MOVE,
+                new_starting_index=__new_index,
+                old_starting_index=__old_index,
+                old_items=moved_item,
+            )
+
+    def move_range(
+        self, __index: SupportsIndex, __count: int, __new_index: SupportsIndex, /
+    ) -> None:
+        __index = index(__index)
         __new_index = index(__new_index)
-        __index = sum((len(self), __new_index, 1)) if __new_index < 0 else __new_index
-        list.insert(self, __index, removed_item)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.MOVE,
-            new_starting_index=__new_index,
-            old_starting_index=__old_index,
-            old_items=removed_item,
-        )
+        if __count < 0:
+            raise ValueError("count must be non-negative")
+        if not 0 <= __index <= len(self) - __count:
+            raise IndexError("list index out of range")
+        if not 0 <= __new_index <= len(self) - __count:
+            raise IndexError("list index out of range")
+        if __count == 0 or __index == __new_index:
+            return
+        moved_items = self[__index : __index + __count]
+        self.__rotate(__index, __count, __new_index)
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.MOVE,
+                new_items=moved_items,
+                new_starting_index=__new_index,
+                old_starting_index=__index,
+                old_items=moved_items,
+                new_count=__count,
+                old_count=__count,
+            )
 
     def pop(self, __index: SupportsIndex = -1, /) -> _T:
+        if not (self.collection_changed or self.__indexes):
+            return list.pop(self, __index)
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
         __object = list.pop(self, __index)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
@@ -106,16 +132,78 @@ class ObservableList[_T](list[_T]):
         return __object
 
     def remove(self, __object: _T, /) -> None:
+        if not (self.collection_changed or self.__indexes):
+            list.remove(self, __object)
+            return
         __index = self.index(__object)
-        list.remove(self, __object)
+        removed_item = list.__getitem__(self, __index)
+        list.__delitem__(self, __index)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
             old_starting_index=__index,
-            old_items=__object,
+            old_items=removed_item,
         )
 
-    def __setitem__(self, __index: SupportsIndex, __object: _T, /) -> None:
+    def index(
+        self,
+        __value: Any,
+        __start: SupportsIndex = 0,
+        __stop: SupportsIndex = sys.maxsize,
+        /,
+    ) -> int:
+        # Positions only narrow the search to items with the same key; a value
+        # that equals an item under another key is still found by the scan.
+        for collection_index in self.__indexes.values():
+            positions = collection_index._positions(__value, self)
+            if positions is None:
+                continue
+            start, stop, _ = slice(__start, __stop).indices(len(self))
+            for position in positions:
+                if start <= position < stop:
+                    item = list.__getitem__(self, position)
+                    if item is __value or item == __value:
+                        return position
+            break
+        return list.index(self, __value, __start, __stop)
+
+    def remove_range(self, __index: SupportsIndex, __count: int, /) -> None:
+        if __count < 0:
+            raise ValueError("count must be non-negative")
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
+        if __index < 0 or __index + __count > len(self):
+            raise IndexError("list index out of range")
+        self.__delitem__(slice(__index, __index + __count))
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        if (self.collection_changed or self.__indexes) and len(self) > 1:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        list.sort(self, key=key, reverse=reverse)
+        if (self.collection_changed or self.__indexes) and len(self) > 1:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def __setitem__(
+        self, __index: SupportsIndex | slice, __object: _T | Iterable[_T], /
+    ) -> None:
+        comparer = self.comparer
+        if comparer is None and not (self.collection_changed or self.__indexes):
+            list.__setitem__(self, __index, __object)
+            return
+        if isinstance(__index, slice):
+            self.__set_slice(__index, __object)
+            return
         original_item = self[__index]
+        if comparer is not None and comparer(original_item, __object):
+            return
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
+        if self.__indexes:
+            self.__validate((__object,), (original_item,))
         list.__setitem__(self, __index, __object)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REPLACE,
@@ -126,18 +214,221 @@ class ObservableList[_T](list[_T]):
         )
 
     def __delitem__(self, __index: SupportsIndex | slice, /) -> None:
-        removed_starting_index = (
-            __index.start if isinstance(__index, slice) else __index
-        )
+        if not (self.collection_changed or self.__indexes):
+            list.__delitem__(self, __index)
+            return
+        if isinstance(__index, slice):
+            self.__delete_slice(__index)
+            return
         removed_items = self[__index]
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
         list.__delitem__(self, __index)
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
-            old_starting_index=removed_starting_index,
+            old_starting_index=__index,
             old_items=removed_items,
         )
 
+    def __iadd__(self, __iterable: Iterable[_T], /) -> "ObservableList[_T]":
+        self.extend(__iterable)
+        return self
+
+    def __imul__(self, __value: SupportsIndex, /) -> "ObservableList[_T]":
+        original_len = len(self)
+        if self.__indexes and index(__value) > 1:
+            self.__validate(list(self) * (index(__value) - 1), ())
+        list.__imul__(self, __value)
+        if (
+            not (self.collection_changed or self.__indexes)
+            or len(self) == original_len
+        ):
+            return self
+        if len(self) > original_len:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=self[original_len:],
+                new_starting_index=original_len,
+                new_count=len(self) - original_len,
+            )
+        else:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+        return self
+
+    def __rotate(self, __index: int, __count: int, __new_index: int) -> None:
+        if __index < __new_index:
+            stop = __new_index + __count
+            list.__setitem__(
+                self,
+                slice(__index, stop),
+                self[__index + __count : stop] + self[__index : __index + __count],
+            )
+        elif __new_index < __index:
+            stop = __index + __count
+            list.__setitem__(
+                self,
+                slice(__new_index, stop),
+                self[__index:stop] + self[__new_index:__index],
+            )
+
+    def __set_slice(self, __slice: slice, __iterable: Iterable[_T]) -> None:
+        __range = range(*__slice.indices(len(self)))
+        new_items = list(__iterable)
+        old_items = self[__slice]
+        if self.comparer is not None and __range.step == 1:
+            start, old_items, new_items = trim_unchanged(
+                self.comparer, __range.start, old_items, new_items
+            )
+            __range = range(start, start + len(old_items))
+            __slice = slice(__range.start, __range.stop)
+        if self.__indexes:
+            self.__validate(new_items, old_items)
+        list.__setitem__(self, __slice, new_items)
+        if __range.step == 1 or len(__range) <= 1:
+            start = __range.start
+        elif __range.step == -1:
+            start = __range[-1]
+            new_items.reverse()
+            old_items.reverse()
+        else:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+            return
+        if not old_items:
+            if new_items:
+                self.__on_collection_changed(
+                    NotifyCollectionChangedAction.ADD,
+                    new_items=new_items,
+                    new_starting_index=start,
+                    new_count=len(new_items),
+                )
+            return
+        if not new_items:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_starting_index=start,
+                old_items=old_items,
+                old_count=len(old_items),
+            )
+            return
+        self.__on_collection_changed(
+            NotifyCollectionChangedAction.REPLACE,
+            new_items=new_items,
+            new_starting_index=start,
+            old_starting_index=start,
+            old_items=old_items,
+            new_count=len(new_items),
+            old_count=len(old_items),
+        )
+
+    def __delete_slice(self, __slice: slice) -> None:
+        __range = range(*__slice.indices(len(self)))
+        old_items = self[__slice]
+        list.__delitem__(self, __slice)
+        if not old_items:
+            return
+        if __range.step == 1 or len(__range) == 1:
+            start = __range.start
+        elif __range.step == -1:
+            start = __range[-1]
+            old_items.reverse()
+        else:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+            return
+        self.__on_collection_changed(
+            NotifyCollectionChangedAction.REMOVE,
+            old_starting_index=start,
+            old_items=old_items,
+            old_count=len(old_items),
+        )
+
+    def create_index[_K](
+        self, __name: str, /, key: Callable[[_T], _K], *, unique: bool = False
+    ) -> CollectionIndex[_K, _T]:
+        if __name in self.__indexes:
+            raise ValueError(f"index {__name!r} already exists")
+        collection_index = CollectionIndex(__name, key, unique=unique)
+        collection_index._reset(self)
+        self.__indexes[__name] = collection_index
+        return collection_index
+
+    def get_index(self, __name: str, /) -> CollectionIndex:
+        return self.__indexes[__name]
+
+    def drop_index(self, __name: str, /) -> None:
+        del self.__indexes[__name]
+
+    def where(self, __predicate: Callable[[_T], Any], /) -> FilteredView[_T]:
+        return FilteredView(self, __predicate)
+
+    def select[_R](self, __selector: Callable[[_T], _R], /) -> MappedView[_R]:
+        return MappedView(self, __selector)
+
+    def order_by(
+        self, key: Callable[[_T], Any] | None = None, *, reverse: bool = False
+    ) -> SortedView[_T]:
+        return SortedView(self, key, reverse=reverse)
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        original_len = len(self)
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if changes:
+                self.collection_changed(
+                    self, self.__coalesce_changes(changes, original_len)
+                )
+
+    batch = suspend_notifications
+
+    def __coalesce_changes(
+        self, changes: list[NotifyCollectionChangedEventArgs], original_len: int
+    ) -> NotifyCollectionChangedEventArgs:
+        if len(changes) == 1:
+            return changes[0]
+        start = changes[0].new_starting_index
+        if isinstance(start, int) and 0 <= start <= original_len:
+            count = 0
+            for e in changes:
+                if (
+                    e.action != NotifyCollectionChangedAction.ADD
+                    or not start <= e.new_starting_index <= start + count
+                ):
+                    break
+                count += 1 if e.new_count is None else e.new_count
+            else:
+                if len(self) - original_len == count:
+                    return NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.ADD,
+                        new_items=self[start : start + count],
+                        new_starting_index=start,
+                        new_count=count,
+                    )
+        return NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+
     def __on_collection_changed(
         self, action: NotifyCollectionChangedAction, **kwargs
     ) -> None:
-        self.collection_changed(self, NotifyListChangedEventArgs(action, **kwargs))
+        if (
+            self.__suspended_changes is None
+            and not self.__indexes
+            and not self.collection_changed.handles(action)
+        ):
+            return
+        e = NotifyCollectionChangedEventArgs(action, **kwargs)
+        for collection_index in self.__indexes.values():
+            collection_index._on_changed(self, e)
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append(e)
+        else:
+            self.collection_changed(self, e)
+
+    def __validate(self, __new_items: Iterable[_T], __old_items: Iterable[_T]):
+        for collection_index in self.__indexes.values():
+            collection_index._validate(__new_items, __old_items)
@@ -0,0 +1,189 @@
+import copyreg
+from typing import Any, ClassVar, Self, SupportsIndex, get_origin
+
+from object_model.abc import EventArgs, EventProtocol
+from object_model.event import Event
+
+
+class PropertyChangedEventArgs(EventArgs):
+    __slots__ = ["__name", "__old_value", "__new_value"]
+
+    def __init__(self, name: str, old_value: Any, new_value: Any) -> None:
+        self.__name = name
+        self.__old_value = old_value
+        self.__new_value = new_value
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def old_value(self) -> Any:
+        return self.__old_value
+
+    @property
+    def new_value(self) -> Any:
+        return self.__new_value
+
+
+def _annotations(namespace: dict) -> dict[str, Any]:
+    if "__annotations__" in namespace:
+        return namespace["__annotations__"]
+    try:
+        import annotationlib
+    except ImportError:  # annotations are evaluated lazily from 3.14 on
+        return {}
+    annotate = annotationlib.get_annotate_from_class_namespace(namespace)
+    if annotate is None:
+        return {}
+    return annotationlib.call_annotate_function(
+        annotate, annotationlib.Format.FORWARDREF
+    )
+
+
+def _is_class_var(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+class _ObservableObjectMeta(type):
+    def __new__(mcls, name: str, bases: tuple, namespace: dict, **kwargs: Any):
+        fields = []
+        defaults = {}
+        for field, annotation in _annotations(namespace).items():
+            if _is_class_var(annotation):
+                continue
+            fields.append(field)
+            if field in namespace:
+                default = namespace.pop(field)
+                if isinstance(default, (list, dict, set)):
+                    raise ValueError(
+                        f"mutable default {type(default).__name__} for field "
+                        f"{field!r} is not allowed"
+                    )
+                defaults[field] = default
+        slots = namespace.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        namespace["__slots__"] = (*fields, *slots)
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        inherited = getattr(cls, "__observable_fields__", ())
+        cls.__observable_fields__ = (
+            *inherited,
+            *(field for field in fields if field not in inherited),
+        )
+        cls.__observable_defaults__ = {
+            **getattr(cls, "__observable_defaults__", {}),
+            **defaults,
+        }
+        cls.__notifying = None
+        return cls
+
+    def _notifying_class(cls) -> "_ObservableObjectMeta":
+        # Instances start out as the class they were created as, whose fields
+        # are plain slots; the first access to property_changed moves the
+        # instance to this subclass, which has the same layout and overrides
+        # each field with a notifying property.
+        notifying = cls.__notifying
+        if notifying is None:
+            namespace = {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+            }
+            for field in cls.__observable_fields__:
+                namespace[field] = _notifying_property(field, getattr(cls, field))
+            notifying = type(cls)(cls.__name__, (cls,), namespace)
+            notifying.__notifying = cls.__notifying = notifying
+        return notifying
+
+    def _plain_class(cls) -> "_ObservableObjectMeta":
+        return cls.__base__ if cls.__notifying is cls else cls
+
+
+class ObservableObject(metaclass=_ObservableObjectMeta):
+    __slots__ = ["__property_changed"]
+
+    def __init__(self, **kwargs: Any) -> None:
+        cls = type(self)
+        for name, value in cls.__observable_defaults__.items():
+            setattr(self, name, value)
+        fields = cls.__observable_fields__
+        for name, value in kwargs.items():
+            if name not in fields:
+                raise TypeError(
+                    f"{cls.__name__}() got an unexpected keyword argument {name!r}"
+                )
+            setattr(self, name, value)
+
+    @property
+    def property_changed(self) -> EventProtocol[Self]:
+        try:
+            return self.__property_changed
+        except AttributeError:
+            pass
+        event = self.__property_changed = Event()
+        self.__class__ = type(self)._notifying_class()
+        return event
+
+    @property_changed.setter
+    def property_changed(self, value: EventProtocol[Self]) -> None:
+        self.__property_changed = value
+        self.__class__ = type(self)._notifying_class()
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in type(self).__observable_fields__
+            if hasattr(self, name)
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple:
+        # The notifying subclass cannot be looked up by name, so instances are
+        # reduced as the class they were created as, without subscribers.
+        function, args, *rest = super().__reduce_ex__(protocol)
+        cls = type(self)
+        plain = cls._plain_class()
+        if plain is not cls:
+            if function is copyreg.__newobj__:
+                function = _new
+            args = tuple(plain if arg is cls else arg for arg in args)
+        if rest and isinstance(rest[0], tuple):
+            state, slots = rest[0]
+            slots = {
+                name: value
+                for name, value in slots.items()
+                if name != "_ObservableObject__property_changed"
+            }
+            rest[0] = (state, slots or None)
+        return (function, args, *rest)
+
+
+_get_property_changed = vars(ObservableObject)[
+    "_ObservableObject__property_changed"
+].__get__
+
+
+def _new(cls: type, *args: Any) -> Any:
+    return cls.__new__(cls, *args)
+
+
+def _notifying_property(name: str, slot: Any) -> property:
+    get = slot.__get__
+    set_ = slot.__set__
+
+    def setter(instance: ObservableObject, value: Any) -> None:
+        try:
+            old_value = get(instance)
+        except AttributeError:
+            old_value = None
+        set_(instance, value)
+        property_changed = _get_property_changed(instance)
+        if property_changed:
+            property_changed(
+                instance, PropertyChangedEventArgs(name, old_value, value)
+            )
+
+    return property(get, setter, slot.__delete__)
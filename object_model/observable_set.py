@@ -1,46 +1,31 @@
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
 from typing import Iterable
 
 from object_model.abc import NotifyCollectionChangedAction
-from object_model.event import EventArgs, Event
+from object_model.event import Event
+from object_model.indexes import CollectionIndex
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
 
 
-class NotifySetChangedEventArgs(EventArgs):
-    __slots__ = [
-        "__action",
-        "__new_items",
-        "__old_items",
-    ]
-
-    def __init__(
-        self,
-        action: NotifyCollectionChangedAction,
-        new_items: object | None = None,
-        old_items: object | None = None,
-    ):
-        self.__action = action
-        self.__new_items = new_items
-        self.__old_items = old_items
-
-    @property
-    def action(self) -> NotifyCollectionChangedAction:
-        return self.__action
-
-    @property
-    def new_items(self) -> object | None:
-        return self.__new_items
-
-    @property
-    def old_items(self) -> object | None:
-        return self.__old_items
+NotifySetChangedEventArgs = NotifyCollectionChangedEventArgs
 
 
 class ObservableSet[_T](set[_T]):
     def __init__(self, __iterable: Iterable[_T] = (), /):
         super().__init__(__iterable)
         self.collection_changed: Event[ObservableSet[_T]] = Event()
+        self.__indexes: dict[str, CollectionIndex] = {}
+        self.__suspended_changes: list[NotifyCollectionChangedEventArgs] | None = (
+            None
+        )
 
     def add(self, __object: _T, /) -> None:
-        if __object not in self:
+        if not (self.collection_changed or self.__indexes):
+            set.add(self, __object)
+        elif __object not in self:
+            for collection_index in self.__indexes.values():
+                collection_index._validate((__object,), ())
             set.add(self, __object)
             self.__on_collection_changed(
                 NotifyCollectionChangedAction.ADD,
@@ -49,10 +34,13 @@ class ObservableSet[_T](set[_T]):
 
     def clear(self) -> None:
         set.clear(self)
-        self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
 
     def discard(self, __object: _T, /) -> None:
-        if __object in self:
+        if not (self.collection_changed or self.__indexes):
+            set.discard(self, __object)
+        elif __object in self:
             set.discard(self, __object)
             self.__on_collection_changed(
                 NotifyCollectionChangedAction.REMOVE,
@@ -61,44 +49,143 @@ class ObservableSet[_T](set[_T]):
 
     def pop(self) -> _T:
         __object = set.pop(self)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_items=__object,
-        )
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_items=__object,
+            )
         return __object
 
     def remove(self, __object: _T, /) -> None:
         set.remove(self, __object)
-        self.__on_collection_changed(
-            NotifyCollectionChangedAction.REMOVE,
-            old_items=__object,
-        )
+        if self.collection_changed or self.__indexes:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_items=__object,
+            )
 
     def update(self, *s: Iterable[_T]) -> None:
-        new_items = set(*s).difference(self)
-        set.update(self, *s)
+        if not (self.collection_changed or self.__indexes):
+            set.update(self, *s)
+            return
+        new_items = set().union(*s)
+        new_items.difference_update(self)
+        for collection_index in self.__indexes.values():
+            collection_index._validate(new_items, ())
+        set.update(self, new_items)
+        if not new_items:
+            return
         self.__on_collection_changed(
             NotifyCollectionChangedAction.ADD,
             new_items=new_items,
         )
 
     def difference_update(self, *s: Iterable[_T]) -> None:
-        remove_items = set(*s).intersection(self)
-        set.difference_update(self, *s)
+        if not (self.collection_changed or self.__indexes):
+            set.difference_update(self, *s)
+            return
+        remove_items = self.intersection(set().union(*s))
+        set.difference_update(self, remove_items)
+        if not remove_items:
+            return
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
             old_items=remove_items,
         )
 
     def intersection_update(self, *s: Iterable[_T]) -> None:
-        remove_items = self.difference(*s)
-        set.intersection_update(self, *s)
+        if not (self.collection_changed or self.__indexes):
+            set.intersection_update(self, *s)
+            return
+        remove_items = self.difference(self.intersection(*s))
+        set.difference_update(self, remove_items)
+        if not remove_items:
+            return
         self.__on_collection_changed(
             NotifyCollectionChangedAction.REMOVE,
             old_items=remove_items,
         )
 
+    def create_index[_K](
+        self, __name: str, /, key: Callable[[_T], _K], *, unique: bool = False
+    ) -> CollectionIndex[_K, _T]:
+        if __name in self.__indexes:
+            raise ValueError(f"index {__name!r} already exists")
+        collection_index = CollectionIndex(__name, key, unique=unique)
+        collection_index._reset(self)
+        self.__indexes[__name] = collection_index
+        return collection_index
+
+    def get_index(self, __name: str, /) -> CollectionIndex:
+        return self.__indexes[__name]
+
+    def drop_index(self, __name: str, /) -> None:
+        del self.__indexes[__name]
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if changes:
+                self.collection_changed(self, self.__coalesce_changes(changes))
+
+    batch = suspend_notifications
+
+    def __coalesce_changes(
+        self, changes: list[NotifyCollectionChangedEventArgs]
+    ) -> NotifyCollectionChangedEventArgs:
+        if len(changes) == 1:
+            return changes[0]
+        action = changes[0].action
+        if action not in (
+            NotifyCollectionChangedAction.ADD,
+            NotifyCollectionChangedAction.REMOVE,
+        ) or any(e.action != action for e in changes):
+            return NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+        if action == NotifyCollectionChangedAction.ADD:
+            return NotifyCollectionChangedEventArgs(
+                action, new_items_factory=lambda: _merge_items(action, changes)
+            )
+        return NotifyCollectionChangedEventArgs(
+            action, old_items_factory=lambda: _merge_items(action, changes)
+        )
+
     def __on_collection_changed(
         self, __action: NotifyCollectionChangedAction, **kwargs
     ) -> None:
-        self.collection_changed(self, NotifySetChangedEventArgs(__action, **kwargs))
+        if (
+            self.__suspended_changes is None
+            and not self.__indexes
+            and not self.collection_changed.handles(__action)
+        ):
+            return
+        e = NotifyCollectionChangedEventArgs(__action, **kwargs)
+        for collection_index in self.__indexes.values():
+            collection_index._on_changed(self, e)
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append(e)
+        else:
+            self.collection_changed(self, e)
+
+
+def _merge_items(
+    action: NotifyCollectionChangedAction,
+    changes: list[NotifyCollectionChangedEventArgs],
+) -> set:
+    items = set()
+    for e in changes:
+        if action == NotifyCollectionChangedAction.ADD:
+            e_items = e.new_items
+        else:
+            e_items = e.old_items
+        if isinstance(e_items, set):
+            items.update(e_items)
+        else:
+            items.add(e_items)
+    return items
@@ -0,0 +1,502 @@
+import operator
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from object_model.abc import (
+    DispatcherProtocol,
+    EventArgs,
+    EventProtocol,
+    NotifyCollectionChangedAction,
+    SchedulerProtocol,
+    TimerHandleProtocol,
+)
+from object_model.event import Event
+from object_model.notify_collection_changed import (
+    NotifyCollectionChangedEventArgs,
+    sequence_splice,
+    trim_unchanged,
+)
+from object_model.schedulers import default_scheduler
+
+
+class _WindowedEvent[_T](Event[_T]):
+    __slots__ = [
+        "__source",
+        "__subscription",
+        "__interval",
+        "__scheduler",
+        "__timer",
+        "__deadline",
+        "__generation",
+        "_lock",
+    ]
+
+    def __init__(
+        self,
+        source: EventProtocol[_T],
+        interval: float,
+        *,
+        scheduler: SchedulerProtocol | None = None,
+        dispatcher: DispatcherProtocol | None = None,
+    ) -> None:
+        if interval < 0:
+            raise ValueError("interval must be non-negative")
+        super().__init__(dispatcher)
+        self.__source = source
+        self.__interval = interval
+        self.__scheduler = default_scheduler() if scheduler is None else scheduler
+        self.__timer: TimerHandleProtocol | None = None
+        self.__deadline = 0.0
+        self.__generation = 0
+        self._lock = threading.Lock()
+        self.__subscription = source.add(self._on_source_event)
+
+    @property
+    def source(self) -> EventProtocol[_T]:
+        return self.__source
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+    @property
+    def scheduler(self) -> SchedulerProtocol:
+        return self.__scheduler
+
+    def flush(self) -> None:
+        with self._lock:
+            self._cancel()
+            pending = self._take()
+        self._emit(pending)
+
+    def close(self) -> None:
+        self.__subscription.dispose()
+        with self._lock:
+            self._cancel()
+            self._take()
+
+    @property
+    def _scheduled(self) -> bool:
+        return self.__timer is not None
+
+    def _schedule(self) -> None:
+        self.__deadline = self.__scheduler.now() + self.__interval
+        self.__arm(self.__interval)
+
+    def _postpone(self) -> None:
+        # Moves the end of the window instead of replacing the timer, which on
+        # a threading scheduler would leave a sleeping thread behind per event.
+        if self.__timer is None:
+            self._schedule()
+        else:
+            self.__deadline = self.__scheduler.now() + self.__interval
+
+    def _cancel(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+    def _emit(self, __pending: list[tuple[_T, EventArgs]]) -> None:
+        for sender, e in __pending:
+            self(sender, e)
+
+    @abstractmethod
+    def _on_source_event(self, __sender: _T, __e: EventArgs) -> None:
+        pass
+
+    def _on_window_end(self) -> list[tuple[_T, EventArgs]]:
+        return self._take()
+
+    @abstractmethod
+    def _take(self) -> list[tuple[_T, EventArgs]]:
+        pass
+
+    def __on_timer(self, __generation: int) -> None:
+        with self._lock:
+            # A timer cancelled while its callback was already waiting on the
+            # lock must not close the window that replaced it.
+            if self.__timer is None or __generation != self.__generation:
+                return
+            remaining = self.__deadline - self.__scheduler.now()
+            if remaining > 0:
+                self.__arm(remaining)
+                return
+            self.__timer = None
+            pending = self._on_window_end()
+        self._emit(pending)
+
+    def __arm(self, __delay: float) -> None:
+        self.__generation += 1
+        generation = self.__generation
+        self.__timer = self.__scheduler.call_later(
+            __delay, lambda: self.__on_timer(generation)
+        )
+
+
+class ThrottledEvent[_T](_WindowedEvent[_T]):
+    __slots__ = ["__pending"]
+
+    def __init__(self, source: EventProtocol[_T], interval: float, **kwargs) -> None:
+        self.__pending: tuple[_T, EventArgs] | None = None
+        super().__init__(source, interval, **kwargs)
+
+    def _on_source_event(self, __sender: _T, __e: EventArgs) -> None:
+        with self._lock:
+            if self._scheduled:
+                self.__pending = (__sender, __e)
+                return
+            self._schedule()
+        self(__sender, __e)
+
+    def _on_window_end(self) -> list[tuple[_T, EventArgs]]:
+        pending = self._take()
+        if pending:
+            self._schedule()
+        return pending
+
+    def _take(self) -> list[tuple[_T, EventArgs]]:
+        pending, self.__pending = self.__pending, None
+        return [] if pending is None else [pending]
+
+
+class DebouncedEvent[_T](_WindowedEvent[_T]):
+    __slots__ = ["__pending"]
+
+    def __init__(self, source: EventProtocol[_T], interval: float, **kwargs) -> None:
+        self.__pending: tuple[_T, EventArgs] | None = None
+        super().__init__(source, interval, **kwargs)
+
+    def _on_source_event(self, __sender: _T, __e: EventArgs) -> None:
+        with self._lock:
+            self.__pending = (__sender, __e)
+            self._postpone()
+
+    def _take(self) -> list[tuple[_T, EventArgs]]:
+        pending, self.__pending = self.__pending, None
+        return [] if pending is None else [pending]
+
+
+class CoalescedEvent[_T](_WindowedEvent[_T]):
+    __slots__ = ["__changes"]
+
+    def __init__(self, source: EventProtocol[_T], interval: float, **kwargs) -> None:
+        self.__changes: list[tuple[_T, _Changes]] = []
+        super().__init__(source, interval, **kwargs)
+
+    def _on_source_event(self, __sender: _T, __e: EventArgs) -> None:
+        with self._lock:
+            for sender, changes in self.__changes:
+                if sender is __sender:
+                    break
+            else:
+                changes = _changes_for(__sender, __e)
+                self.__changes.append((__sender, changes))
+            changes.add(__sender, __e)
+            if not self._scheduled:
+                self._schedule()
+
+    def _take(self) -> list[tuple[_T, EventArgs]]:
+        pending, self.__changes = self.__changes, []
+        return [
+            (sender, e) for sender, changes in pending for e in changes.events(sender)
+        ]
+
+
+def throttle[_T](
+    event: EventProtocol[_T], interval: float, **kwargs
+) -> ThrottledEvent[_T]:
+    return ThrottledEvent(event, interval, **kwargs)
+
+
+def debounce[_T](
+    event: EventProtocol[_T], interval: float, **kwargs
+) -> DebouncedEvent[_T]:
+    return DebouncedEvent(event, interval, **kwargs)
+
+
+def coalesce[_T](
+    event: EventProtocol[_T], interval: float, **kwargs
+) -> CoalescedEvent[_T]:
+    return CoalescedEvent(event, interval, **kwargs)
+
+
+class _Changes(ABC):
+    __slots__ = []
+
+    @abstractmethod
+    def add(self, __sender: Any, __e: EventArgs) -> None:
+        pass
+
+    @abstractmethod
+    def events(self, __sender: Any) -> list[EventArgs]:
+        pass
+
+
+class _LastChange(_Changes):
+    __slots__ = ["__e"]
+
+    def __init__(self) -> None:
+        self.__e: EventArgs | None = None
+
+    def add(self, __sender: Any, __e: EventArgs) -> None:
+        self.__e = __e
+
+    def events(self, __sender: Any) -> list[EventArgs]:
+        return [] if self.__e is None else [self.__e]
+
+
+class _ResettableChanges(_Changes):
+    __slots__ = ["_reset"]
+
+    def __init__(self) -> None:
+        self._reset = False
+
+    def add(self, __sender: Any, __e: EventArgs) -> None:
+        if self._reset:
+            return
+        if __e.action == NotifyCollectionChangedAction.RESET:
+            self._reset = True
+            self._clear()
+        else:
+            self._add(__sender, __e)
+
+    def events(self, __sender: Any) -> list[EventArgs]:
+        if self._reset:
+            return [
+                NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+            ]
+        return self._events(__sender)
+
+    @abstractmethod
+    def _add(self, __sender: Any, __e: EventArgs) -> None:
+        pass
+
+    @abstractmethod
+    def _clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def _events(self, __sender: Any) -> list[EventArgs]:
+        pass
+
+
+class _SequenceChanges(_ResettableChanges):
+    __slots__ = ["__splices"]
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (index, old_items, new_items) splices, or (index, items, new_index)
+        # moves tagged by the action. Each change is merged into the previous
+        # splice when it falls inside the range that splice produced.
+        self.__splices: list[tuple] = []
+
+    def _add(self, __sender: Any, __e: EventArgs) -> None:
+        action = __e.action
+        if getattr(__sender, "maxlen", None) is not None:
+            self._reset = True
+            self._clear()
+        elif action == NotifyCollectionChangedAction.MOVE:
+            items = [__e.old_items] if __e.old_count is None else list(__e.old_items)
+            self.__splices.append(
+                (action, __e.old_starting_index, items, __e.new_starting_index)
+            )
+        else:
+            self.__splice(*sequence_splice(__e))
+
+    def _clear(self) -> None:
+        self.__splices.clear()
+
+    def _events(self, __sender: Any) -> list[EventArgs]:
+        events = []
+        for action, index, first, second in self.__splices:
+            if action == NotifyCollectionChangedAction.MOVE:
+                events.append(
+                    NotifyCollectionChangedEventArgs(
+                        action,
+                        new_items=first,
+                        new_starting_index=second,
+                        old_starting_index=index,
+                        old_items=first,
+                        new_count=len(first),
+                        old_count=len(first),
+                    )
+                )
+            elif not first:
+                events.append(
+                    NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.ADD,
+                        new_items=second,
+                        new_starting_index=index,
+                        new_count=len(second),
+                    )
+                )
+            elif not second:
+                events.append(
+                    NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.REMOVE,
+                        old_starting_index=index,
+                        old_items=first,
+                        old_count=len(first),
+                    )
+                )
+            else:
+                events.append(
+                    NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.REPLACE,
+                        new_items=second,
+                        new_starting_index=index,
+                        old_starting_index=index,
+                        old_items=first,
+                        new_count=len(second),
+                        old_count=len(first),
+                    )
+                )
+        return events
+
+    def __splice(self, __index: int, __old_items: list, __new_items: list) -> None:
+        splices = self.__splices
+        if splices and splices[-1][0] != NotifyCollectionChangedAction.MOVE:
+            _, index, old_items, new_items = splices[-1]
+            stop = __index + len(__old_items)
+            if index <= __index and stop <= index + len(new_items):
+                offset = __index - index
+                merged = (
+                    index,
+                    old_items,
+                    new_items[:offset] + __new_items + new_items[stop - index :],
+                )
+            elif __index <= index and index + len(new_items) <= stop:
+                offset = index - __index
+                merged = (
+                    __index,
+                    __old_items[:offset]
+                    + old_items
+                    + __old_items[offset + len(new_items) :],
+                    __new_items,
+                )
+            else:
+                merged = None
+            if merged is not None:
+                index, old_items, new_items = trim_unchanged(operator.is_, *merged)
+                if old_items or new_items:
+                    splices[-1] = (None, index, old_items, new_items)
+                else:
+                    splices.pop()
+                return
+        splices.append((None, __index, __old_items, __new_items))
+
+
+_MISSING = object()
+
+
+class _DictChanges(_ResettableChanges):
+    __slots__ = ["__originals"]
+
+    def __init__(self) -> None:
+        super().__init__()
+        # The value each touched key had before the window, or _MISSING.
+        self.__originals: dict[Any, Any] = {}
+
+    def _add(self, __sender: Any, __e: EventArgs) -> None:
+        originals = self.__originals
+        if __e.new_count is not None:
+            old_items = __e.old_items
+            for key in __e.new_items:
+                originals.setdefault(key, old_items.get(key, _MISSING))
+        elif __e.action == NotifyCollectionChangedAction.ADD:
+            originals.setdefault(__e.key, _MISSING)
+        else:
+            originals.setdefault(__e.key, __e.old_items)
+
+    def _clear(self) -> None:
+        self.__originals.clear()
+
+    def _events(self, __sender: Any) -> list[EventArgs]:
+        events = []
+        new_items = {}
+        old_items = {}
+        for key, original in self.__originals.items():
+            if key in __sender:
+                value = __sender[key]
+                if original is _MISSING:
+                    new_items[key] = value
+                elif original is not value:
+                    new_items[key] = value
+                    old_items[key] = original
+            elif original is not _MISSING:
+                events.append(
+                    NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.REMOVE,
+                        old_items=original,
+                        key=key,
+                    )
+                )
+        if new_items:
+            events.append(
+                NotifyCollectionChangedEventArgs(
+                    NotifyCollectionChangedAction.ADD,
+                    new_items=new_items,
+                    old_items=old_items,
+                    new_count=len(new_items),
+                    old_count=len(old_items),
+                )
+            )
+        return events
+
+
+class _SetChanges(_ResettableChanges):
+    __slots__ = ["__originals"]
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Whether each touched item was in the set before the window.
+        self.__originals: dict[Any, bool] = {}
+
+    def _add(self, __sender: Any, __e: EventArgs) -> None:
+        if __e.action == NotifyCollectionChangedAction.ADD:
+            items, present = __e.new_items, False
+        else:
+            items, present = __e.old_items, True
+        for item in items if isinstance(items, set) else (items,):
+            self.__originals.setdefault(item, present)
+
+    def _clear(self) -> None:
+        self.__originals.clear()
+
+    def _events(self, __sender: Any) -> list[EventArgs]:
+        removed = set()
+        added = set()
+        for item, present in self.__originals.items():
+            if present and item not in __sender:
+                removed.add(item)
+            elif not present and item in __sender:
+                added.add(item)
+        events = []
+        if removed:
+            events.append(
+                NotifyCollectionChangedEventArgs(
+                    NotifyCollectionChangedAction.REMOVE, old_items=removed
+                )
+            )
+        if added:
+            events.append(
+                NotifyCollectionChangedEventArgs(
+                    NotifyCollectionChangedAction.ADD, new_items=added
+                )
+            )
+        return events
+
+
+def _changes_for(sender: Any, e: EventArgs) -> _Changes:
+    if not isinstance(e, NotifyCollectionChangedEventArgs):
+        return _LastChange()
+    if isinstance(sender, dict):
+        return _DictChanges()
+    if isinstance(sender, (set, frozenset)):
+        return _SetChanges()
+    if isinstance(sender, (Sequence, deque)):
+        return _SequenceChanges()
+    return _LastChange()
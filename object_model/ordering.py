@@ -0,0 +1,11 @@
+from typing import Any
+
+
+class Descending:
+    __slots__ = ["value"]
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
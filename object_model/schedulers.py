@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from heapq import heappop, heappush
+from itertools import count
+
+from object_model.abc import SchedulerProtocol
+
+
+class TimerHandle:
+    __slots__ = ["__callback", "__release"]
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self.__callback: Callable[[], None] | None = callback
+        self.__release: Callable[[], None] | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__callback is None
+
+    def cancel(self) -> None:
+        self.__callback = None
+        release, self.__release = self.__release, None
+        if release is not None:
+            release()
+
+    def _bind(self, release: Callable[[], None]) -> None:
+        # Frees whatever is waiting to run the callback, e.g. a timer thread.
+        self.__release = release
+
+    def _run(self) -> None:
+        callback, self.__callback = self.__callback, None
+        if callback is not None:
+            callback()
+
+
+class ThreadingScheduler(SchedulerProtocol):
+    __slots__ = []
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        timer = threading.Timer(delay, handle._run)
+        timer.daemon = True
+        handle._bind(timer.cancel)
+        timer.start()
+        return handle
+
+
+class AsyncioScheduler(SchedulerProtocol):
+    __slots__ = ["__loop"]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.__loop = asyncio.get_running_loop() if loop is None else loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.__loop
+
+    def now(self) -> float:
+        return self.__loop.time()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        loop = self.__loop
+        try:
+            running = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            running = False
+        if running:
+            loop.call_later(delay, handle._run)
+        else:
+            loop.call_soon_threadsafe(loop.call_later, delay, handle._run)
+        return handle
+
+
+class VirtualScheduler(SchedulerProtocol):
+    __slots__ = ["__now", "__timers", "__sequence"]
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.__now = start
+        self.__timers: list[tuple[float, int, TimerHandle]] = []
+        self.__sequence = count()
+
+    def now(self) -> float:
+        return self.__now
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        heappush(self.__timers, (self.__now + delay, next(self.__sequence), handle))
+        return handle
+
+    def advance(self, seconds: float) -> None:
+        target = self.__now + seconds
+        timers = self.__timers
+        while timers and timers[0][0] <= target:
+            due, _, handle = heappop(timers)
+            self.__now = due
+            handle._run()
+        self.__now = target
+
+
+def default_scheduler() -> SchedulerProtocol:
+    try:
+        return AsyncioScheduler(asyncio.get_running_loop())
+    except RuntimeError:
+        return ThreadingScheduler()
@@ -0,0 +1,481 @@
+import sys
+from _operator import index
+from array import array
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from typing import Self, SupportsIndex
+
+from object_model.abc import EventProtocol, NotifyCollectionChangedAction
+from object_model.event import Event
+from object_model.notify_collection_changed import NotifyCollectionChangedEventArgs
+
+# The segment starts with the current length so that every process mapping it
+# sees the same size; the items follow, aligned to 8 bytes.
+_HEADER = Struct("<q")
+
+
+class SharedObservableList[_T: (int, float)]:
+    __slots__ = [
+        "collection_changed",
+        "__shared_memory",
+        "__typecode",
+        "__capacity",
+        "__data",
+        "__owner",
+        "__suspended_changes",
+    ]
+
+    def __init__(
+        self,
+        __typecode: str,
+        __iterable: Iterable[_T] = (),
+        /,
+        *,
+        capacity: int,
+        name: str | None = None,
+    ) -> None:
+        # The segment cannot grow once other processes have mapped it, so the
+        # maximum length is fixed up front and exceeding it raises BufferError.
+        items = array(__typecode, __iterable)
+        if capacity < len(items):
+            raise ValueError("capacity is smaller than the number of items")
+        shared_memory = SharedMemory(
+            name, create=True, size=_HEADER.size + max(capacity, 1) * items.itemsize
+        )
+        self.__setup(shared_memory, __typecode, owner=True)
+        self.__data[: len(items)] = memoryview(items)
+        self.__set_len(len(items))
+
+    @classmethod
+    def attach(cls, name: str, typecode: str) -> Self:
+        self = cls.__new__(cls)
+        self.__setup(_attach(name), typecode, owner=False)
+        return self
+
+    def __setup(self, shared_memory: SharedMemory, typecode: str, owner: bool) -> None:
+        itemsize = array(typecode).itemsize
+        self.__shared_memory = shared_memory
+        self.__typecode = typecode
+        self.__capacity = (shared_memory.size - _HEADER.size) // itemsize
+        self.__data = shared_memory.buf[
+            _HEADER.size : _HEADER.size + self.__capacity * itemsize
+        ].cast(typecode)
+        self.__owner = owner
+        self.collection_changed: EventProtocol[SharedObservableList[_T]] = Event()
+        self.__suspended_changes: list[NotifyCollectionChangedEventArgs] | None = (
+            None
+        )
+
+    @property
+    def name(self) -> str:
+        return self.__shared_memory.name
+
+    @property
+    def typecode(self) -> str:
+        return self.__typecode
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def buffer(self) -> memoryview:
+        return self.__data[: len(self)].toreadonly()
+
+    def tolist(self) -> list[_T]:
+        return self.__data[: len(self)].tolist()
+
+    def close(self) -> None:
+        self.__data.release()
+        self.__shared_memory.close()
+
+    def unlink(self) -> None:
+        self.__shared_memory.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self.__owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return type(self).attach, (self.name, self.__typecode)
+
+    def __len__(self) -> int:
+        return _HEADER.unpack_from(self.__shared_memory.buf)[0]
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self.__data[: len(self)])
+
+    def __contains__(self, __object: object, /) -> bool:
+        return __object in self.tolist()
+
+    def __getitem__(self, __index: SupportsIndex | slice, /) -> _T | list[_T]:
+        if isinstance(__index, slice):
+            return self.__data[: len(self)][__index].tolist()
+        return self.__data[_check_index(__index, len(self))]
+
+    def __eq__(self, __other: object, /) -> bool:
+        if isinstance(__other, SharedObservableList):
+            __other = __other.tolist()
+        if not isinstance(__other, list):
+            return NotImplemented
+        return self.tolist() == __other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__typecode!r}, {self.tolist()!r})"
+
+    def count(self, __value: _T, /) -> int:
+        return self.tolist().count(__value)
+
+    def index(
+        self,
+        __value: _T,
+        __start: SupportsIndex = 0,
+        __stop: SupportsIndex = sys.maxsize,
+        /,
+    ) -> int:
+        return self.tolist().index(__value, __start, __stop)
+
+    def append(self, __object: _T, /) -> None:
+        __index = len(self)
+        self.__splice(__index, 0, array(self.__typecode, (__object,)))
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=self.__data[__index],
+                new_starting_index=__index,
+            )
+
+    def clear(self) -> None:
+        self.__set_len(0)
+        if self.collection_changed:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def extend(self, __iterable: Iterable[_T], /) -> None:
+        self.insert_range(len(self), __iterable)
+
+    def insert(self, __index: SupportsIndex, __object: _T, /) -> None:
+        __index = slice(__index, __index).indices(len(self))[0]
+        self.__splice(__index, 0, array(self.__typecode, (__object,)))
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=self.__data[__index],
+                new_starting_index=__index,
+            )
+
+    def insert_range(self, __index: SupportsIndex, __iterable: Iterable[_T], /) -> None:
+        __index = slice(__index, __index).indices(len(self))[0]
+        new_items = array(self.__typecode, __iterable)
+        self.__splice(__index, 0, new_items)
+        if self.collection_changed and new_items:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.ADD,
+                new_items=new_items.tolist(),
+                new_starting_index=__index,
+                new_count=len(new_items),
+            )
+
+    def move(self, __old_index: SupportsIndex, __new_index: SupportsIndex, /) -> None:
+        __old_index = _check_index(__old_index, len(self))
+        __new_index = _check_index(__new_index, len(self))
+        moved_item = self.__data[__old_index]
+        self.__rotate(__old_index, 1, __new_index)
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.MOVE,
+                new_starting_index=__new_index,
+                old_starting_index=__old_index,
+                old_items=moved_item,
+            )
+
+    def move_range(
+        self, __index: SupportsIndex, __count: int, __new_index: SupportsIndex, /
+    ) -> None:
+        __index = index(__index)
+        __new_index = index(__new_index)
+        if __count < 0:
+            raise ValueError("count must be non-negative")
+        if not 0 <= __index <= len(self) - __count:
+            raise IndexError("list index out of range")
+        if not 0 <= __new_index <= len(self) - __count:
+            raise IndexError("list index out of range")
+        if __count == 0 or __index == __new_index:
+            return
+        self.__rotate(__index, __count, __new_index)
+        if self.collection_changed:
+            moved_items = self.__data[__new_index : __new_index + __count].tolist()
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.MOVE,
+                new_items=moved_items,
+                new_starting_index=__new_index,
+                old_starting_index=__index,
+                old_items=moved_items,
+                new_count=__count,
+                old_count=__count,
+            )
+
+    def pop(self, __index: SupportsIndex = -1, /) -> _T:
+        if not len(self):
+            raise IndexError("pop from empty list")
+        __index = _check_index(__index, len(self))
+        __object = self.__data[__index]
+        self.__splice(__index, 1, ())
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_starting_index=__index,
+                old_items=__object,
+            )
+        return __object
+
+    def remove(self, __object: _T, /) -> None:
+        self.pop(self.index(__object))
+
+    def remove_range(self, __index: SupportsIndex, __count: int, /) -> None:
+        if __count < 0:
+            raise ValueError("count must be non-negative")
+        __index = index(__index)
+        if __index < 0:
+            __index += len(self)
+        if __index < 0 or __index + __count > len(self):
+            raise IndexError("list index out of range")
+        self.__delitem__(slice(__index, __index + __count))
+
+    def reverse(self) -> None:
+        data = self.__data[: len(self)]
+        items = array(self.__typecode, data)
+        items.reverse()
+        data[:] = memoryview(items)
+        if self.collection_changed and len(items) > 1:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        data = self.__data[: len(self)]
+        data[:] = memoryview(
+            array(self.__typecode, sorted(data, key=key, reverse=reverse))
+        )
+        if self.collection_changed and len(data) > 1:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def __setitem__(
+        self, __index: SupportsIndex | slice, __object: _T | Iterable[_T], /
+    ) -> None:
+        if isinstance(__index, slice):
+            self.__set_slice(__index, __object)
+            return
+        __index = _check_index(__index, len(self))
+        original_item = self.__data[__index]
+        self.__data[__index : __index + 1] = memoryview(
+            array(self.__typecode, (__object,))
+        )
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REPLACE,
+                new_items=self.__data[__index],
+                new_starting_index=__index,
+                old_starting_index=__index,
+                old_items=original_item,
+            )
+
+    def __delitem__(self, __index: SupportsIndex | slice, /) -> None:
+        if isinstance(__index, slice):
+            self.__delete_slice(__index)
+        else:
+            self.pop(__index)
+
+    def __iadd__(self, __iterable: Iterable[_T], /) -> Self:
+        self.extend(__iterable)
+        return self
+
+    def __imul__(self, __value: SupportsIndex, /) -> Self:
+        __value = index(__value)
+        if __value <= 0:
+            if len(self):
+                self.clear()
+        elif __value > 1:
+            self.insert_range(len(self), self.tolist() * (__value - 1))
+        return self
+
+    def __set_len(self, __length: int) -> None:
+        _HEADER.pack_into(self.__shared_memory.buf, 0, __length)
+
+    def __splice(self, __index: int, __count: int, __items) -> None:
+        length = len(self)
+        new_length = length - __count + len(__items)
+        if new_length > self.__capacity:
+            raise BufferError(f"shared list capacity {self.__capacity} exceeded")
+        data = self.__data
+        stop = __index + len(__items)
+        if stop != __index + __count:
+            data[stop:new_length] = data[__index + __count : length]
+        if __items:
+            data[__index:stop] = memoryview(__items)
+        self.__set_len(new_length)
+
+    def __rotate(self, __index: int, __count: int, __new_index: int) -> None:
+        data = self.__data
+        block = array(self.__typecode, data[__index : __index + __count])
+        if __index < __new_index:
+            data[__index:__new_index] = data[__index + __count : __new_index + __count]
+        elif __new_index < __index:
+            data[__new_index + __count : __index + __count] = data[__new_index:__index]
+        else:
+            return
+        data[__new_index : __new_index + __count] = memoryview(block)
+
+    def __set_slice(self, __slice: slice, __iterable: Iterable[_T]) -> None:
+        __range = range(*__slice.indices(len(self)))
+        new_items = array(self.__typecode, __iterable)
+        if __range.step == 1:
+            old_items = self.__data[__range.start : __range.stop].tolist()
+            self.__splice(__range.start, len(old_items), new_items)
+            if not self.collection_changed:
+                return
+            if not old_items:
+                if new_items:
+                    self.__on_collection_changed(
+                        NotifyCollectionChangedAction.ADD,
+                        new_items=new_items.tolist(),
+                        new_starting_index=__range.start,
+                        new_count=len(new_items),
+                    )
+            elif not new_items:
+                self.__on_collection_changed(
+                    NotifyCollectionChangedAction.REMOVE,
+                    old_starting_index=__range.start,
+                    old_items=old_items,
+                    old_count=len(old_items),
+                )
+            else:
+                self.__on_collection_changed(
+                    NotifyCollectionChangedAction.REPLACE,
+                    new_items=new_items.tolist(),
+                    new_starting_index=__range.start,
+                    old_starting_index=__range.start,
+                    old_items=old_items,
+                    new_count=len(new_items),
+                    old_count=len(old_items),
+                )
+            return
+        if len(new_items) != len(__range):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(new_items)} "
+                f"to extended slice of size {len(__range)}"
+            )
+        self.__data[: len(self)][__slice] = memoryview(new_items)
+        if self.collection_changed and new_items:
+            self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+
+    def __delete_slice(self, __slice: slice) -> None:
+        __range = range(*__slice.indices(len(self)))
+        if not __range:
+            return
+        if __range.step == 1 or len(__range) == 1:
+            start = __range.start
+        elif __range.step == -1:
+            start = __range[-1]
+        else:
+            removed = set(__range)
+            items = array(
+                self.__typecode,
+                (item for i, item in enumerate(self) if i not in removed),
+            )
+            self.__data[: len(items)] = memoryview(items)
+            self.__set_len(len(items))
+            if self.collection_changed:
+                self.__on_collection_changed(NotifyCollectionChangedAction.RESET)
+            return
+        old_items = self.__data[start : start + len(__range)].tolist()
+        self.__splice(start, len(old_items), ())
+        if self.collection_changed:
+            self.__on_collection_changed(
+                NotifyCollectionChangedAction.REMOVE,
+                old_starting_index=start,
+                old_items=old_items,
+                old_count=len(old_items),
+            )
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        if self.__suspended_changes is not None:
+            yield
+            return
+        self.__suspended_changes = []
+        original_len = len(self)
+        try:
+            yield
+        finally:
+            changes, self.__suspended_changes = self.__suspended_changes, None
+            if changes:
+                self.collection_changed(
+                    self, self.__coalesce_changes(changes, original_len)
+                )
+
+    batch = suspend_notifications
+
+    def __coalesce_changes(
+        self, changes: list[NotifyCollectionChangedEventArgs], original_len: int
+    ) -> NotifyCollectionChangedEventArgs:
+        if len(changes) == 1:
+            return changes[0]
+        start = changes[0].new_starting_index
+        if isinstance(start, int) and 0 <= start <= original_len:
+            count = 0
+            for e in changes:
+                if (
+                    e.action != NotifyCollectionChangedAction.ADD
+                    or not start <= e.new_starting_index <= start + count
+                ):
+                    break
+                count += 1 if e.new_count is None else e.new_count
+            else:
+                if len(self) - original_len == count:
+                    return NotifyCollectionChangedEventArgs(
+                        NotifyCollectionChangedAction.ADD,
+                        new_items=self[start : start + count],
+                        new_starting_index=start,
+                        new_count=count,
+                    )
+        return NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+
+    def __on_collection_changed(
+        self, action: NotifyCollectionChangedAction, **kwargs
+    ) -> None:
+        if (
+            self.__suspended_changes is None
+            and not self.collection_changed.handles(action)
+        ):
+            return
+        e = NotifyCollectionChangedEventArgs(action, **kwargs)
+        if self.__suspended_changes is not None:
+            self.__suspended_changes.append(e)
+        else:
+            self.collection_changed(self, e)
+
+
+def _check_index(__index: SupportsIndex, __length: int) -> int:
+    __index = index(__index)
+    if __index < 0:
+        __index += __length
+    if not 0 <= __index < __length:
+        raise IndexError("list index out of range")
+    return __index
+
+
+def _attach(name: str) -> SharedMemory:
+    # Attaching must not leave the segment registered with this process's
+    # resource tracker, or the tracker unlinks it when the process exits.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    shared_memory = SharedMemory(name)
+    resource_tracker.unregister(shared_memory._name, "shared_memory")
+    return shared_memory
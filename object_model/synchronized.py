@@ -0,0 +1,100 @@
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import wraps
+from threading import RLock
+
+from object_model.observable_deque import ObservableDeque
+from object_model.observable_dict import ObservableDict
+from object_model.observable_list import ObservableList
+from object_model.observable_set import ObservableSet
+
+
+def _synchronized[**_P, _R](method: Callable[_P, _R]) -> Callable[_P, _R]:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _SynchronizedMixin:
+    def __init__(self, *args, **kwargs) -> None:
+        self.__lock = RLock()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def lock(self) -> RLock:
+        return self.__lock
+
+    @contextmanager
+    def suspend_notifications(self) -> Generator[None]:
+        with self.__lock, super().suspend_notifications():
+            yield
+
+    batch = suspend_notifications
+
+
+class SynchronizedObservableList[_T](_SynchronizedMixin, ObservableList[_T]):
+    append = _synchronized(ObservableList.append)
+    clear = _synchronized(ObservableList.clear)
+    create_index = _synchronized(ObservableList.create_index)
+    drop_index = _synchronized(ObservableList.drop_index)
+    extend = _synchronized(ObservableList.extend)
+    index = _synchronized(ObservableList.index)
+    insert = _synchronized(ObservableList.insert)
+    insert_range = _synchronized(ObservableList.insert_range)
+    move = _synchronized(ObservableList.move)
+    move_range = _synchronized(ObservableList.move_range)
+    pop = _synchronized(ObservableList.pop)
+    remove = _synchronized(ObservableList.remove)
+    remove_range = _synchronized(ObservableList.remove_range)
+    reverse = _synchronized(ObservableList.reverse)
+    sort = _synchronized(ObservableList.sort)
+    __setitem__ = _synchronized(ObservableList.__setitem__)
+    __delitem__ = _synchronized(ObservableList.__delitem__)
+    __iadd__ = _synchronized(ObservableList.__iadd__)
+    __imul__ = _synchronized(ObservableList.__imul__)
+
+
+class SynchronizedObservableDeque[_T](_SynchronizedMixin, ObservableDeque[_T]):
+    append = _synchronized(ObservableDeque.append)
+    appendleft = _synchronized(ObservableDeque.appendleft)
+    clear = _synchronized(ObservableDeque.clear)
+    extend = _synchronized(ObservableDeque.extend)
+    extendleft = _synchronized(ObservableDeque.extendleft)
+    insert = _synchronized(ObservableDeque.insert)
+    move = _synchronized(ObservableDeque.move)
+    pop = _synchronized(ObservableDeque.pop)
+    popleft = _synchronized(ObservableDeque.popleft)
+    remove = _synchronized(ObservableDeque.remove)
+    reverse = _synchronized(ObservableDeque.reverse)
+    rotate = _synchronized(ObservableDeque.rotate)
+    __setitem__ = _synchronized(ObservableDeque.__setitem__)
+    __delitem__ = _synchronized(ObservableDeque.__delitem__)
+
+
+class SynchronizedObservableDict[_KT, _VT](
+    _SynchronizedMixin, ObservableDict[_KT, _VT]
+):
+    clear = _synchronized(ObservableDict.clear)
+    observe_key = _synchronized(ObservableDict.observe_key)
+    pop = _synchronized(ObservableDict.pop)
+    popitem = _synchronized(ObservableDict.popitem)
+    unobserve_key = _synchronized(ObservableDict.unobserve_key)
+    update = _synchronized(ObservableDict.update)
+    __setitem__ = _synchronized(ObservableDict.__setitem__)
+    __delitem__ = _synchronized(ObservableDict.__delitem__)
+
+
+class SynchronizedObservableSet[_T](_SynchronizedMixin, ObservableSet[_T]):
+    add = _synchronized(ObservableSet.add)
+    clear = _synchronized(ObservableSet.clear)
+    create_index = _synchronized(ObservableSet.create_index)
+    drop_index = _synchronized(ObservableSet.drop_index)
+    discard = _synchronized(ObservableSet.discard)
+    pop = _synchronized(ObservableSet.pop)
+    remove = _synchronized(ObservableSet.remove)
+    update = _synchronized(ObservableSet.update)
+    difference_update = _synchronized(ObservableSet.difference_update)
+    intersection_update = _synchronized(ObservableSet.intersection_update)
@@ -0,0 +1,295 @@
+from abc import abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from itertools import compress
+from operator import itemgetter
+from typing import Any, overload
+
+from object_model.abc import EventArgs, EventProtocol, NotifyCollectionChangedAction
+from object_model.event import Event
+from object_model.notify_collection_changed import (
+    NotifyCollectionChangedEventArgs,
+    sequence_splice,
+)
+from object_model.ordering import Descending
+
+
+class _View[_T](Sequence[_T]):
+    def __init__(self, source) -> None:
+        self._items: list[_T] = []
+        self.collection_changed: EventProtocol[_View[_T]] = Event()
+        self.__source = source
+        self._reset(list(source))
+        source.collection_changed += self.__on_source_changed
+
+    @property
+    def source(self):
+        return self.__source
+
+    def close(self) -> None:
+        self.__source.collection_changed -= self.__on_source_changed
+
+    def where(self, __predicate: Callable[[_T], Any], /) -> "FilteredView[_T]":
+        return FilteredView(self, __predicate)
+
+    def select[_R](self, __selector: Callable[[_T], _R], /) -> "MappedView[_R]":
+        return MappedView(self, __selector)
+
+    def order_by(
+        self, key: Callable[[_T], Any] | None = None, *, reverse: bool = False
+    ) -> "SortedView[_T]":
+        return SortedView(self, key, reverse=reverse)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._items)
+
+    @overload
+    def __getitem__(self, __index: int, /) -> _T: ...
+
+    @overload
+    def __getitem__(self, __index: slice, /) -> list[_T]: ...
+
+    def __getitem__(self, __index, /):
+        return self._items[__index]
+
+    def __eq__(self, __other: object, /) -> bool:
+        if isinstance(__other, _View):
+            __other = __other._items
+        return self._items == __other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+    @abstractmethod
+    def _reset(self, __items: list) -> None:
+        pass
+
+    @abstractmethod
+    def _splice(
+        self, __index: int, __old_items: list, __new_items: list, __single: bool
+    ) -> None:
+        pass
+
+    def _move(self, __index: int, __count: int, __new_index: int, __single: bool):
+        items = self._items
+        block = items[__index : __index + __count]
+        del items[__index : __index + __count]
+        items[__new_index:__new_index] = block
+        self._notify_move(__index, block, __new_index, __single)
+
+    def _notify_reset(self) -> None:
+        if self.collection_changed.handles(NotifyCollectionChangedAction.RESET):
+            self.collection_changed(
+                self,
+                NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET),
+            )
+
+    def _notify_splice(
+        self, __index: int, __old_items: list, __new_items: list, __single: bool
+    ) -> None:
+        if not self.collection_changed or not (__old_items or __new_items):
+            return
+        if __old_items and __new_items:
+            action = NotifyCollectionChangedAction.REPLACE
+        elif __new_items:
+            action = NotifyCollectionChangedAction.ADD
+        else:
+            action = NotifyCollectionChangedAction.REMOVE
+        if not self.collection_changed.handles(action):
+            return
+        kwargs = {}
+        if __new_items:
+            kwargs["new_starting_index"] = __index
+            if __single:
+                kwargs["new_items"] = __new_items[0]
+            else:
+                kwargs["new_items"] = __new_items
+                kwargs["new_count"] = len(__new_items)
+        if __old_items:
+            kwargs["old_starting_index"] = __index
+            if __single:
+                kwargs["old_items"] = __old_items[0]
+            else:
+                kwargs["old_items"] = __old_items
+                kwargs["old_count"] = len(__old_items)
+        e = NotifyCollectionChangedEventArgs(action, **kwargs)
+        self.collection_changed(self, e)
+
+    def _notify_move(
+        self, __index: int, __items: list, __new_index: int, __single: bool
+    ) -> None:
+        if not __items or __index == __new_index:
+            return
+        if not self.collection_changed.handles(NotifyCollectionChangedAction.MOVE):
+            return
+        if __single:
+            e = NotifyCollectionChangedEventArgs(
+                NotifyCollectionChangedAction.MOVE,
+                new_starting_index=__new_index,
+                old_starting_index=__index,
+                old_items=__items[0],
+            )
+        else:
+            e = NotifyCollectionChangedEventArgs(
+                NotifyCollectionChangedAction.MOVE,
+                new_items=__items,
+                new_starting_index=__new_index,
+                old_starting_index=__index,
+                old_items=__items,
+                new_count=len(__items),
+                old_count=len(__items),
+            )
+        self.collection_changed(self, e)
+
+    def __on_source_changed(self, sender, e: EventArgs) -> None:
+        action = e.action
+        if (
+            action == NotifyCollectionChangedAction.RESET
+            or getattr(sender, "maxlen", None) is not None
+        ):
+            self._reset(list(sender))
+        elif action == NotifyCollectionChangedAction.MOVE:
+            if e.old_count is None:
+                self._move(e.old_starting_index, 1, e.new_starting_index, True)
+            else:
+                self._move(
+                    e.old_starting_index, e.old_count, e.new_starting_index, False
+                )
+        else:
+            self._splice(
+                *sequence_splice(e), e.new_count is None and e.old_count is None
+            )
+
+
+class FilteredView[_T](_View[_T]):
+    def __init__(self, source, predicate: Callable[[_T], Any]) -> None:
+        self.__predicate = predicate
+        # One byte per source item: 1 where the item passes the predicate.
+        # count(1, 0, i) maps a source index to a view index.
+        self.__mask = bytearray()
+        super().__init__(source)
+
+    def _reset(self, __items: list) -> None:
+        self.__mask = bytearray(map(bool, map(self.__predicate, __items)))
+        self._items = list(compress(__items, self.__mask))
+        self._notify_reset()
+
+    def _splice(
+        self, __index: int, __old_items: list, __new_items: list, __single: bool
+    ) -> None:
+        mask = self.__mask
+        stop = __index + len(__old_items)
+        view_index = mask.count(1, 0, __index)
+        view_stop = view_index + mask.count(1, __index, stop)
+        flags = bytearray(map(bool, map(self.__predicate, __new_items)))
+        mask[__index:stop] = flags
+        new_items = list(compress(__new_items, flags))
+        old_items = self._items[view_index:view_stop]
+        self._items[view_index:view_stop] = new_items
+        self._notify_splice(view_index, old_items, new_items, __single)
+
+    def _move(self, __index: int, __count: int, __new_index: int, __single: bool):
+        mask = self.__mask
+        view_index = mask.count(1, 0, __index)
+        block = mask[__index : __index + __count]
+        del mask[__index : __index + __count]
+        view_new_index = mask.count(1, 0, __new_index)
+        mask[__new_index:__new_index] = block
+        count = block.count(1)
+        if count:
+            super()._move(view_index, count, view_new_index, __single)
+
+
+class MappedView[_T](_View[_T]):
+    def __init__(self, source, selector: Callable[[Any], _T]) -> None:
+        self.__selector = selector
+        super().__init__(source)
+
+    def _reset(self, __items: list) -> None:
+        self._items = list(map(self.__selector, __items))
+        self._notify_reset()
+
+    def _splice(
+        self, __index: int, __old_items: list, __new_items: list, __single: bool
+    ) -> None:
+        stop = __index + len(__old_items)
+        new_items = list(map(self.__selector, __new_items))
+        old_items = self._items[__index:stop]
+        self._items[__index:stop] = new_items
+        self._notify_splice(__index, old_items, new_items, __single)
+
+
+class SortedView[_T](_View[_T]):
+    def __init__(
+        self,
+        source,
+        key: Callable[[_T], Any] | None = None,
+        *,
+        reverse: bool = False,
+    ) -> None:
+        self.__key = key
+        self.__reverse = reverse
+        self.__keys: list = []
+        super().__init__(source)
+
+    def _reset(self, __items: list) -> None:
+        pairs = sorted(zip(map(self.__sort_key, __items), __items), key=itemgetter(0))
+        self.__keys = [key for key, _ in pairs]
+        self._items = [item for _, item in pairs]
+        self._notify_reset()
+
+    def _splice(
+        self, __index: int, __old_items: list, __new_items: list, __single: bool
+    ) -> None:
+        if len(__old_items) == len(__new_items) == 1:
+            old_index = self.__remove(__old_items[0])
+            new_index = self.__insert(__new_items[0])
+            if old_index == new_index:
+                self._notify_splice(new_index, __old_items, __new_items, True)
+            else:
+                self._notify_splice(old_index, __old_items, [], True)
+                self._notify_splice(new_index, [], __new_items, True)
+            return
+        for item in __old_items:
+            self._notify_splice(self.__remove(item), [item], [], True)
+        for item in __new_items:
+            self._notify_splice(self.__insert(item), [], [item], True)
+
+    def _move(self, __index: int, __count: int, __new_index: int, __single: bool):
+        pass
+
+    def __sort_key(self, __item: _T) -> Any:
+        key = __item if self.__key is None else self.__key(__item)
+        return Descending(key) if self.__reverse else key
+
+    def __insert(self, __item: _T) -> int:
+        key = self.__sort_key(__item)
+        index = bisect_right(self.__keys, key)
+        self.__keys.insert(index, key)
+        self._items.insert(index, __item)
+        return index
+
+    def __remove(self, __item: _T) -> int:
+        index = self.__find(__item)
+        del self.__keys[index]
+        del self._items[index]
+        return index
+
+    def __find(self, __item: _T) -> int:
+        items = self._items
+        key = self.__sort_key(__item)
+        start = bisect_left(self.__keys, key)
+        stop = bisect_right(self.__keys, key, start)
+        for index in range(start, stop):
+            if items[index] is __item:
+                return index
+        for index in range(start, stop):
+            if items[index] == __item:
+                return index
+        # The item's key changed after it was added; fall back to a scan.
+        return items.index(__item)
@@ -0,0 +1,148 @@
+import random
+from collections import Counter
+from math import fsum
+from unittest import TestCase
+
+from object_model import (
+    Count,
+    GroupBy,
+    Max,
+    Min,
+    ObservableDict,
+    ObservableList,
+    ObservableSet,
+    Sum,
+)
+from object_model.aggregates import _Aggregate
+
+
+class TestAggregates(TestCase):
+    def test_list(self):
+        rng = random.Random(4)
+        collection = ObservableList(rng.randrange(50) for _ in range(30))
+        count = Count(collection, lambda x: x % 3 == 0)
+        total = Sum(collection)
+        squares = Sum(collection, lambda x: x * x)
+        smallest = Min(collection)
+        largest = Max(collection)
+        groups = GroupBy(collection, lambda x: x % 5)
+        for _ in range(2000):
+            operation = rng.randrange(6)
+            index = rng.randrange(len(collection) or 1)
+            value = rng.randrange(50)
+            if operation == 0 or not collection:
+                collection.append(value)
+            elif operation == 1:
+                collection.pop(index)
+            elif operation == 2:
+                collection[index] = value
+            elif operation == 3:
+                collection[index : index + 3] = [value] * rng.randrange(4)
+            elif operation == 4:
+                collection.move(index, rng.randrange(len(collection)))
+            elif rng.random() < 0.05:
+                collection.clear()
+            self.assertEqual(count.value, sum(1 for x in collection if x % 3 == 0))
+            self.assertEqual(total.value, sum(collection))
+            self.assertEqual(squares.value, sum(x * x for x in collection))
+            self.assertEqual(smallest.value, min(collection, default=None))
+            self.assertEqual(largest.value, max(collection, default=None))
+            self.assertEqual(groups.value, Counter(x % 5 for x in collection))
+
+    def test_float_sum(self):
+        collection = ObservableList([1e16, 1.0])
+        total = Sum(collection)
+        events = []
+        total.value_changed += lambda sender, e: events.append(e.new_value)
+        collection.pop(0)
+        self.assertEqual(total.value, 1.0)
+        self.assertEqual(events, [1.0])
+        collection.extend([0.1] * 10)
+        collection[1:] = []
+        self.assertEqual(total.value, 1.0)
+        self.assertEqual(events, [1.0, 2.0, 1.0])
+        collection.append(float("inf"))
+        self.assertEqual(total.value, float("inf"))
+        collection.pop()
+        self.assertEqual(total.value, 1.0)
+        rng = random.Random(5)
+        collection[:] = [
+            rng.uniform(-1, 1) * 10.0 ** rng.randrange(-8, 16) for _ in range(200)
+        ]
+        for _ in range(200):
+            collection.pop(rng.randrange(len(collection)))
+            self.assertEqual(total.value, fsum(collection))
+
+    def test_value_changed(self):
+        collection = ObservableList([3, 1, 2])
+        smallest = Min(collection)
+        events = []
+        smallest.value_changed += lambda sender, e: events.append(
+            (e.old_value, e.new_value)
+        )
+        collection.append(5)
+        collection.append(1)
+        collection.remove(1)
+        self.assertEqual(events, [])
+        collection.remove(1)
+        collection.append(0)
+        self.assertEqual(events, [(1, 2), (2, 0)])
+
+    def test_group_events(self):
+        collection = ObservableList(["apple", "avocado", "banana"])
+        groups = GroupBy(collection, lambda x: x[0])
+        events = []
+        groups.value_changed += lambda sender, e: events.append(
+            (e.key, e.old_value, e.new_value)
+        )
+        collection[0] = "apricot"
+        self.assertEqual(events, [])
+        collection.append("cherry")
+        collection.remove("banana")
+        collection.clear()
+        self.assertEqual(events[:2], [("c", 0, 1), ("b", 1, 0)])
+        self.assertEqual(sorted(events[2:]), [("a", 2, 0), ("c", 1, 0)])
+        self.assertEqual(dict(groups.value), {})
+
+    def test_dict(self):
+        collection = ObservableDict(a=1, b=5)
+        total = Sum(collection)
+        largest = Max(collection)
+        collection["c"] = 7
+        collection["a"] = 10
+        collection.update(b=1, d=2)
+        del collection["c"]
+        collection.popitem()
+        with collection.batch():
+            collection["e"] = 3
+            collection["a"] = 4
+        self.assertEqual(total.value, sum(collection.values()))
+        self.assertEqual(largest.value, max(collection.values()))
+
+    def test_set(self):
+        collection = ObservableSet({1, 2, 3})
+        count = Count(collection)
+        smallest = Min(collection)
+        collection.update({0, 4})
+        collection.discard(0)
+        collection.difference_update({1, 9})
+        self.assertEqual(count.value, 3)
+        self.assertEqual(smallest.value, 2)
+
+    def test_incomplete_aggregate(self):
+        class Last(_Aggregate):
+            value = None
+
+            def _reset(self, values):
+                pass
+
+        with self.assertRaises(TypeError):
+            Last(ObservableList())
+
+    def test_close(self):
+        collection = ObservableList([1])
+        total = Sum(collection)
+        total.close()
+        collection.append(2)
+        self.assertEqual(total.value, 1)
+        self.assertFalse(collection.collection_changed)
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+from object_model import AsyncEvent, Backpressure, ObservableList
+from object_model.abc import NotifyCollectionChangedAction
+
+
+class TestAsyncEvent(IsolatedAsyncioTestCase):
+    async def test_fire(self):
+        calls = []
+        event = AsyncEvent()
+
+        async def slow(sender, e):
+            await asyncio.sleep(0.01)
+            calls.append("slow")
+
+        async def fast(sender, e):
+            calls.append("fast")
+
+        event += slow
+        event += fast
+        event.add(lambda sender, e: calls.append("sync"))
+        await event.fire(self, None)
+        self.assertEqual(calls, ["sync", "fast", "slow"])
+
+    async def test_queue(self):
+        events = []
+        collection = ObservableList("abc")
+        collection.collection_changed = AsyncEvent()
+
+        async def handler(sender, e):
+            events.append(e.action)
+
+        collection.collection_changed += handler
+        async with collection.collection_changed:
+            collection.append("d")
+            collection.pop(0)
+            self.assertEqual(events, [])
+        self.assertEqual(
+            events,
+            [NotifyCollectionChangedAction.ADD, NotifyCollectionChangedAction.REMOVE],
+        )
+
+    async def test_block_from_thread(self):
+        events = []
+        event = AsyncEvent(maxsize=1)
+        event += lambda sender, e: events.append(e)
+        async with event:
+            thread = threading.Thread(target=lambda: [event(self, i) for i in range(5)])
+            thread.start()
+            await asyncio.to_thread(thread.join)
+        self.assertEqual(events, list(range(5)))
+
+    async def test_block_in_loop(self):
+        event = AsyncEvent(maxsize=1)
+        event += lambda sender, e: None
+        event(self, None)
+        self.assertRaises(asyncio.QueueFull, event, self, None)
+
+    async def test_drop_oldest(self):
+        events = []
+        event = AsyncEvent(maxsize=2, backpressure=Backpressure.DROP_OLDEST)
+        event += lambda sender, e: events.append(e)
+        for i in range(5):
+            event(self, i)
+        async with event:
+            pass
+        self.assertEqual(events, [3, 4])
+
+    async def test_coalesce(self):
+        events = []
+        collection = ObservableList("abc")
+        collection.collection_changed = AsyncEvent(
+            maxsize=2, backpressure=Backpressure.COALESCE
+        )
+        collection.collection_changed += lambda sender, e: events.append(e.action)
+        for item in "defg":
+            collection.append(item)
+        async with collection.collection_changed:
+            pass
+        self.assertEqual(
+            events,
+            [NotifyCollectionChangedAction.RESET, NotifyCollectionChangedAction.ADD],
+        )
@@ -0,0 +1,149 @@
+import pickle
+from unittest import TestCase
+
+from object_model import (
+    BytesCodec,
+    ChangeEventCodec,
+    FloatCodec,
+    IntCodec,
+    NotifyCollectionChangedEventArgs,
+    ObservableDeque,
+    ObservableDict,
+    ObservableList,
+    ObservableSet,
+    StrCodec,
+)
+from object_model.abc import NotifyCollectionChangedAction
+
+FIELDS = (
+    "action",
+    "new_items",
+    "new_starting_index",
+    "old_starting_index",
+    "old_items",
+    "new_count",
+    "old_count",
+    "key",
+)
+
+
+def record(collection):
+    events = []
+    collection.collection_changed += lambda sender, e: events.append(e)
+    return events
+
+
+class TestChangeEventCodec(TestCase):
+    def assertRoundTrip(self, codec, events):
+        buffer = codec.encode_many(events)
+        decoded = list(codec.decode_many(memoryview(buffer)))
+        self.assertEqual(len(decoded), len(events))
+        for original, copy in zip(events, decoded):
+            for field in FIELDS:
+                self.assertEqual(getattr(copy, field), getattr(original, field))
+
+    def test_list_events(self):
+        collection = ObservableList(range(10))
+        events = record(collection)
+        collection.append([1, 2])
+        collection.insert(-1, None)
+        collection.pop(-2)
+        collection[0] = "x"
+        collection[1:3] = "abc"
+        del collection[::-1]
+        collection.extend(range(5))
+        collection.move(0, -1)
+        collection.move_range(0, 2, 3)
+        collection.clear()
+        self.assertRoundTrip(ChangeEventCodec(), events)
+
+    def test_dict_and_set_events(self):
+        dictionary = ObservableDict(a=1)
+        events = record(dictionary)
+        dictionary["b"] = {"nested": 1}
+        dictionary["a"] = 2
+        dictionary.update(a=3, c=4)
+        dictionary.popitem()
+        del dictionary["a"]
+        collection = ObservableSet("ab")
+        events += record(collection)
+        collection.add(frozenset("xy"))
+        collection.update("cd")
+        collection.difference_update("ac")
+        collection.discard("b")
+        self.assertRoundTrip(ChangeEventCodec(), events)
+
+    def test_item_codecs(self):
+        collection = ObservableDeque()
+        events = record(collection)
+        collection.extend(range(-100, 100))
+        collection.appendleft(2**70)
+        collection.popleft()
+        codec = ChangeEventCodec(IntCodec())
+        self.assertRoundTrip(codec, events)
+        self.assertLess(
+            len(codec.encode_many(events)),
+            len(ChangeEventCodec().encode_many(events)),
+        )
+        self.assertLess(
+            len(codec.encode_many(events)), len(pickle.dumps(events[0].new_items))
+        )
+        for item_codec, items in (
+            (FloatCodec(), [0.5, -1e300]),
+            (StrCodec(), ["", "ß€"]),
+            (BytesCodec(), [b"", b"\x00\xff"]),
+        ):
+            e = NotifyCollectionChangedEventArgs(
+                NotifyCollectionChangedAction.ADD,
+                new_items=items,
+                new_starting_index=0,
+                new_count=len(items),
+            )
+            self.assertRoundTrip(ChangeEventCodec(item_codec), [e])
+
+    def test_key_codec(self):
+        collection = ObservableDict()
+        events = record(collection)
+        collection["a"] = 1
+        collection.update(b=2, c=3)
+        codec = ChangeEventCodec(IntCodec(), StrCodec())
+        self.assertRoundTrip(codec, events)
+        self.assertEqual(len(codec.encode(events[0])), 5)
+
+    def test_single_event(self):
+        codec = ChangeEventCodec()
+        e = NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.RESET)
+        data = bytes(codec.encode(e))
+        self.assertEqual(len(data), 2)
+        self.assertEqual(codec.decode(data).action, NotifyCollectionChangedAction.RESET)
+        with self.assertRaises(ValueError):
+            codec.decode(data + data)
+
+    def test_decode_from_offset(self):
+        codec = ChangeEventCodec(IntCodec())
+        buffer = bytearray(b"header")
+        codec.encode(
+            NotifyCollectionChangedEventArgs(
+                NotifyCollectionChangedAction.REPLACE,
+                new_items=7,
+                new_starting_index=-1,
+                old_starting_index=-1,
+                old_items=3,
+            ),
+            buffer,
+        )
+        e, offset = codec.decode_from(memoryview(buffer), len(b"header"))
+        self.assertEqual(offset, len(buffer))
+        self.assertEqual((e.new_items, e.old_items), (7, 3))
+        self.assertEqual(e.new_starting_index, -1)
+
+    def test_truncated(self):
+        codec = ChangeEventCodec(FloatCodec())
+        data = codec.encode(
+            NotifyCollectionChangedEventArgs(
+                NotifyCollectionChangedAction.ADD, new_items=1.0, new_starting_index=0
+            )
+        )
+        for size in range(len(data)):
+            with self.assertRaises(ValueError):
+                codec.decode(data[:size])
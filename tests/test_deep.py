@@ -0,0 +1,175 @@
+import random
+from unittest import TestCase
+
+from object_model import DeepObserver, ObservableDict, ObservableList, ObservableSet
+from object_model.abc import NotifyCollectionChangedAction
+
+
+def resolve(root, path):
+    for key in path:
+        root = root[key]
+    return root
+
+
+class TestDeepObserver(TestCase):
+    def setUp(self):
+        self.root = ObservableDict(
+            orders=ObservableList(
+                ObservableDict(id=i, lines=ObservableList()) for i in range(5)
+            ),
+            tags=ObservableSet(),
+        )
+        self.observer = DeepObserver(self.root)
+        self.changes = []
+        self.observer.collection_changed += lambda sender, e: self.changes.append(
+            (sender, e.path, e.action)
+        )
+
+    def test_path(self):
+        lines = self.root["orders"][3]["lines"]
+        lines.append("a")
+        self.root["tags"].add("x")
+        self.root["orders"][0]["id"] = 10
+        self.assertEqual(
+            self.changes,
+            [
+                (lines, ("orders", 3, "lines"), NotifyCollectionChangedAction.ADD),
+                (self.root["tags"], ("tags",), NotifyCollectionChangedAction.ADD),
+                (
+                    self.root["orders"][0],
+                    ("orders", 0),
+                    NotifyCollectionChangedAction.REPLACE,
+                ),
+            ],
+        )
+        self.assertEqual(self.observer.path(lines), ("orders", 3, "lines"))
+        self.assertIsNone(self.observer.path(ObservableList()))
+
+    def test_positions_follow_changes(self):
+        orders = self.root["orders"]
+        lines = orders[3]["lines"]
+        orders.pop(0)
+        orders.insert(0, ObservableDict(id=-1, lines=ObservableList()))
+        orders.insert(0, ObservableDict(id=-2, lines=ObservableList()))
+        orders.move(4, 0)
+        self.changes.clear()
+        lines.append("a")
+        self.assertEqual(self.changes[0][1], ("orders", 0, "lines"))
+        orders.reverse()
+        self.changes.clear()
+        lines.append("b")
+        self.assertEqual(self.changes[0][1], ("orders", 5, "lines"))
+
+    def test_positions_without_scans(self):
+        scans = []
+
+        class ScannedList(ObservableList):
+            def __iter__(self):
+                scans.append(self)
+                return super().__iter__()
+
+        orders = ScannedList(ObservableList() for _ in range(6))
+        observer = DeepObserver(orders)
+        observer.collection_changed += lambda sender, e: self.changes.append(e.path)
+        lines = orders[3]
+        orders.insert(0, ObservableList())
+        orders.pop(1)
+        orders[:0] = [ObservableList(), ObservableList()]
+        del orders[0:1]
+        orders.move(4, 0)
+        orders.move_range(0, 2, 3)
+        orders.move(5, 1)
+        scans.clear()
+        self.changes.clear()
+        lines.append("a")
+        self.assertEqual(self.changes, [(orders.index(lines),)])
+        self.assertEqual(len(scans), 0)
+
+    def test_wiring(self):
+        orders = self.root["orders"]
+        order = ObservableDict(id=5, lines=ObservableList())
+        orders.append(order)
+        self.changes.clear()
+        order["lines"].append("a")
+        self.assertEqual(self.changes[0][1], ("orders", 5, "lines"))
+        removed = orders.pop(1)
+        replaced = orders[0]["lines"]
+        orders[0]["lines"] = ObservableList()
+        self.changes.clear()
+        removed["lines"].append("a")
+        replaced.append("a")
+        self.assertEqual(self.changes, [])
+        self.assertFalse(removed.collection_changed)
+        self.assertFalse(removed["lines"].collection_changed)
+        self.assertFalse(replaced.collection_changed)
+        orders[0]["lines"].append("a")
+        self.assertEqual(self.changes[0][1], ("orders", 0, "lines"))
+
+    def test_shared_child(self):
+        orders = self.root["orders"]
+        lines = orders[0]["lines"]
+        orders[1]["lines"] = lines
+        orders[1]["lines"] = ObservableList()
+        self.changes.clear()
+        lines.append("a")
+        self.assertEqual(len(self.changes), 1)
+        orders[0]["lines"] = ObservableList()
+        self.assertFalse(lines.collection_changed)
+
+    def test_reset_keeps_subtrees(self):
+        orders = self.root["orders"]
+        lines = orders[2]["lines"]
+        orders.sort(key=lambda order: -order["id"])
+        self.changes.clear()
+        lines.append("a")
+        self.assertEqual(self.changes[0][1], ("orders", 2, "lines"))
+        self.assertEqual(len(lines.collection_changed), 1)
+        orders.clear()
+        self.assertFalse(lines.collection_changed)
+
+    def test_random(self):
+        rng = random.Random(3)
+        orders = self.root["orders"]
+        collections = []
+
+        def collect(node, path):
+            collections.append((node, path))
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, (ObservableDict, ObservableList)):
+                    collect(value, path + (key,))
+
+        for step in range(500):
+            operation = rng.randrange(6)
+            size = len(orders)
+            order = ObservableDict(id=step, lines=ObservableList())
+            if operation == 0 or not orders:
+                orders.insert(rng.randrange(size + 1), order)
+            elif operation == 1:
+                orders.pop(rng.randrange(size))
+            elif operation == 2:
+                orders[rng.randrange(size)] = order
+            elif operation == 3:
+                orders.move(rng.randrange(size), rng.randrange(size))
+            elif operation == 4:
+                count = rng.randrange(size + 1)
+                start, new_start = (rng.randrange(size - count + 1) for _ in "ab")
+                orders.move_range(start, count, new_start)
+            else:
+                orders[rng.randrange(size)]["lines"] = ObservableList([step])
+            collections.clear()
+            collect(self.root, ())
+            node, path = rng.choice(collections)
+            self.changes.clear()
+            if isinstance(node, dict):
+                node["probe"] = step
+            else:
+                node.append(step)
+                node.pop()
+            self.assertEqual(self.changes[0][1], path)
+            self.assertIs(resolve(self.root, path), node)
+
+    def test_close(self):
+        self.observer.close()
+        self.assertFalse(self.root.collection_changed)
+        self.assertFalse(self.root["orders"][0]["lines"].collection_changed)
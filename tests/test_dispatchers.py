@@ -0,0 +1,100 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from object_model import (
+    ChangeJournal,
+    Event,
+    EventArgs,
+    ExecutorDispatcher,
+    InlineDispatcher,
+    ObservableDeque,
+    ObservableDict,
+    ObservableList,
+    ThreadDispatcher,
+)
+from object_model.dispatchers import _QueuedDispatcher
+
+
+class TestDispatchers(TestCase):
+    def setUp(self):
+        self.received = []
+        self.threads = set()
+
+    def handler(self, sender, e):
+        self.threads.add(threading.get_ident())
+        self.received.append(e)
+
+    def test_inline(self):
+        event = Event(InlineDispatcher())
+        event += self.handler
+        event(self, EventArgs())
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.threads, {threading.get_ident()})
+        self.assertTrue(event.join())
+
+    def test_incomplete_dispatcher(self):
+        class Unscheduled(_QueuedDispatcher):
+            pass
+
+        with self.assertRaises(TypeError):
+            Unscheduled()
+
+    def test_executor_keeps_order(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            collection = ObservableDict()
+            collection.collection_changed = Event(ExecutorDispatcher(executor))
+            collection.collection_changed += self.handler
+            for value in range(1000):
+                collection[value] = value
+            self.assertTrue(collection.collection_changed.join(timeout=5))
+        self.assertEqual([e.new_items for e in self.received], list(range(1000)))
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+    def test_thread_keeps_order(self):
+        dispatcher = ThreadDispatcher(name="object-model-test")
+        event = Event(dispatcher)
+        event += self.handler
+        args = [EventArgs() for _ in range(100)]
+        for e in args:
+            event(self, e)
+        self.assertTrue(event.join(timeout=5))
+        dispatcher.close()
+        self.assertEqual(self.received, args)
+        self.assertEqual(len(self.threads), 1)
+        self.assertNotIn(threading.get_ident(), self.threads)
+
+    def test_handler_error_does_not_stop_delivery(self):
+        def failing(sender, e):
+            raise RuntimeError
+
+        dispatcher = ThreadDispatcher()
+        event = Event(dispatcher)
+        event += failing
+        event += self.handler
+        with self.assertLogs("object_model.dispatchers"):
+            event(self, EventArgs())
+            event(self, EventArgs())
+            event.join(timeout=5)
+        dispatcher.close()
+        self.assertEqual(len(self.received), 2)
+
+    def test_queued_delivery_indices(self):
+        # Handlers run after later changes, so events must carry positions
+        # that do not depend on the length at delivery time.
+        for collection in (ObservableList(range(100)), ObservableDeque(range(100))):
+            dispatcher = ThreadDispatcher()
+            collection.collection_changed = Event(dispatcher)
+            view = collection.where(lambda value: True)
+            journal = ChangeJournal(collection)
+            for value in range(100, 105):
+                collection.pop()
+                collection.insert(-1, value)
+                collection[-2] = -value
+                del collection[-3]
+            self.assertTrue(collection.collection_changed.join(timeout=5))
+            dispatcher.close()
+            self.assertEqual(view, list(collection))
+            replayed = []
+            journal.replay(replayed)
+            self.assertEqual(replayed, list(collection))
@@ -0,0 +1,194 @@
+import tracemalloc
+from unittest import TestCase, mock
+
+from object_model import (
+    Event,
+    EventArgs,
+    NotifyCollectionChangedEventArgs,
+    ObservableList,
+)
+from object_model.abc import NotifyCollectionChangedAction
+
+
+class TestEvent(TestCase):
+    def setUp(self):
+        self.event = Event()
+        self.calls = []
+
+    def test_call(self):
+        self.event += lambda sender, e: self.calls.append(("first", sender))
+        self.event.add(lambda sender, e: self.calls.append(("second", sender)))
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, [("first", self), ("second", self)])
+
+    def test_remove(self):
+        def handler(sender, e):
+            self.calls.append(sender)
+
+        self.event += handler
+        self.event += handler
+        self.event -= handler
+        self.assertEqual(list(self.event), [handler])
+        self.event.remove(handler)
+        self.assertFalse(self.event)
+        self.assertRaises(ValueError, self.event.remove, handler)
+
+    def test_remove_during_dispatch(self):
+        def first(sender, e):
+            self.calls.append("first")
+            self.event.remove(first)
+
+        def second(sender, e):
+            self.calls.append("second")
+
+        self.event += first
+        self.event += second
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["first", "second"])
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["first", "second", "second"])
+
+    def test_add_during_dispatch(self):
+        def first(sender, e):
+            self.calls.append("first")
+            self.event.add(second)
+
+        def second(sender, e):
+            self.calls.append("second")
+
+        self.event += first
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["first"])
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["first", "first", "second"])
+
+    def test_weak_handler(self):
+        class Subscriber:
+            def __init__(self, calls):
+                self.calls = calls
+
+            def handle(self, sender, e):
+                self.calls.append(sender)
+
+        subscriber = Subscriber(self.calls)
+        self.event.add(subscriber.handle, weak=True)
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, [self])
+        self.assertEqual(list(self.event), [subscriber.handle])
+        del subscriber
+        self.assertFalse(self.event)
+
+        def handler(sender, e):
+            self.calls.append(sender)
+
+        self.event.add(handler, weak=True)
+        self.event.remove(handler)
+        self.assertFalse(self.event)
+        self.event.add(handler, weak=True)
+        del handler
+        self.assertFalse(self.event)
+
+    def test_weak_handler_leak(self):
+        class Subscriber:
+            def handle(self, sender, e):
+                pass
+
+        def churn(count):
+            for _ in range(count):
+                self.event.add(Subscriber().handle, weak=True)
+                self.assertLessEqual(len(tuple(self.event)), 1)
+
+        tracemalloc.start()
+        try:
+            churn(1000)
+            baseline, _ = tracemalloc.get_traced_memory()
+            churn(20000)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(size - baseline, 16 * 1024)
+        churn(1_000_000 - 21000)
+        self.assertFalse(self.event)
+
+    def test_subscription(self):
+        def handler(sender, e):
+            self.calls.append("handler")
+
+        first = self.event.add(handler)
+        self.event.add(lambda sender, e: self.calls.append("other"))
+        second = self.event.add(handler)
+        self.assertEqual(len(self.event), 3)
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["handler", "other", "handler"])
+        first.dispose()
+        first.dispose()
+        self.assertTrue(first.disposed)
+        self.calls.clear()
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["other", "handler"])
+        with second:
+            pass
+        self.assertEqual(len(self.event), 1)
+        self.assertRaises(ValueError, self.event.remove, handler)
+
+    def test_dispose_during_dispatch(self):
+        subscriptions = []
+
+        def first(sender, e):
+            self.calls.append("first")
+            for subscription in subscriptions:
+                subscription.dispose()
+
+        subscriptions.append(self.event.add(first))
+        subscriptions.append(
+            self.event.add(lambda sender, e: self.calls.append("second"))
+        )
+        self.event(self, EventArgs())
+        self.event(self, EventArgs())
+        self.assertEqual(self.calls, ["first", "second"])
+        self.assertFalse(self.event)
+
+    def test_actions(self):
+        def handler(sender, e):
+            self.calls.append(("all", e.action))
+
+        self.event.add(
+            lambda sender, e: self.calls.append(("remove", e.action)),
+            actions={NotifyCollectionChangedAction.REMOVE},
+        )
+        subscription = self.event.add(handler)
+        add = NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.ADD)
+        remove = NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.REMOVE)
+        self.event(self, add)
+        self.event(self, remove)
+        self.assertEqual(
+            self.calls,
+            [
+                ("all", NotifyCollectionChangedAction.ADD),
+                ("remove", NotifyCollectionChangedAction.REMOVE),
+                ("all", NotifyCollectionChangedAction.REMOVE),
+            ],
+        )
+        self.assertTrue(self.event.handles(NotifyCollectionChangedAction.ADD))
+        subscription.dispose()
+        self.assertFalse(self.event.handles(NotifyCollectionChangedAction.ADD))
+        self.assertTrue(self.event.handles(NotifyCollectionChangedAction.REMOVE))
+        self.calls.clear()
+        self.event(self, add)
+        self.assertEqual(self.calls, [])
+
+    def test_actions_skip_args(self):
+        collection = ObservableList([1, 2, 3])
+        events = []
+        collection.collection_changed.add(
+            lambda sender, e: events.append(e),
+            actions={NotifyCollectionChangedAction.REMOVE},
+        )
+        with mock.patch(
+            "object_model.observable_list.NotifyCollectionChangedEventArgs"
+        ) as args:
+            collection.append(4)
+            collection[0] = 0
+            args.assert_not_called()
+        collection.pop()
+        self.assertEqual([e.old_items for e in events], [4])
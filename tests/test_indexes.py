@@ -0,0 +1,170 @@
+import random
+from operator import attrgetter
+from unittest import TestCase
+
+from object_model import ObservableList, ObservableSet, SynchronizedObservableList
+
+
+class Item:
+    __slots__ = ["id", "group"]
+
+    def __init__(self, id, group):
+        self.id = id
+        self.group = group
+
+    def __eq__(self, other):
+        return isinstance(other, Item) and (self.id, self.group) == (
+            other.id,
+            other.group,
+        )
+
+    def __hash__(self):
+        return hash((self.id, self.group))
+
+    def __repr__(self):
+        return f"Item({self.id!r}, {self.group!r})"
+
+
+def expected_groups(collection):
+    groups = {}
+    for item in collection:
+        groups.setdefault(item.group, []).append(item)
+    return groups
+
+
+class TestIndexes(TestCase):
+    def test_list_consistency(self):
+        rng = random.Random(5)
+        collection = ObservableList(Item(i, i % 7) for i in range(30))
+        groups = collection.create_index("group", key=attrgetter("group"))
+        for step in range(3000):
+            operation = rng.randrange(11)
+            size = len(collection)
+            index = rng.randrange(-size, size or 1)
+            item = Item(step + 100, rng.randrange(7))
+            if operation == 0 or not collection:
+                collection.append(item)
+            elif operation == 1:
+                collection.insert(index, item)
+            elif operation == 2:
+                collection.pop(index)
+            elif operation == 3:
+                collection[index] = item
+            elif operation == 4:
+                collection.remove(collection[index])
+            elif operation == 5:
+                collection.move(index, rng.randrange(size))
+            elif operation == 6:
+                collection.extend(Item(-step, g) for g in range(rng.randrange(3)))
+            elif operation == 7:
+                collection[index : index + 2] = [item] * rng.randrange(3)
+            elif operation == 8:
+                del collection[::3]
+            elif operation == 9:
+                collection.sort(key=attrgetter("id"))
+            elif operation == 10:
+                with collection.batch():
+                    collection.append(item)
+                    self.assertIn(item, groups[item.group])
+                    collection.pop(0)
+            expected = expected_groups(collection)
+            self.assertEqual(
+                {group: sorted(groups[group], key=id) for group in groups},
+                {group: sorted(items, key=id) for group, items in expected.items()},
+            )
+            if collection and step % 5 == 0:
+                target = collection[rng.randrange(len(collection))]
+                self.assertEqual(
+                    collection.index(target), list(collection).index(target)
+                )
+
+    def test_unique(self):
+        collection = ObservableList([Item(1, "a"), Item(2, "b")])
+        ids = collection.create_index("id", key=attrgetter("id"), unique=True)
+        self.assertEqual(ids[2], Item(2, "b"))
+        self.assertIsNone(ids.get(3))
+        with self.assertRaises(ValueError):
+            collection.append(Item(1, "c"))
+        with self.assertRaises(ValueError):
+            collection.extend([Item(3, "c"), Item(3, "d")])
+        with self.assertRaises(ValueError):
+            collection *= 2
+        self.assertEqual(collection, [Item(1, "a"), Item(2, "b")])
+        collection[0] = Item(1, "z")
+        self.assertEqual(ids[1], Item(1, "z"))
+        with self.assertRaises(ValueError):
+            collection[0] = Item(2, "z")
+        collection[:] = [Item(2, "y"), Item(1, "x")]
+        self.assertEqual(ids[2], Item(2, "y"))
+        with self.assertRaises(ValueError):
+            ObservableList([Item(1, "a"), Item(1, "b")]).create_index(
+                "id", key=attrgetter("id"), unique=True
+            )
+
+    def test_index_lookup(self):
+        collection = ObservableList(Item(i, i % 3) for i in range(10))
+        collection.create_index("id", key=attrgetter("id"), unique=True)
+        self.assertEqual(collection.index(Item(7, 1)), 7)
+        self.assertEqual(collection.index(Item(7, 1), 3, 8), 7)
+        with self.assertRaises(ValueError):
+            collection.index(Item(7, 1), 8)
+        with self.assertRaises(ValueError):
+            collection.index(Item(7, 2))
+        with self.assertRaises(ValueError):
+            collection.remove(Item(42, 0))
+        with self.assertRaises(ValueError):
+            collection.index("not an item")
+
+    def test_index_matches_list_index(self):
+        # The key is the type, so 3.0 equals 3 but is filed under another key.
+        rng = random.Random(9)
+        collection = ObservableList(rng.randrange(20) for _ in range(200))
+        collection.create_index("type", key=type)
+        for step in range(300):
+            if step % 10 == 0:
+                collection.insert(rng.randrange(len(collection)), rng.randrange(20))
+                collection.pop(0)
+            value = rng.choice([rng.randrange(25), float(rng.randrange(25))])
+            start = rng.randrange(-50, 50)
+            try:
+                expected = list(collection).index(value, start)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    collection.index(value, start)
+            else:
+                self.assertEqual(collection.index(value, start), expected)
+        collection.remove(5.0)
+        self.assertEqual(collection.count(5), list(collection).count(5))
+
+    def test_set(self):
+        collection = ObservableSet(Item(i, i % 2) for i in range(6))
+        groups = collection.create_index("group", key=attrgetter("group"))
+        ids = collection.create_index("id", key=attrgetter("id"), unique=True)
+        collection.add(Item(6, 0))
+        collection.discard(Item(0, 0))
+        collection.update([Item(7, 1), Item(8, 0)])
+        collection.difference_update([Item(1, 1)])
+        self.assertEqual(
+            sorted(item.id for item in groups[0]),
+            sorted(item.id for item in collection if item.group == 0),
+        )
+        self.assertEqual(ids[7], Item(7, 1))
+        with self.assertRaises(ValueError):
+            collection.add(Item(7, 0))
+        with self.assertRaises(ValueError):
+            collection.update([Item(9, 0), Item(9, 1)])
+        self.assertNotIn(9, ids)
+        collection.clear()
+        self.assertEqual(len(groups), 0)
+
+    def test_indexes_registry(self):
+        collection = SynchronizedObservableList([Item(1, "a")])
+        ids = collection.create_index("id", key=attrgetter("id"))
+        self.assertIs(collection.get_index("id"), ids)
+        with self.assertRaises(ValueError):
+            collection.create_index("id", key=attrgetter("id"))
+        collection.drop_index("id")
+        collection.append(Item(2, "b"))
+        self.assertNotIn(2, ids)
+        with self.assertRaises(KeyError):
+            collection.get_index("id")
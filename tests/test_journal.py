@@ -0,0 +1,213 @@
+import random
+from collections import deque
+from unittest import TestCase
+
+from object_model import (
+    ChangeJournal,
+    ObservableDeque,
+    ObservableDict,
+    ObservableList,
+    ObservableSet,
+)
+from object_model.abc import NotifyCollectionChangedAction
+
+
+class TestChangeJournal(TestCase):
+    def test_list_replay(self):
+        collection = ObservableList(range(5))
+        journal = ChangeJournal(collection)
+        collection.append(5)
+        collection.insert(-1, "x")
+        collection.insert(100, "y")
+        collection.pop(-2)
+        collection.pop(0)
+        collection[-1] = "z"
+        collection[1:3] = "abc"
+        del collection[::-1]
+        collection.extend(range(10))
+        collection.remove_range(2, 3)
+        collection.move(0, -1)
+        collection.move_range(0, 2, 3)
+        del collection[-1]
+        collection.remove(collection[2])
+        collection.sort()
+        with collection.batch():
+            collection.append(1)
+            collection.append(2)
+        for target in ([], ObservableList(), deque(), ObservableDeque()):
+            journal.replay(target)
+            self.assertEqual(list(target), collection)
+
+    def test_random_operations(self):
+        rng = random.Random(1)
+        collection = ObservableList(range(20))
+        journal = ChangeJournal(collection)
+        replica = list(collection)
+        sequence = journal.last_sequence
+        for _ in range(500):
+            operation = rng.randrange(6)
+            index = rng.randrange(-len(collection), len(collection) or 1)
+            if operation == 0 or not collection:
+                collection.insert(index, rng.random())
+            elif operation == 1:
+                collection.pop(index)
+            elif operation == 2:
+                collection[index] = rng.random()
+            elif operation == 3:
+                collection.move(index, rng.randrange(len(collection)))
+            elif operation == 4:
+                collection[index : index + 3] = [rng.random()] * rng.randrange(4)
+            else:
+                collection.extend(rng.random() for _ in range(rng.randrange(3)))
+            if rng.random() < 0.1:
+                journal.compact()
+            if rng.random() < 0.2:
+                sequence = journal.replay(replica, sequence)
+                self.assertEqual(replica, collection)
+        journal.replay(replica, sequence)
+        self.assertEqual(replica, collection)
+
+    def test_deque_replay(self):
+        collection = ObservableDeque("ab")
+        journal = ChangeJournal(collection)
+        collection.append("c")
+        collection.appendleft("z")
+        collection.extend("de")
+        collection.extendleft("yx")
+        collection.insert(-1, "w")
+        collection.pop()
+        collection.popleft()
+        collection.remove("a")
+        collection[-1] = "v"
+        collection.move(0, 2)
+        del collection[1]
+        replica = deque()
+        journal.replay(replica)
+        self.assertEqual(replica, collection)
+
+    def test_bounded_deque_records_snapshots(self):
+        collection = ObservableDeque("ab", maxlen=3)
+        journal = ChangeJournal(collection)
+        collection.extend("cde")
+        collection.append("f")
+        self.assertTrue(
+            all(r.action == NotifyCollectionChangedAction.RESET for r in journal)
+        )
+        replica = deque(maxlen=3)
+        journal.replay(replica)
+        self.assertEqual(replica, collection)
+
+    def test_dict_replay(self):
+        collection = ObservableDict(a=1, b=2)
+        journal = ChangeJournal(collection)
+        collection["c"] = 3
+        collection["a"] = {"nested": True}
+        collection.update(b=20, d=4)
+        collection.pop("c")
+        del collection["d"]
+        collection.popitem()
+        with collection.batch():
+            collection["e"] = 5
+            collection["a"] = 10
+        collection[None] = {"x": 1}
+        replica = ObservableDict()
+        journal.replay(replica)
+        self.assertEqual(replica, collection)
+        self.assertEqual(list(replica), list(collection))
+
+    def test_set_replay(self):
+        collection = ObservableSet("ab")
+        journal = ChangeJournal(collection)
+        collection.add("c")
+        collection.add(frozenset("xy"))
+        collection.update("de")
+        collection.discard("a")
+        collection.difference_update("bz")
+        collection.intersection_update("cdex")
+        collection.pop()
+        replica = set()
+        journal.replay(replica)
+        self.assertEqual(replica, collection)
+
+    def test_since(self):
+        collection = ObservableList()
+        journal = ChangeJournal(collection)
+        start = journal.last_sequence
+        collection.append(1)
+        collection.append(2)
+        records = journal.since(start)
+        self.assertEqual([r.sequence for r in records], [start + 1, start + 2])
+        self.assertEqual(records[-1].payload, (2,))
+        self.assertEqual(journal.since(journal.last_sequence), [])
+
+    def test_capacity(self):
+        collection = ObservableList()
+        journal = ChangeJournal(collection, capacity=10)
+        for value in range(100):
+            collection.append(value)
+        self.assertLess(len(journal), 20)
+        with self.assertRaises(LookupError):
+            journal.since(0)
+        replica = list(range(100 - len(journal)))
+        journal.replay(replica, journal.first_sequence - 1)
+        self.assertEqual(replica, collection)
+
+    def test_compact_dict(self):
+        collection = ObservableDict(a=0)
+        journal = ChangeJournal(collection)
+        middle = None
+        for value in range(100):
+            collection["a"] = value
+            collection["b"] = value
+            if value == 50:
+                middle = journal.last_sequence
+        replica = dict(collection)
+        replica.update(a=50, b=50)
+        journal.compact()
+        self.assertEqual(len(journal), 4)
+        journal.replay(replica, middle)
+        self.assertEqual(replica, collection)
+        replica = {}
+        journal.replay(replica)
+        self.assertEqual(list(replica.items()), [("a", 99), ("b", 99)])
+
+    def test_compact_drops_history_before_reset(self):
+        collection = ObservableList(range(10))
+        journal = ChangeJournal(collection)
+        collection.append(10)
+        collection.clear()
+        collection.append(0)
+        collection[0] = 1
+        collection[0] = 2
+        journal.compact()
+        self.assertEqual(
+            [r.action for r in journal],
+            [
+                NotifyCollectionChangedAction.RESET,
+                NotifyCollectionChangedAction.ADD,
+                NotifyCollectionChangedAction.REPLACE,
+            ],
+        )
+        replica = [1, 2, 3]
+        journal.replay(replica)
+        self.assertEqual(replica, [2])
+
+    def test_compact_set(self):
+        collection = ObservableSet()
+        journal = ChangeJournal(collection)
+        for value in range(10):
+            collection.add(value)
+            collection.discard(value - 1)
+        journal.compact()
+        self.assertEqual(len(journal), 3)
+        replica = set(range(5))
+        journal.replay(replica, journal.first_sequence)
+        self.assertEqual(replica, collection)
+
+    def test_close(self):
+        collection = ObservableList()
+        journal = ChangeJournal(collection)
+        journal.close()
+        collection.append(1)
+        self.assertFalse(collection.collection_changed)
+        self.assertEqual(len(journal), 1)
@@ -0,0 +1,115 @@
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    from object_model import ObservableArray
+
+from object_model import ChangeEventCodec, ChangeJournal
+from object_model.abc import NotifyCollectionChangedAction
+from object_model.notify_collection_changed import sequence_splice
+
+
+@skipIf(np is None, "numpy is not installed")
+class TestObservableArray(TestCase):
+    def setUp(self):
+        self.collection = ObservableArray(np.arange(10, dtype=float))
+        self.events = []
+        self.collection.collection_changed += lambda sender, e: self.events.append(e)
+
+    def test_slice_assignment(self):
+        self.collection[2:5] = 0
+        self.assertEqual(len(self.events), 1)
+        e = self.events[0]
+        self.assertEqual(e.action, NotifyCollectionChangedAction.REPLACE)
+        self.assertEqual((e.new_starting_index, e.new_count), (2, 3))
+        self.assertEqual(e.key, slice(2, 5))
+        self.assertEqual(e.old_items.tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(e.new_items.tolist(), [0.0, 0.0, 0.0])
+        self.assertTrue(np.shares_memory(e.new_items, self.collection.array))
+        self.assertFalse(e.new_items.flags.writeable)
+
+    def test_masked_assignment(self):
+        mask = self.collection.array > 6
+        self.collection[mask] = -1
+        e = self.events[0]
+        self.assertIs(e.key, mask)
+        self.assertIsNone(e.new_starting_index)
+        self.assertEqual(e.new_count, 3)
+        self.assertEqual(e.old_items.tolist(), [7.0, 8.0, 9.0])
+        self.assertEqual(self.collection.tolist()[6:], [6.0, -1.0, -1.0, -1.0])
+
+    def test_apply(self):
+        self.collection.apply(np.add, 10, key=slice(0, 3))
+        self.collection += 1
+        self.collection.apply(np.multiply, 2, key=[0, 9])
+        self.collection.apply(np.subtract, 1, key=4)
+        self.assertEqual(len(self.events), 4)
+        self.assertEqual(self.events[0].old_items.tolist(), [0.0, 1.0, 2.0])
+        self.assertEqual(self.events[1].new_count, 10)
+        self.assertEqual(self.events[3].new_starting_index, 4)
+        self.assertEqual(
+            self.collection.tolist(),
+            [22.0, 12.0, 13.0, 4.0, 4.0, 6.0, 7.0, 8.0, 9.0, 20.0],
+        )
+
+    def test_element_assignment(self):
+        self.collection[4] = 40
+        self.collection.apply(np.add, 1, key=-1)
+        for e, (index, old_item, new_item) in zip(
+            self.events, [(4, 4.0, 40.0), (9, 9.0, 10.0)]
+        ):
+            self.assertIsNone(e.new_count)
+            self.assertIsNone(e.old_count)
+            self.assertEqual(sequence_splice(e), (index, [old_item], [new_item]))
+
+    def test_journal_and_codec(self):
+        journal = ChangeJournal(self.collection)
+        self.collection[4] = 40
+        self.collection[1:3] = [10, 20]
+        self.collection.apply(np.multiply, 2, key=slice(7, None))
+        self.collection.apply(np.subtract, 1, key=0)
+        replica = []
+        journal.replay(replica)
+        self.assertEqual(replica, self.collection.tolist())
+        codec = ChangeEventCodec()
+        decoded = list(codec.decode_many(codec.encode_many(self.events)))
+        self.assertEqual(
+            [sequence_splice(e) for e in decoded],
+            [
+                (4, [4.0], [40.0]),
+                (1, [1.0, 2.0], [10.0, 20.0]),
+                (7, [7.0, 8.0, 9.0], [14.0, 16.0, 18.0]),
+                (0, [0.0], [-1.0]),
+            ],
+        )
+
+    def test_fill(self):
+        self.collection.fill(7)
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(self.events[0].new_count, 10)
+        self.assertTrue(np.all(self.collection.array == 7))
+
+    def test_read_only_views(self):
+        with self.assertRaises(ValueError):
+            self.collection[:3][0] = 1
+        with self.assertRaises(ValueError):
+            np.asarray(self.collection)[0] = 1
+        self.assertEqual(self.events, [])
+
+    def test_unobserved(self):
+        collection = ObservableArray(np.zeros(4))
+        collection[1:3] = 1
+        collection += 1
+        collection.fill(3)
+        self.assertEqual(collection.tolist(), [3.0] * 4)
+
+    def test_batch(self):
+        with self.collection.batch():
+            self.collection[0] = 1
+            self.collection[1] = 2
+        self.assertEqual(
+            [e.action for e in self.events], [NotifyCollectionChangedAction.RESET]
+        )
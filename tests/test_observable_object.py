@@ -0,0 +1,99 @@
+import copy
+import pickle
+from typing import ClassVar
+from unittest import TestCase
+
+from object_model import Event, ObservableObject, ObservableList
+
+
+class Entity(ObservableObject):
+    kind: ClassVar[str] = "entity"
+    id: int
+    name: str = ""
+
+
+class Order(Entity):
+    __slots__ = ["_cache"]
+
+    lines: ObservableList
+    total: float = 0.0
+
+
+class TestObservableObject(TestCase):
+    def setUp(self):
+        self.changes = []
+
+    def record(self, sender, e):
+        self.changes.append((sender, e.name, e.old_value, e.new_value))
+
+    def test_slots(self):
+        order = Order(id=1, lines=ObservableList())
+        self.assertFalse(hasattr(order, "__dict__"))
+        self.assertEqual(Order.__observable_fields__, ("id", "name", "lines", "total"))
+        self.assertEqual(Entity.kind, "entity")
+        self.assertEqual((order.id, order.name, order.total), (1, "", 0.0))
+        with self.assertRaises(AttributeError):
+            order.unknown = 1
+        with self.assertRaises(TypeError):
+            Order(unknown=1)
+        with self.assertRaises(AttributeError):
+            Entity().id
+        order._cache = None
+
+    def test_property_changed(self):
+        entity = Entity(id=1)
+        entity.name = "a"
+        entity.property_changed += self.record
+        self.assertIsInstance(entity, Entity)
+        self.assertEqual(type(entity).__name__, "Entity")
+        entity.name = "b"
+        entity.id = 2
+        self.assertEqual(
+            self.changes, [(entity, "name", "a", "b"), (entity, "id", 1, 2)]
+        )
+        self.assertEqual(entity.name, "b")
+        entity.property_changed -= self.record
+        entity.name = "c"
+        self.assertEqual(len(self.changes), 2)
+        del entity.name
+        self.assertFalse(hasattr(entity, "name"))
+
+    def test_assigned_event(self):
+        entity = Entity(id=1)
+        entity.property_changed = Event()
+        entity.property_changed += self.record
+        entity.id = 2
+        self.assertEqual(self.changes, [(entity, "id", 1, 2)])
+        self.assertIs(pickle.loads(pickle.dumps(entity)).__class__, Entity)
+
+    def test_instances_are_independent(self):
+        first = Order(id=1)
+        second = Order(id=2)
+        first.property_changed += self.record
+        second.total = 5.0
+        first.total = 1.0
+        self.assertEqual(self.changes, [(first, "total", 0.0, 1.0)])
+        third = Order(id=3)
+        third.property_changed += self.record
+        self.assertIs(type(third), type(first))
+        self.assertIs(type(second), Order)
+
+    def test_mutable_default(self):
+        with self.assertRaises(ValueError):
+
+            class Invalid(ObservableObject):
+                items: list = []
+
+    def test_copy(self):
+        order = Order(id=1, name="a")
+        order.property_changed += self.record
+        for clone in (
+            copy.copy(order),
+            copy.deepcopy(order),
+            pickle.loads(pickle.dumps(order)),
+        ):
+            self.assertIs(type(clone), Order)
+            self.assertEqual((clone.id, clone.name), (1, "a"))
+            clone.name = "b"
+        self.assertEqual(self.changes, [])
+        self.assertEqual(repr(order), "Order(id=1, name='a', total=0.0)")
@@ -1,7 +1,11 @@
 import functools
+import operator
 from unittest import TestCase
 
 from object_model import (
+    NotifyCollectionChangedEventArgs,
+    NotifyDictChangedEventArgs,
+    NotifyListChangedEventArgs,
     ObservableList,
     ObservableSet,
     ObservableDict,
@@ -10,6 +14,28 @@ from object_model import (
 from object_model.abc import NotifyCollectionChangedAction
 
 
+class TestNotifyCollectionChangedEventArgs(TestCase):
+    def test_aliases(self):
+        self.assertIs(NotifyListChangedEventArgs, NotifyCollectionChangedEventArgs)
+        self.assertIs(NotifyDictChangedEventArgs, NotifyCollectionChangedEventArgs)
+
+    def test_lazy_items(self):
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return ["x"]
+
+        e = NotifyCollectionChangedEventArgs(
+            NotifyCollectionChangedAction.ADD, new_items_factory=factory
+        )
+        self.assertEqual(calls, [])
+        self.assertEqual(e.new_items, ["x"])
+        self.assertIs(e.new_items, e.new_items)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(e.old_items)
+
+
 class TestObservableList(TestCase):
     def on_collection_changed(self, action, sender, e):
         self.assertEqual(action, e.action)
@@ -77,6 +103,30 @@ class TestObservableList(TestCase):
         self.assertEqual(self.collection[-2], "b")
         self.assertEqual(len(self.collection), self.original_len)
 
+    def test_move_duplicates(self):
+        self.collection[2] = self.collection[0] = [1]
+        self.collection.collection_changed += self.on_move
+        self.collection.move(2, 0)
+        self.assertIs(self.collection[0], self.collection[1])
+        self.assertEqual(self.collection[2], "b")
+        self.collection.move(1, 5)
+        self.assertEqual(self.collection, [[1], "b", "d", "e", "f", [1], "g", "h"])
+        self.assertRaises(IndexError, self.collection.move, 0, 8)
+
+    def test_move_range(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        self.collection.move_range(1, 3, 4)
+        self.assertEqual(self.collection, list("aefgbcdh"))
+        self.collection.move_range(4, 3, 0)
+        self.assertEqual(self.collection, list("bcdaefgh"))
+        self.assertEqual(events[-1].action, NotifyCollectionChangedAction.MOVE)
+        self.assertEqual(events[-1].old_items, list("bcd"))
+        self.assertEqual(events[-1].old_starting_index, 4)
+        self.assertEqual(events[-1].new_starting_index, 0)
+        self.assertRaises(IndexError, self.collection.move_range, 6, 3, 0)
+        self.assertEqual(len(events), 2)
+
     def test_pop(self):
         self.collection.collection_changed += self.on_remove
         self.assertEqual(self.collection.pop(), "h")
@@ -102,6 +152,120 @@ class TestObservableList(TestCase):
         self.assertNotIn("a", self.collection)
         self.assertEqual(len(self.collection), self.original_len - 1)
 
+    def test_range_operations(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        self.collection.extend(item for item in "xy")
+        self.assertEqual(events[-1].new_items, ["x", "y"])
+        self.assertEqual(events[-1].new_starting_index, 8)
+        self.assertEqual(events[-1].new_count, 2)
+        self.collection.insert_range(-1, "uv")
+        self.assertEqual(self.collection[-4:], list("xuvy"))
+        self.assertEqual(events[-1].new_starting_index, 9)
+        self.collection.remove_range(8, 3)
+        self.assertEqual(events[-1].action, NotifyCollectionChangedAction.REMOVE)
+        self.assertEqual(events[-1].old_items, list("xuv"))
+        self.assertEqual(events[-1].old_count, 3)
+        self.assertRaises(IndexError, self.collection.remove_range, 8, 2)
+        self.collection += "z"
+        self.assertEqual(self.collection[-2:], list("yz"))
+        self.assertEqual(events[-1].new_items, ["z"])
+        self.assertEqual(len(events), 4)
+
+    def test_slice_operations(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        self.collection[1:3] = "xyz"
+        self.assertEqual(self.collection, list("axyzdefgh"))
+        self.assertEqual(events[-1].action, NotifyCollectionChangedAction.REPLACE)
+        self.assertEqual(events[-1].old_items, ["b", "c"])
+        self.assertEqual(events[-1].new_items, ["x", "y", "z"])
+        self.assertEqual(events[-1].new_starting_index, 1)
+        del self.collection[-3:]
+        self.assertEqual(events[-1].old_starting_index, 6)
+        self.assertEqual(events[-1].old_items, ["f", "g", "h"])
+        self.collection[3:1:-1] = "uv"
+        self.assertEqual(self.collection, list("axvude"))
+        self.assertEqual(events[-1].new_starting_index, 2)
+        self.assertEqual(events[-1].new_items, ["v", "u"])
+        del self.collection[::2]
+        self.assertEqual(self.collection, list("xue"))
+        self.assertEqual(events[-1].action, NotifyCollectionChangedAction.RESET)
+        self.collection *= 2
+        self.assertEqual(events[-1].new_items, list("xue"))
+        self.assertEqual(events[-1].new_starting_index, 3)
+        self.assertEqual(len(events), 5)
+
+    def test_slice_insert_and_delete(self):
+        added = []
+        removed = []
+        self.collection.collection_changed.add(
+            lambda sender, e: added.append(e),
+            actions={NotifyCollectionChangedAction.ADD},
+        )
+        self.collection.collection_changed.add(
+            lambda sender, e: removed.append(e),
+            actions={NotifyCollectionChangedAction.REMOVE},
+        )
+        self.collection[2:2] = "xy"
+        self.assertEqual(self.collection[:5], list("abxyc"))
+        self.assertEqual(len(added), 1)
+        self.assertEqual(added[0].new_starting_index, 2)
+        self.assertEqual(added[0].new_items, ["x", "y"])
+        self.assertEqual(added[0].new_count, 2)
+        self.assertIsNone(added[0].old_items)
+        self.collection[1:4] = []
+        self.assertEqual(self.collection[:3], list("acd"))
+        self.assertEqual(len(removed), 1)
+        self.assertEqual(removed[0].old_starting_index, 1)
+        self.assertEqual(removed[0].old_items, ["b", "x", "y"])
+        self.assertEqual(removed[0].old_count, 3)
+        self.assertIsNone(removed[0].new_items)
+        self.assertEqual(len(added), 1)
+
+    def test_sort_reverse(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        self.collection.sort(reverse=True)
+        self.collection.reverse()
+        self.assertEqual(self.collection, list("abcdefgh"))
+        self.assertEqual(
+            [e.action for e in events], [NotifyCollectionChangedAction.RESET] * 2
+        )
+
+    def test_unobserved(self):
+        events = []
+
+        def handler(sender, e):
+            events.append(e)
+
+        self.collection.collection_changed += handler
+        self.collection.collection_changed -= handler
+        self.assertFalse(self.collection.collection_changed)
+        self.collection.append("x")
+        self.collection[0] = "y"
+        self.collection.remove("b")
+        del self.collection[0]
+        self.assertEqual(self.collection, list("cdefghx"))
+        self.assertEqual(events, [])
+
+    def test_batch(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        with self.collection.batch():
+            for item in "xyz":
+                self.collection.append(item)
+            self.collection.insert(9, "w")
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[0].new_starting_index, 8)
+        self.assertEqual(events[0].new_items, list("xwyz"))
+        with self.collection.suspend_notifications():
+            self.collection.append("x")
+            self.collection.pop(0)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1].action, NotifyCollectionChangedAction.RESET)
+
 
 class TestObservableSet(TestCase):
     def on_collection_changed(self, action, sender, e):
@@ -175,6 +339,28 @@ class TestObservableSet(TestCase):
         self.assertIn("a", self.collection)
         self.assertNotIn("b", self.collection)
 
+    def test_update_iterables(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        self.collection.update((item for item in "axy"), "yz")
+        self.assertEqual(events[-1].new_items, set("xyz"))
+        self.assertIn("z", self.collection)
+        self.collection.difference_update("ab", (item for item in "xq"))
+        self.assertEqual(events[-1].old_items, set("abx"))
+        self.collection.intersection_update("cdey", "cdz")
+        self.assertEqual(events[-1].old_items, set("efghyz"))
+        self.assertEqual(self.collection, set("cd"))
+
+    def test_batch(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        with self.collection.batch():
+            self.collection.add("x")
+            self.collection.update("yz")
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[0].new_items, set("xyz"))
+
 
 class TestObservableDict(TestCase):
     def on_collection_changed(self, action, sender, e):
@@ -240,6 +426,73 @@ class TestObservableDict(TestCase):
         self.assertNotIn("a", self.collection)
         self.assertEqual(len(self.collection), self.original_len - 1)
 
+    def test_batch(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        with self.collection.batch():
+            for key in "xyz":
+                self.collection[key] = 0
+            self.collection["x"] = 1
+            self.collection.update(a=10, y=2)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[0].new_items, {"x": 1, "y": 2, "z": 0, "a": 10})
+        self.assertEqual(events[0].old_items, {"a": 1})
+        with self.collection.batch():
+            self.collection["x"] = 0
+            del self.collection["x"]
+        self.assertEqual(events[1].action, NotifyCollectionChangedAction.RESET)
+
+    def test_keys(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(
+            (sender, e)
+        )
+        self.collection["a"] = None
+        self.collection["a"] = 2
+        self.assertIs(events[-1][0], self.collection)
+        self.assertEqual(events[-1][1].action, NotifyCollectionChangedAction.REPLACE)
+        self.assertEqual(events[-1][1].key, "a")
+        self.assertIsNone(events[-1][1].old_items)
+        self.collection.pop("b")
+        self.assertEqual(events[-1][1].key, "b")
+        self.collection.update(c=30, x=1)
+        self.assertEqual(events[-1][1].old_items, {"c": 3})
+
+    def test_observe_key(self):
+        events = []
+
+        def handler(sender, e):
+            events.append((e.action, e.key, e.old_items, e.new_items))
+
+        self.collection.observe_key("a", handler)
+        self.collection.observe_key("x", handler)
+        self.collection["b"] = 20
+        self.collection["a"] = 10
+        self.collection.update(b=200, x=100)
+        del self.collection["a"]
+        self.collection.clear()
+        self.assertEqual(
+            events,
+            [
+                (NotifyCollectionChangedAction.REPLACE, "a", 1, 10),
+                (NotifyCollectionChangedAction.ADD, "x", None, 100),
+                (NotifyCollectionChangedAction.REMOVE, "a", 10, None),
+                (NotifyCollectionChangedAction.RESET, None, None, None),
+                (NotifyCollectionChangedAction.RESET, None, None, None),
+            ],
+        )
+        self.collection.unobserve_key("a", handler)
+        self.collection.unobserve_key("x", handler)
+        self.assertRaises(KeyError, self.collection.unobserve_key, "x", handler)
+        self.collection["a"] = 1
+        self.assertEqual(len(events), 5)
+        subscription = self.collection.observe_key("a", handler)
+        self.collection["a"] = 2
+        subscription.dispose()
+        self.collection["a"] = 3
+        self.assertEqual(len(events), 6)
+
 
 class TestObservableDeque(TestCase):
     def on_collection_changed(self, action, sender, e):
@@ -355,3 +608,91 @@ class TestObservableDeque(TestCase):
         del self.collection[0]
         self.assertNotIn("a", self.collection)
         self.assertEqual(len(self.collection), self.original_len - 1)
+
+    def test_batch(self):
+        events = []
+        self.collection.collection_changed += lambda sender, e: events.append(e)
+        with self.collection.batch():
+            self.collection.appendleft("x")
+            self.collection.appendleft("y")
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[0].new_starting_index, 0)
+        self.assertEqual(events[0].new_items, ["y", "x"])
+
+
+class TestComparer(TestCase):
+    def observe(self, collection):
+        events = []
+        collection.collection_changed += lambda sender, e: events.append(e)
+        return events
+
+    def test_list(self):
+        collection = ObservableList([1, 2, 3, 4, 5])
+        collection.comparer = operator.eq
+        events = self.observe(collection)
+        collection[0] = 1.0
+        self.assertEqual(events, [])
+        self.assertIs(type(collection[0]), int)
+        collection[1:4] = [2, 30, 4]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.REPLACE)
+        self.assertEqual(events[0].new_starting_index, 2)
+        self.assertEqual(events[0].old_items, [3])
+        self.assertEqual(events[0].new_items, [30])
+        collection[:] = [1, 2, 30, 4, 5]
+        self.assertEqual(len(events), 1)
+        collection[3:] = [4, 5, 6]
+        self.assertEqual(events[-1].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[-1].new_starting_index, 5)
+        self.assertEqual(events[-1].new_items, [6])
+        self.assertEqual(collection, [1, 2, 30, 4, 5, 6])
+
+    def test_identity(self):
+        value = [1]
+        collection = ObservableDeque([value])
+        collection.comparer = operator.is_
+        events = self.observe(collection)
+        collection[0] = value
+        self.assertEqual(events, [])
+        collection[0] = [1]
+        self.assertEqual(len(events), 1)
+
+    def test_dict(self):
+        collection = ObservableDict(a=1, b=2, c=3)
+        collection.comparer = lambda old, new: abs(old - new) < 0.5
+        events = self.observe(collection)
+        collection["a"] = 1.1
+        self.assertEqual(events, [])
+        self.assertEqual(collection["a"], 1)
+        collection.update(a=1, b=5, c=3.2, d=4)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].new_items, {"b": 5, "d": 4})
+        self.assertEqual(events[0].old_items, {"b": 2})
+        self.assertEqual(events[0].new_count, 2)
+        collection.update(a=1, b=5)
+        self.assertEqual(len(events), 1)
+
+    def test_unobserved(self):
+        # What is stored must not depend on whether anyone is subscribed.
+        collection = ObservableDict(a=1)
+        collection.comparer = operator.eq
+        collection["a"] = True
+        collection.update(a=1.0)
+        self.assertIs(type(collection["a"]), int)
+        for collection in (ObservableList([1]), ObservableDeque([1])):
+            collection.comparer = operator.eq
+            collection[0] = 1.0
+            self.assertIs(type(collection[0]), int)
+        collection = ObservableList([1, 2])
+        collection.comparer = operator.eq
+        collection[0:2] = [1.0, 3]
+        self.assertEqual([type(value) for value in collection], [int, int])
+
+    def test_set_empty_delta(self):
+        collection = ObservableSet("abc")
+        events = self.observe(collection)
+        collection.update("ab")
+        collection.difference_update("xy")
+        collection.intersection_update("abcd")
+        self.assertEqual(events, [])
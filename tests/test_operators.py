@@ -0,0 +1,251 @@
+import asyncio
+import random
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from object_model import (
+    AsyncioScheduler,
+    Event,
+    EventArgs,
+    ObservableDeque,
+    ObservableDict,
+    ObservableList,
+    ObservableSet,
+    ThreadingScheduler,
+    VirtualScheduler,
+    coalesce,
+    debounce,
+    throttle,
+)
+from object_model.abc import NotifyCollectionChangedAction
+from object_model.operators import _WindowedEvent
+
+
+class Args(EventArgs):
+    def __init__(self, value):
+        self.value = value
+
+
+def apply(items, e):
+    # Replays a range-form sequence event onto a plain list.
+    action = e.action
+    if action == NotifyCollectionChangedAction.ADD:
+        items[e.new_starting_index : e.new_starting_index] = e.new_items
+    elif action == NotifyCollectionChangedAction.REMOVE:
+        index = e.old_starting_index
+        assert items[index : index + e.old_count] == e.old_items
+        del items[index : index + e.old_count]
+    elif action == NotifyCollectionChangedAction.REPLACE:
+        index = e.old_starting_index
+        assert items[index : index + e.old_count] == e.old_items
+        items[index : index + e.old_count] = e.new_items
+    elif action == NotifyCollectionChangedAction.MOVE:
+        index = e.old_starting_index
+        del items[index : index + e.old_count]
+        items[e.new_starting_index : e.new_starting_index] = e.old_items
+
+
+class TestOperators(TestCase):
+    def setUp(self):
+        self.scheduler = VirtualScheduler()
+        self.event = Event()
+        self.values = []
+
+    def fire(self, *values):
+        for value in values:
+            self.event(self, Args(value))
+
+    def record(self, derived):
+        derived += lambda sender, e: self.values.append(e.value)
+        return derived
+
+    def test_throttle(self):
+        self.record(throttle(self.event, 0.05, scheduler=self.scheduler))
+        self.fire(1, 2, 3)
+        self.assertEqual(self.values, [1])
+        self.scheduler.advance(0.05)
+        self.assertEqual(self.values, [1, 3])
+        self.fire(4)
+        self.scheduler.advance(0.03)
+        self.fire(5)
+        self.assertEqual(self.values, [1, 3])
+        self.scheduler.advance(0.02)
+        self.assertEqual(self.values, [1, 3, 5])
+        self.scheduler.advance(0.05)
+        self.fire(6)
+        self.assertEqual(self.values, [1, 3, 5, 6])
+
+    def test_debounce(self):
+        self.record(debounce(self.event, 0.05, scheduler=self.scheduler))
+        self.fire(1)
+        self.scheduler.advance(0.04)
+        self.fire(2)
+        self.scheduler.advance(0.04)
+        self.assertEqual(self.values, [])
+        self.scheduler.advance(0.01)
+        self.assertEqual(self.values, [2])
+        self.scheduler.advance(1)
+        self.assertEqual(self.values, [2])
+
+    def test_flush_and_close(self):
+        derived = self.record(debounce(self.event, 0.05, scheduler=self.scheduler))
+        self.fire(1)
+        derived.flush()
+        self.assertEqual(self.values, [1])
+        self.fire(2)
+        derived.close()
+        self.fire(3)
+        self.scheduler.advance(1)
+        self.assertEqual(self.values, [1])
+        self.assertFalse(self.event)
+
+    def test_coalesce_list(self):
+        rng = random.Random(11)
+        collection = ObservableList(range(10))
+        mirror = list(collection)
+
+        def handler(sender, e):
+            if e.action == NotifyCollectionChangedAction.RESET:
+                mirror[:] = sender
+            else:
+                apply(mirror, e)
+
+        coalesce(collection.collection_changed, 0.05, scheduler=self.scheduler).add(
+            handler
+        )
+        for _ in range(500):
+            for _ in range(rng.randrange(1, 6)):
+                size = len(collection)
+                operation = rng.randrange(6)
+                if operation == 0 or not collection:
+                    collection.append(rng.randrange(100))
+                elif operation == 1:
+                    collection.insert(rng.randrange(-size, size + 1), rng.randrange(9))
+                elif operation == 2:
+                    collection.pop(rng.randrange(-size, size))
+                elif operation == 3:
+                    collection[rng.randrange(size)] = rng.randrange(100)
+                elif operation == 4:
+                    collection.move(rng.randrange(size), rng.randrange(size))
+                elif rng.random() < 0.05:
+                    collection.sort()
+            self.scheduler.advance(0.05)
+            self.assertEqual(mirror, collection)
+
+    def test_coalesce_merges(self):
+        collection = ObservableList("abc")
+        events = []
+        coalesce(collection.collection_changed, 0.05, scheduler=self.scheduler).add(
+            lambda sender, e: events.append(e)
+        )
+        collection.append("d")
+        collection.append("e")
+        collection.insert(3, "x")
+        collection.remove("x")
+        collection[4] = "E"
+        self.scheduler.advance(0.05)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(events[0].new_starting_index, 3)
+        self.assertEqual(events[0].new_items, ["d", "E"])
+        collection.append("f")
+        collection.pop()
+        self.scheduler.advance(0.05)
+        self.assertEqual(len(events), 1)
+
+    def test_coalesce_dict(self):
+        collection = ObservableDict(a=1, b=2, c=3)
+        events = []
+        coalesce(collection.collection_changed, 0.05, scheduler=self.scheduler).add(
+            lambda sender, e: events.append(e)
+        )
+        collection["a"] = 10
+        collection["a"] = 11
+        collection["x"] = 1
+        del collection["x"]
+        collection.update(b=20, y=5)
+        del collection["c"]
+        self.scheduler.advance(0.05)
+        self.assertEqual(
+            [(e.action, e.key) for e in events],
+            [
+                (NotifyCollectionChangedAction.REMOVE, "c"),
+                (NotifyCollectionChangedAction.ADD, None),
+            ],
+        )
+        self.assertEqual(events[1].new_items, {"a": 11, "b": 20, "y": 5})
+        self.assertEqual(events[1].old_items, {"a": 1, "b": 2})
+
+    def test_coalesce_set(self):
+        collection = ObservableSet("abc")
+        events = []
+        coalesce(collection.collection_changed, 0.05, scheduler=self.scheduler).add(
+            lambda sender, e: events.append(e)
+        )
+        collection.add("x")
+        collection.discard("x")
+        collection.discard("a")
+        collection.update("yz")
+        collection.add("a")
+        collection.discard("b")
+        self.scheduler.advance(0.05)
+        self.assertEqual(
+            [(e.action, e.old_items or e.new_items) for e in events],
+            [
+                (NotifyCollectionChangedAction.REMOVE, {"b"}),
+                (NotifyCollectionChangedAction.ADD, {"y", "z"}),
+            ],
+        )
+
+    def test_coalesce_reset(self):
+        collection = ObservableDeque("abc", maxlen=3)
+        events = []
+        coalesce(collection.collection_changed, 0.05, scheduler=self.scheduler).add(
+            lambda sender, e: events.append(e.action)
+        )
+        collection.append("d")
+        collection.appendleft("z")
+        self.scheduler.advance(0.05)
+        self.assertEqual(events, [NotifyCollectionChangedAction.RESET])
+
+    def test_incomplete_operator(self):
+        class Untaken(_WindowedEvent):
+            def _on_source_event(self, sender, e):
+                pass
+
+        with self.assertRaises(TypeError):
+            Untaken(self.event, 1, scheduler=self.scheduler)
+
+    def test_threading_scheduler(self):
+        done = threading.Event()
+        derived = debounce(self.event, 0.01, scheduler=ThreadingScheduler())
+        derived += lambda sender, e: (self.values.append(e.value), done.set())
+        self.fire(1, 2)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.values, [2])
+
+
+    def test_threading_debounce_reuses_timer(self):
+        threads = threading.active_count()
+        derived = debounce(self.event, 60, scheduler=ThreadingScheduler())
+        self.fire(*range(2000))
+        self.assertLessEqual(threading.active_count(), threads + 1)
+        derived.close()
+        for thread in threading.enumerate():
+            if isinstance(thread, threading.Timer):
+                thread.join(5)
+        self.assertEqual(threading.active_count(), threads)
+
+
+class TestAsyncioOperators(IsolatedAsyncioTestCase):
+    async def test_asyncio_scheduler(self):
+        event = Event()
+        values = []
+        derived = throttle(event, 0.01)
+        self.assertIsInstance(derived.scheduler, AsyncioScheduler)
+        derived += lambda sender, e: values.append(e.value)
+        for value in range(3):
+            event(self, Args(value))
+        self.assertEqual(values, [0])
+        await asyncio.sleep(0.05)
+        self.assertEqual(values, [0, 2])
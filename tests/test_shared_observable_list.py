@@ -0,0 +1,159 @@
+import os
+import pickle
+import random
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from object_model import SharedObservableList
+from object_model.abc import NotifyCollectionChangedAction
+
+
+def _write_and_sum(shared: SharedObservableList) -> float:
+    shared[0] = -1.0
+    return sum(shared.buffer)
+
+
+class TestSharedObservableList(TestCase):
+    def setUp(self):
+        self.collection = SharedObservableList("d", [0.0, 1.0, 2.0], capacity=1000)
+        self.addCleanup(self.collection.__exit__, None, None, None)
+        self.events = []
+        self.collection.collection_changed += lambda sender, e: self.events.append(e)
+
+    def test_matches_list(self):
+        rng = random.Random(2)
+        expected = self.collection.tolist()
+        for _ in range(1000):
+            operation = rng.randrange(9)
+            index = rng.randrange(-len(expected) - 1, len(expected) + 2)
+            value = float(rng.randrange(100))
+            for target in (expected, self.collection):
+                try:
+                    if operation == 0:
+                        target.append(value)
+                    elif operation == 1:
+                        target.insert(index, value)
+                    elif operation == 2:
+                        target.pop(index)
+                    elif operation == 3:
+                        target[index] = value
+                    elif operation == 4:
+                        target[index : index + 2] = [value] * (operation % 3)
+                    elif operation == 5:
+                        del target[index : index + 3]
+                    elif operation == 6:
+                        target.extend([value, value + 1])
+                    elif operation == 7:
+                        del target[::3]
+                    else:
+                        target.remove(value)
+                except (IndexError, ValueError) as error:
+                    result = type(error)
+                else:
+                    result = None
+                if target is expected:
+                    expected_result = result
+            self.assertEqual(result, expected_result)
+            self.assertEqual(self.collection, expected)
+        self.collection.sort(reverse=True)
+        expected.sort(reverse=True)
+        self.assertEqual(self.collection, expected)
+
+    def test_range_events(self):
+        self.collection.extend([3.0, 4.0])
+        self.collection.remove_range(0, 2)
+        self.collection[0:2] = [9.0]
+        self.collection.move_range(0, 1, 1)
+        self.collection[1:1] = [7.0]
+        self.collection[1:2] = []
+        self.assertEqual(
+            [(e.action, e.new_count, e.old_count) for e in self.events],
+            [
+                (NotifyCollectionChangedAction.ADD, 2, None),
+                (NotifyCollectionChangedAction.REMOVE, None, 2),
+                (NotifyCollectionChangedAction.REPLACE, 1, 2),
+                (NotifyCollectionChangedAction.MOVE, 1, 1),
+                (NotifyCollectionChangedAction.ADD, 1, None),
+                (NotifyCollectionChangedAction.REMOVE, None, 1),
+            ],
+        )
+        self.assertEqual(self.events[0].new_items, [3.0, 4.0])
+        self.assertEqual(self.events[1].old_items, [0.0, 1.0])
+        self.assertEqual(self.collection, [4.0, 9.0])
+
+    def test_move(self):
+        self.collection.extend([3.0, 4.0, 5.0])
+        self.collection.move(0, -1)
+        self.collection.move_range(3, 2, 0)
+        self.assertEqual(self.collection, [4.0, 5.0, 1.0, 2.0, 3.0, 0.0])
+        self.assertEqual(self.events[-2].old_items, 0.0)
+
+    def test_batch(self):
+        with self.collection.batch():
+            self.collection.append(3.0)
+            self.collection.insert_range(3, [2.5])
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(self.events[0].new_items, [2.5, 3.0])
+
+    def test_imul(self):
+        self.collection *= 3
+        self.assertEqual(self.collection, [0.0, 1.0, 2.0] * 3)
+        self.assertEqual(self.events[-1].action, NotifyCollectionChangedAction.ADD)
+        self.assertEqual(self.events[-1].new_starting_index, 3)
+        self.assertEqual(self.events[-1].new_count, 6)
+        self.collection *= 1
+        self.assertEqual(len(self.events), 1)
+        with self.assertRaises(BufferError):
+            self.collection *= 1000
+        self.assertEqual(len(self.collection), 9)
+        self.collection *= 0
+        self.assertEqual(self.collection, [])
+        self.assertEqual(self.events[-1].action, NotifyCollectionChangedAction.RESET)
+
+    def test_capacity(self):
+        with self.assertRaises(TypeError):
+            SharedObservableList("b")
+        with self.assertRaises(ValueError):
+            SharedObservableList("b", [1, 2], capacity=1)
+        collection = SharedObservableList("b", capacity=2)
+        self.addCleanup(collection.__exit__, None, None, None)
+        collection.extend([1, 2])
+        with self.assertRaises(BufferError):
+            collection.append(3)
+        with self.assertRaises(OverflowError):
+            collection[0] = 1000
+        self.assertEqual(collection, [1, 2])
+
+    def test_attach(self):
+        replica = pickle.loads(pickle.dumps(self.collection))
+        self.addCleanup(replica.close)
+        self.collection.append(3.0)
+        self.assertEqual(replica, [0.0, 1.0, 2.0, 3.0])
+        replica.pop(0)
+        self.assertEqual(self.collection, [1.0, 2.0, 3.0])
+        self.assertEqual(len(self.events), 1)
+
+    def test_attach_from_process(self):
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from object_model import SharedObservableList\n"
+                "SharedObservableList.attach(sys.argv[1], 'd').close()",
+                self.collection.name,
+            ],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            check=True,
+        )
+        replica = SharedObservableList.attach(self.collection.name, "d")
+        replica.close()
+        self.assertEqual(self.collection, [0.0, 1.0, 2.0])
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            total = executor.submit(_write_and_sum, self.collection).result()
+        self.assertEqual(total, 2.0)
+        self.assertEqual(self.collection[0], -1.0)
@@ -0,0 +1,105 @@
+import threading
+from unittest import TestCase
+
+from object_model import (
+    SynchronizedObservableDeque,
+    SynchronizedObservableDict,
+    SynchronizedObservableList,
+    SynchronizedObservableSet,
+)
+from object_model.abc import NotifyCollectionChangedAction
+
+THREADS = 8
+OPERATIONS = 500
+
+
+def run_threads(target):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestSynchronizedCollections(TestCase):
+    def setUp(self):
+        self.mismatches = []
+
+    def test_list(self):
+        collection = SynchronizedObservableList()
+
+        def handler(sender, e):
+            if len(sender) != e.new_starting_index + 1 or sender[-1] != e.new_items:
+                self.mismatches.append(e)
+
+        collection.collection_changed += handler
+        run_threads(
+            lambda n: [collection.append((n, i)) for i in range(OPERATIONS)]
+        )
+        self.assertEqual(len(collection), THREADS * OPERATIONS)
+        self.assertEqual(self.mismatches, [])
+
+    def test_deque(self):
+        collection = SynchronizedObservableDeque()
+
+        def handler(sender, e):
+            if sender[0] != e.new_items:
+                self.mismatches.append(e)
+
+        collection.collection_changed += handler
+        run_threads(
+            lambda n: [collection.appendleft((n, i)) for i in range(OPERATIONS)]
+        )
+        self.assertEqual(len(collection), THREADS * OPERATIONS)
+        self.assertEqual(self.mismatches, [])
+
+    def test_dict(self):
+        collection = SynchronizedObservableDict(counter=0)
+
+        def handler(sender, e):
+            if collection["counter"] != e.new_items:
+                self.mismatches.append(e)
+
+        def increment(n):
+            for _ in range(OPERATIONS):
+                with collection.lock:
+                    collection["counter"] += 1
+
+        collection.collection_changed += handler
+        run_threads(increment)
+        self.assertEqual(collection["counter"], THREADS * OPERATIONS)
+        self.assertEqual(self.mismatches, [])
+
+    def test_dict_observe_key(self):
+        collection = SynchronizedObservableDict(counter=0)
+        events = []
+
+        def observe(n):
+            collection.observe_key("counter", lambda sender, e: events.append(n))
+
+        with collection.lock:
+            thread = threading.Thread(target=observe, args=(0,))
+            thread.start()
+            thread.join(0.05)
+            self.assertTrue(thread.is_alive())
+        thread.join()
+        run_threads(observe)
+        collection["counter"] = 1
+        self.assertEqual(sorted(events), [0, *range(THREADS)])
+
+    def test_set_batch(self):
+        events = []
+        collection = SynchronizedObservableSet()
+        collection.collection_changed += lambda sender, e: events.append(e)
+
+        def add(n):
+            with collection.batch():
+                for i in range(OPERATIONS):
+                    collection.add((n, i))
+
+        run_threads(add)
+        self.assertEqual(len(collection), THREADS * OPERATIONS)
+        self.assertEqual(len(events), THREADS)
+        self.assertTrue(
+            all(e.action == NotifyCollectionChangedAction.ADD for e in events)
+        )
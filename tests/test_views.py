@@ -0,0 +1,153 @@
+import random
+from unittest import TestCase
+
+from object_model import ObservableDeque, ObservableList
+from object_model.abc import NotifyCollectionChangedAction
+from object_model.views import _View
+
+
+def mirror(view):
+    # Rebuilds a plain list from the view's own events, so the tests check
+    # that the events describe the view's changes exactly.
+    items = list(view)
+
+    def handler(sender, e):
+        action = e.action
+        if action == NotifyCollectionChangedAction.RESET:
+            items[:] = sender
+            return
+        new_items = [e.new_items] if e.new_count is None else e.new_items
+        old_items = [e.old_items] if e.old_count is None else e.old_items
+        if action == NotifyCollectionChangedAction.ADD:
+            index = e.new_starting_index
+            items[index:index] = new_items
+        elif action == NotifyCollectionChangedAction.REMOVE:
+            index = e.old_starting_index
+            assert items[index : index + len(old_items)] == old_items
+            del items[index : index + len(old_items)]
+        elif action == NotifyCollectionChangedAction.REPLACE:
+            index = e.old_starting_index
+            assert items[index : index + len(old_items)] == old_items
+            items[index : index + len(old_items)] = new_items
+        elif action == NotifyCollectionChangedAction.MOVE:
+            count = 1 if e.old_count is None else e.old_count
+            block = items[e.old_starting_index : e.old_starting_index + count]
+            del items[e.old_starting_index : e.old_starting_index + count]
+            items[e.new_starting_index : e.new_starting_index] = block
+
+    view.collection_changed += handler
+    return items
+
+
+def mutate(collection, rng):
+    operation = rng.randrange(10)
+    index = rng.randrange(-len(collection), len(collection) or 1)
+    value = rng.randrange(100)
+    if operation == 0 or not collection:
+        collection.append(value)
+    elif operation == 1:
+        collection.insert(index, value)
+    elif operation == 2:
+        del collection[index]
+    elif operation == 3:
+        collection[index] = value
+    elif operation == 4:
+        collection.remove(collection[index])
+    elif operation == 5:
+        collection.move(index, rng.randrange(len(collection)))
+    elif operation == 6:
+        collection.extend(rng.randrange(100) for _ in range(rng.randrange(4)))
+    elif operation == 7 and isinstance(collection, ObservableList):
+        start = rng.randrange(len(collection))
+        count = rng.randrange(len(collection) - start + 1)
+        collection.move_range(start, count, rng.randrange(len(collection) - count + 1))
+    elif operation == 8 and isinstance(collection, ObservableList):
+        collection[index : index + 3] = [value] * rng.randrange(4)
+    elif operation == 9 and rng.random() < 0.1:
+        collection.clear()
+
+
+class TestViews(TestCase):
+    def check(self, collection):
+        rng = random.Random(3)
+        even = collection.where(lambda x: x % 2 == 0)
+        squares = collection.select(lambda x: x * x)
+        ordered = collection.order_by()
+        descending = collection.order_by(lambda x: x // 10, reverse=True)
+        chained = even.select(str).order_by(len)
+        views = [even, squares, ordered, descending, chained]
+        mirrors = [mirror(view) for view in views]
+        for _ in range(2000):
+            mutate(collection, rng)
+            self.assertEqual(even, [x for x in collection if x % 2 == 0])
+            self.assertEqual(squares, [x * x for x in collection])
+            self.assertEqual(ordered, sorted(collection))
+            self.assertEqual(sorted(descending), sorted(collection))
+            self.assertEqual(
+                [x // 10 for x in descending],
+                sorted((x // 10 for x in collection), reverse=True),
+            )
+            self.assertEqual(
+                sorted(chained), sorted(str(x) for x in collection if x % 2 == 0)
+            )
+            self.assertEqual(
+                [len(x) for x in chained], sorted(len(x) for x in chained)
+            )
+            for view, items in zip(views, mirrors):
+                self.assertEqual(view, items)
+
+    def test_list(self):
+        self.check(ObservableList(range(20)))
+
+    def test_deque(self):
+        self.check(ObservableDeque(range(20)))
+
+    def test_sorted_single_update(self):
+        collection = ObservableList([5, 1, 3])
+        view = collection.order_by()
+        events = []
+        view.collection_changed += lambda sender, e: events.append(e)
+        collection[0] = 4
+        self.assertEqual(view, [1, 3, 4])
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].action, NotifyCollectionChangedAction.REPLACE)
+        self.assertEqual(events[0].new_starting_index, 2)
+        collection[0] = 0
+        self.assertEqual(view, [0, 1, 3])
+        self.assertEqual(
+            [
+                (e.action, e.new_starting_index, e.old_starting_index)
+                for e in events[1:]
+            ],
+            [
+                (NotifyCollectionChangedAction.REMOVE, None, 2),
+                (NotifyCollectionChangedAction.ADD, 0, None),
+            ],
+        )
+
+    def test_filtered_range_events(self):
+        collection = ObservableList(range(10))
+        view = collection.where(lambda x: x >= 5)
+        events = []
+        view.collection_changed += lambda sender, e: events.append(e)
+        collection.remove_range(0, 5)
+        self.assertEqual(events, [])
+        collection.extend([1, 6, 7])
+        self.assertEqual(events[0].new_items, [6, 7])
+        self.assertEqual(events[0].new_starting_index, 5)
+
+    def test_incomplete_view(self):
+        class ResetOnly(_View):
+            def _reset(self, items):
+                self._items = items
+
+        with self.assertRaises(TypeError):
+            ResetOnly(ObservableList())
+
+    def test_close(self):
+        collection = ObservableList([1, 2])
+        view = collection.select(str)
+        view.close()
+        collection.append(3)
+        self.assertEqual(view, ["1", "2"])
+        self.assertFalse(collection.collection_changed)